@@ -5,11 +5,35 @@ Módulo core - Contém componentes centrais compartilhados por todos os cenário
 from .game_state import State, GameState
 from .button import Button
 from .font_manager import FontManager
+from .overlay import Overlay, PulseOverlay, LineOverlay
+from .presenter import Presenter, DynamicResolution, SCALE_MODES, INTERNAL_RESOLUTIONS
 from .base_menu import BaseMenu
 from .score_manager import ScoreManager
-from .utils import load_json, load_image
+from .utils import load_json, load_image, find_spritesheets, find_sounds, find_images
+from .asset_manifest import AssetManifest
+from .surface_format import (
+    optimize_surface,
+    surface_format_report,
+    transparency_ratio,
+    apply_rle,
+)
+from .asset_loader import AssetLoader, AssetCache, SpriteLoader
+from .asset_preloader import AssetPreloader
+from .asset_warmup import AssetWarmup
+from .frame_variants import (
+    FrameVariantCache,
+    SCALE_STEP,
+    quantize,
+    flip_variant,
+    rotate_variant,
+    scale_variant,
+)
 from .entity import Entity
+from .batch_group import BatchGroup
 from .entity_factory import EntityFactory
+from .rng import SceneRandom, RNG_STREAMS, shared_random
+from .input_record import InputRecorder, InputReplay, PLAYER_ACTIONS
 from .collision_manager import CollisionManager
+from .motion_engine import MotionEngine, create_motion_engine, MOTION_ENGINES
 from .scroller_manager import ScrollerManager
 from .background_manager import BackgroundManager
@@ -0,0 +1,363 @@
+"""
+Baker de assets: converte as spritesheets (PNG + JSON) em atlas binários
+já escalados para o 'target_size' de cada JSON.
+
+Em tempo de execução os atlas são mapeados com mmap e as superfícies são
+criadas direto sobre o buffer (sem decodificar PNG nem redimensionar).
+Se o atlas não existir ou estiver desatualizado, os loaders continuam
+usando o caminho normal (PNG + JSON).
+
+Uso (a partir da raiz do projeto):
+    python -m tools.bake_assets
+"""
+
+import argparse
+import glob
+import io
+import mmap
+import os
+import struct
+import time
+import pygame as pg
+from .utils import load_json, find_spritesheets
+from .background_layer import BackgroundLayer
+from .surface_format import optimize_surface, apply_rle
+from .asset_manifest import AssetManifest
+
+BAKED_DIR = os.path.join("assets", "baked")
+SOURCE_DIR = os.path.join("assets", "images")
+
+MAGIC = b"FPAT"
+VERSION = 1
+KIND_ANIMATIONS = 0
+KIND_LAYERS = 1
+
+# Formato dos pixels no atlas: mesmo formato das superfícies convert_alpha()
+PIXEL_FORMAT = "BGRA"
+BYTES_PER_PIXEL = 4
+DATA_ALIGNMENT = 16
+
+# magic, versão, tipo, tamanho do índice, início dos pixels
+_PREAMBLE = struct.Struct("<4sHBxII")
+_SOURCE = struct.Struct("<ddii")
+_ENTRY = struct.Struct("<BffH")
+_FRAME = struct.Struct("<IHH")
+
+
+def baked_path_for(json_path: str, baked_dir: str = BAKED_DIR) -> str:
+    """
+    Retorna o caminho do atlas correspondente a um JSON de spritesheet.
+    Ex: assets/images/sky/player/player.json -> assets/baked/sky/player/player.atlas
+    """
+    relative = os.path.relpath(os.path.normpath(json_path), SOURCE_DIR)
+    if relative.startswith(".."):
+        relative = os.path.basename(json_path)
+    return os.path.join(baked_dir, os.path.splitext(relative)[0] + ".atlas")
+
+
+def _pack_str(buffer: io.BytesIO, text: str):
+    data = text.encode("utf-8")
+    buffer.write(struct.pack("<H", len(data)))
+    buffer.write(data)
+
+
+def _unpack_str(data, offset: int) -> tuple[str, int]:
+    (length,) = struct.unpack_from("<H", data, offset)
+    offset += 2
+    return bytes(data[offset : offset + length]).decode("utf-8"), offset + length
+
+
+def _align(value: int, alignment: int) -> int:
+    return (value + alignment - 1) // alignment * alignment
+
+
+# ---------------------------------------------------------------------------
+# Escrita (build)
+# ---------------------------------------------------------------------------
+
+
+def _cut_frame(sheet: pg.Surface, frame_rect, target_size) -> pg.Surface:
+    """Recorta (e escala) um frame em uma superfície RGBA de 32 bits."""
+    x, y, w, h = frame_rect
+    frame = pg.Surface((w, h), pg.SRCALPHA, 32)
+    frame.blit(sheet, (0, 0), (x, y, w, h))
+    if target_size and tuple(target_size) != (w, h):
+        frame = pg.transform.scale(frame, tuple(target_size))
+    return frame
+
+
+def bake_sheet(image_path: str, json_path: str, baked_dir: str = BAKED_DIR) -> str:
+    """
+    Gera o atlas binário de uma spritesheet.
+
+    Args:
+        image_path (str): Caminho da spritesheet (PNG).
+        json_path (str): Caminho do JSON com os frames.
+        baked_dir (str): Pasta de saída dos atlas.
+
+    Returns:
+        str: Caminho do atlas gerado.
+    """
+    sheet = pg.image.load(image_path)
+    data = load_json(json_path)
+    if not data:
+        raise ValueError(f"JSON vazio ou inválido: {json_path}")
+
+    target_size = data.get("target_size")
+
+    # Cada entrada: (nome, loop, speed, parallax, [frames])
+    if "layers" in data:
+        kind = KIND_LAYERS
+        entries = [
+            (
+                layer_def.get("name", str(i)),
+                True,
+                0.0,
+                layer_def.get("parallax_scale", 1.0),
+                [_cut_frame(sheet, layer_def["frame_rect"], target_size)],
+            )
+            for i, layer_def in enumerate(data["layers"])
+        ]
+    else:
+        kind = KIND_ANIMATIONS
+        entries = [
+            (
+                anim_data["name"],
+                anim_data.get("loop", True),
+                anim_data.get("speed", 0.1),
+                1.0,
+                [_cut_frame(sheet, rect, target_size) for rect in anim_data["frames_rect"]],
+            )
+            for anim_data in data.get("animations", [])
+        ]
+
+    # Índice + pixels
+    index = io.BytesIO()
+    _pack_str(index, os.path.normpath(image_path))
+    _pack_str(index, os.path.normpath(json_path))
+    target_w, target_h = target_size if target_size else (-1, -1)
+    index.write(
+        _SOURCE.pack(
+            os.path.getmtime(image_path), os.path.getmtime(json_path), target_w, target_h
+        )
+    )
+    index.write(struct.pack("<H", len(entries)))
+
+    pixels = io.BytesIO()
+    for name, loop, speed, parallax, frames in entries:
+        _pack_str(index, name)
+        index.write(_ENTRY.pack(bool(loop), speed, parallax, len(frames)))
+        for frame in frames:
+            w, h = frame.get_size()
+            index.write(_FRAME.pack(pixels.tell(), w, h))
+            pixels.write(pg.image.tostring(frame, PIXEL_FORMAT))
+
+    index_bytes = index.getvalue()
+    data_offset = _align(_PREAMBLE.size + len(index_bytes), DATA_ALIGNMENT)
+
+    out_path = baked_path_for(json_path, baked_dir)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, VERSION, kind, len(index_bytes), data_offset))
+        file.write(index_bytes)
+        file.write(b"\0" * (data_offset - _PREAMBLE.size - len(index_bytes)))
+        file.write(pixels.getvalue())
+
+    return out_path
+
+
+def find_config_spritesheets(config_dir: str = "config") -> list[tuple[str, str]]:
+    """
+    Lista os pares (imagem, json) referenciados pelos arquivos config/*.json.
+    """
+    configs = [
+        load_json(config_path)
+        for config_path in sorted(glob.glob(os.path.join(config_dir, "*.json")))
+    ]
+    return find_spritesheets(configs)
+
+
+def bake_all(config_dir: str = "config", baked_dir: str = BAKED_DIR) -> list[str]:
+    """Gera os atlas de todas as spritesheets referenciadas pelas configs."""
+    baked = []
+    for image_path, json_path in find_config_spritesheets(config_dir):
+        if not (os.path.exists(image_path) and os.path.exists(json_path)):
+            print(f"[AssetBaker] Ignorado (arquivo ausente): {image_path}, {json_path}")
+            continue
+        try:
+            start = time.perf_counter()
+            out_path = bake_sheet(image_path, json_path, baked_dir)
+            elapsed = (time.perf_counter() - start) * 1000
+            size_kb = os.path.getsize(out_path) / 1024
+            print(f"[AssetBaker] {out_path} ({size_kb:.0f} KB, {elapsed:.0f} ms)")
+            baked.append(out_path)
+        except Exception as e:
+            print(f"[AssetBaker] Erro ao processar ({image_path}, {json_path}): {e}")
+    return baked
+
+
+# ---------------------------------------------------------------------------
+# Leitura (runtime)
+# ---------------------------------------------------------------------------
+
+
+class BakedAtlas:
+    """
+    Atlas binário mapeado em memória. As superfícies criadas a partir dele
+    apontam direto para o buffer do mmap (sem cópia) e mantêm o mmap vivo.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            # ACCESS_COPY: páginas privadas, escrever em um frame não altera o arquivo
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, self.kind, index_size, self._data_offset = (
+            _PREAMBLE.unpack_from(self._mmap, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Atlas inválido ou de outra versão: {path}")
+
+        offset = _PREAMBLE.size
+        self.image_path, offset = _unpack_str(self._mmap, offset)
+        self.json_path, offset = _unpack_str(self._mmap, offset)
+        self.image_mtime, self.json_mtime, target_w, target_h = _SOURCE.unpack_from(
+            self._mmap, offset
+        )
+        offset += _SOURCE.size
+        self.target_size = (target_w, target_h) if target_w >= 0 else None
+
+        (entry_count,) = struct.unpack_from("<H", self._mmap, offset)
+        offset += 2
+
+        self.entries = []
+        for _ in range(entry_count):
+            name, offset = _unpack_str(self._mmap, offset)
+            loop, speed, parallax, frame_count = _ENTRY.unpack_from(self._mmap, offset)
+            offset += _ENTRY.size
+            frames = []
+            for _ in range(frame_count):
+                frames.append(_FRAME.unpack_from(self._mmap, offset))
+                offset += _FRAME.size
+            self.entries.append(
+                {
+                    "name": name,
+                    "loop": bool(loop),
+                    "speed": speed,
+                    "parallax_scale": parallax,
+                    "frames": frames,
+                }
+            )
+
+    def is_current(self, image_path: str, json_path: str) -> bool:
+        """Verifica se o atlas corresponde aos arquivos fonte e não está velho."""
+        if (os.path.normpath(image_path), os.path.normpath(json_path)) != (
+            self.image_path,
+            self.json_path,
+        ):
+            return False
+        try:
+            return (
+                os.path.getmtime(image_path) <= self.image_mtime
+                and os.path.getmtime(json_path) <= self.json_mtime
+            )
+        except OSError:
+            # Fonte ausente: o atlas é a única cópia disponível
+            return True
+
+    def surface(self, frame: tuple) -> pg.Surface:
+        """Cria a superfície de um frame direto sobre o buffer do atlas."""
+        offset, w, h = frame
+        start = self._data_offset + offset
+        view = memoryview(self._mmap)[start : start + w * h * BYTES_PER_PIXEL]
+        surface = pg.image.frombuffer(view, (w, h), PIXEL_FORMAT)
+
+        # Só converte se o formato da tela for diferente do formato do atlas
+        display = pg.display.get_surface()
+        if display and surface.get_masks()[:3] != display.get_masks()[:3]:
+            surface = surface.convert_alpha()
+        return surface
+
+
+def open_baked(image_path: str, json_path: str, baked_dir: str = BAKED_DIR):
+    """
+    Abre o atlas de uma spritesheet, se existir e estiver atualizado.
+
+    Returns:
+        BakedAtlas | None: O atlas, ou None para usar o caminho PNG + JSON.
+    """
+    path = baked_path_for(json_path, baked_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        atlas = BakedAtlas(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"[AssetBaker] Atlas ignorado ({path}): {e}")
+        return None
+    return atlas if atlas.is_current(image_path, json_path) else None
+
+
+def has_baked(image_path: str, json_path: str, baked_dir: str = BAKED_DIR) -> bool:
+    """Indica se a spritesheet tem atlas atualizado (o PNG não precisa ser lido)."""
+    return open_baked(image_path, json_path, baked_dir) is not None
+
+
+def load_baked_animations(image_path: str, json_path: str, target_size=None):
+    """
+    Carrega as animações a partir do atlas (mesmo formato do
+    EntityAnimationLoader.load). Retorna None se não houver atlas válido.
+    """
+    atlas = open_baked(image_path, json_path)
+    if atlas is None or atlas.kind != KIND_ANIMATIONS:
+        return None
+    if target_size is not None and tuple(target_size) != atlas.target_size:
+        return None
+
+    data = AssetManifest().get(json_path) or load_json(json_path)
+
+    animations = {}
+    for entry in atlas.entries:
+        sprites = [
+            optimize_surface(atlas.surface(frame), image_path) for frame in entry["frames"]
+        ]
+        animations[entry["name"]] = {
+            "frames": sprites,
+            "masks": [pg.mask.from_surface(sprite) for sprite in sprites],
+            "loop": entry["loop"],
+            "speed": entry["speed"],
+        }
+        apply_rle(sprites, data.get("rle"))
+    return animations
+
+
+def load_baked_layers(image_path: str, json_path: str):
+    """
+    Carrega as camadas de background a partir do atlas.
+    Retorna None se não houver atlas válido.
+    """
+    atlas = open_baked(image_path, json_path)
+    if atlas is None or atlas.kind != KIND_LAYERS:
+        return None
+
+    return [
+        BackgroundLayer(atlas.surface(entry["frames"][0]), entry["parallax_scale"])
+        for entry in atlas.entries
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera os atlas binários dos assets.")
+    parser.add_argument("--config-dir", default="config")
+    parser.add_argument("--out", default=BAKED_DIR)
+    args = parser.parse_args()
+
+    pg.init()
+    start = time.perf_counter()
+    baked = bake_all(args.config_dir, args.out)
+    elapsed = time.perf_counter() - start
+    print(f"[AssetBaker] {len(baked)} atlas gerados em {elapsed:.2f}s")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
 import pygame as pg
 from .utils import load_json, load_image
-from .background_layer import BackgroundLayer
+from .background_layer import BackgroundLayer, flatten_layers
+from .asset_baker import load_baked_animations, load_baked_layers
+from .asset_manifest import AssetManifest
+from .surface_format import optimize_surface, apply_rle
 
 
 class AssetLoader:
@@ -8,16 +14,49 @@ class AssetLoader:
     Classe base para carregar assets de uma spritesheet com um JSON associado.
     Lida com o carregamento dos arquivos, deixando a interpretação dos dados
     para as classes filhas.
+
+    Os frames podem ser recortados de duas formas:
+    - "view": subsuperfície que aponta para os pixels da própria spritesheet
+      (nenhuma cópia, os pixels existem uma única vez na memória);
+    - "copy": nova superfície com uma cópia dos pixels do frame.
+    No modo "auto" (padrão), usa view sempre que o frame não precisa ser
+    redimensionado e está inteiro dentro da spritesheet.
     """
 
-    def __init__(self, image_path: str, json_path: str):
+    FRAME_MODES = ("auto", "view", "copy")
+
+    # Relatório por spritesheet: caminho -> {"views", "copies", "bytes_saved"}
+    _view_report = {}
+
+    def __init__(self, image_path: str, json_path: str, frame_mode: str = "auto"):
         """
-        Tenta carregar a imagem e o arquivo JSON.
+        Tenta carregar a imagem e os dados do JSON.
+        Os dados vêm do manifesto único de assets; o JSON só é lido do disco
+        se a spritesheet não estiver no manifesto.
         Lança exceções específicas em caso de falha (ex: FileNotFoundError).
+
+        Args:
+            image_path (str): Caminho da spritesheet.
+            json_path (str): Caminho do JSON com os frames.
+            frame_mode (str): "auto", "view" ou "copy" (ver docstring da classe).
         """
+        if frame_mode not in self.FRAME_MODES:
+            raise ValueError(f"[AssetLoader] Modo de frame inválido: {frame_mode}")
+
+        self.image_path = image_path
+        self.frame_mode = frame_mode
+        self._stats = {"views": 0, "copies": 0, "bytes_saved": 0}
+        AssetLoader._view_report[image_path] = self._stats
+
         try:
-            self.sheet = load_image(image_path, convert_alpha=True)
-            self.data = load_json(json_path)
+            # Usa a spritesheet já decodificada pelo preloader, se houver
+            self.sheet = AssetCache().take_image(image_path, convert_alpha=True)
+            # Spritesheets sem transparência (ou só com transparência total)
+            # ficam no formato opaco da tela, com colorkey se preciso
+            self.sheet = optimize_surface(self.sheet, image_path)
+            self.data = AssetManifest().get(json_path)
+            if self.data is None:
+                self.data = load_json(json_path)
         except Exception as e:
             print(
                 f"[AssetLoader] Erro ao carregar arquivos base ({image_path}, {json_path}): {e}"
@@ -25,12 +64,65 @@ class AssetLoader:
             # Propaga a exceção para que o código que chamou o loader possa tratar o erro.
             raise e
 
-    def _get_frame(self, x: int, y: int, w: int, h: int) -> pg.Surface:
-        """Recorta um frame da spritesheet."""
-        frame = pg.Surface((w, h), pg.SRCALPHA)
-        frame.blit(self.sheet, (0, 0), (x, y, w, h))
+    def _get_frame(
+        self, x: int, y: int, w: int, h: int, target_size=None
+    ) -> pg.Surface:
+        """
+        Recorta um frame da spritesheet e o redimensiona, se necessário.
+
+        Args:
+            x, y, w, h (int): Retângulo do frame na spritesheet.
+            target_size (tuple[int, int] | None): Tamanho final do frame.
+
+        Returns:
+            pg.Surface: O frame (view ou cópia, conforme o modo).
+        """
+        rect = pg.Rect(x, y, w, h)
+        if target_size is not None and tuple(target_size) == rect.size:
+            target_size = None
+        inside_sheet = self.sheet.get_rect().contains(rect)
+
+        if target_size is not None:
+            # O redimensionamento já cria uma superfície nova; quando possível,
+            # escala direto da view para evitar a cópia intermediária
+            if inside_sheet and self.frame_mode != "copy":
+                source = self.sheet.subsurface(rect)
+            else:
+                source = self.__copy_frame(rect)
+            self._stats["copies"] += 1
+            return pg.transform.scale(source, target_size)
+
+        if self.frame_mode == "copy" or not inside_sheet:
+            if self.frame_mode == "view":
+                print(f"[AssetLoader] Frame {tuple(rect)} fora de {self.image_path}. Usando cópia.")
+            self._stats["copies"] += 1
+            return self.__copy_frame(rect)
+
+        self._stats["views"] += 1
+        self._stats["bytes_saved"] += w * h * self.sheet.get_bytesize()
+        return self.sheet.subsurface(rect)
+
+    def __copy_frame(self, rect: pg.Rect) -> pg.Surface:
+        """Copia os pixels do frame para uma nova superfície (mesmo formato da spritesheet)."""
+        if self.sheet.get_flags() & pg.SRCALPHA:
+            frame = pg.Surface(rect.size, pg.SRCALPHA)
+        else:
+            frame = pg.Surface(rect.size).convert()
+            colorkey = self.sheet.get_colorkey()
+            if colorkey is not None:
+                frame.fill(colorkey)
+                frame.set_colorkey(colorkey)
+        frame.blit(self.sheet, (0, 0), rect)
         return frame
 
+    @classmethod
+    def view_report(cls) -> dict:
+        """
+        Retorna, por spritesheet, quantos frames viraram views ou cópias
+        e quantos bytes as views economizaram.
+        """
+        return {path: dict(stats) for path, stats in cls._view_report.items()}
+
     def load(self):
         """
         Método abstrato que deve ser implementado pelas classes filhas.
@@ -43,39 +135,75 @@ class AssetLoader:
 class EntityAnimationLoader(AssetLoader):
     """
     Carrega todas as animações de uma entidade a partir da spritesheet e do JSON.
+
+    Se o JSON tiver "rle": true, os frames são codificados em RLE (blit
+    mais rápido para sprites com grandes áreas vazias); com "rle": "auto",
+    só os frames com transparência acima de RLE_AUTO_THRESHOLD; com
+    "rle": false, nenhum (ver apply_rle).
     """
 
-    def load(self) -> dict:
+    def load(self, target_size: tuple[int, int] | None = None) -> dict:
         """
         Carrega e retorna um dicionário de animações.
-        A configuração de 'target_size' é lida diretamente do arquivo JSON.
+        A configuração de 'target_size' é lida diretamente do arquivo JSON,
+        a menos que um tamanho seja informado explicitamente.
+
+        Args:
+            target_size (tuple[int, int] | None): Tamanho final dos frames.
+                                                  Se None, usa o valor do JSON.
 
         Returns:
-            dict: Dicionário com os frames de animação já escalados.
+            dict: Dicionário com os frames de animação já escalados e
+                  as máscaras de colisão de cada frame.
         """
         animations = {}
-        target_size = self.data.get("target_size")
+        if target_size is None:
+            target_size = self.data.get("target_size")
 
         for anim_data in self.data.get("animations", []):
             anim_name = anim_data["name"]
             sprites = []
 
             for frame_rect in anim_data["frames_rect"]:
-                sprite = self._get_frame(*frame_rect)
-
-                if target_size:
-                    sprite = pg.transform.scale(sprite, target_size)
-
-                sprites.append(sprite)
+                sprites.append(self._get_frame(*frame_rect, target_size))
 
             animations[anim_name] = {
                 "frames": sprites,
+                # Máscaras de colisão pré-calculadas, uma por frame (mesmo índice)
+                "masks": [pg.mask.from_surface(sprite) for sprite in sprites],
                 "loop": anim_data.get("loop", True),
                 "speed": anim_data.get("speed", 0.1),
             }
+            # Depois das máscaras: ler os pixels desfaria a codificação RLE
+            apply_rle(sprites, self.data.get("rle"))
         return animations
 
 
+class SpriteLoader(AssetLoader):
+    """
+    Carrega sprites estáticas (ex: botões dos menus): apenas o primeiro
+    frame de cada entrada do JSON, sem máscaras nem dados de animação.
+    """
+
+    def load(self) -> dict:
+        """
+        Carrega e retorna um dicionário nome -> sprite.
+        A configuração de 'target_size' é lida diretamente do arquivo JSON.
+
+        Returns:
+            dict: Dicionário com a primeira sprite de cada entrada (ou None).
+        """
+        sprites = {}
+        target_size = self.data.get("target_size")
+
+        for anim_data in self.data.get("animations", []):
+            frames_rect = anim_data["frames_rect"]
+            sprites[anim_data["name"]] = (
+                self._get_frame(*frames_rect[0], target_size) if frames_rect else None
+            )
+        return sprites
+
+
 class BackgroundLayerLoader(AssetLoader):
     """
     Carrega as camadas de background, criando uma lista de objetos BackgroundLayer.
@@ -97,12 +225,454 @@ class BackgroundLayerLoader(AssetLoader):
             # Lê a escala de paralaxe de dentro da definição da camada
             parallax_scale = layer_def.get("parallax_scale", 1.0)
 
-            layer_image = self._get_frame(*frame_rect)
-
-            if target_size:
-                layer_image = pg.transform.scale(layer_image, target_size)
+            layer_image = self._get_frame(*frame_rect, target_size)
 
             # Cria a instância de BackgroundLayer com a camada e escala
             bg_layer = BackgroundLayer(layer_image, parallax_scale=parallax_scale)
             layers.append(bg_layer)
         return layers
+
+
+def asset_bytes(value) -> int:
+    """
+    Estima quantos bytes de pixels e máscaras um valor do cache ocupa
+    (superfície, máscara ou dict/list/tuple com elas). Subsuperfícies
+    (views) contam a superfície-mãe uma única vez.
+    """
+    roots = {}
+    total = 0
+
+    def visit(node):
+        nonlocal total
+        if isinstance(node, pg.Surface):
+            root = node.get_abs_parent()
+            roots[id(root)] = root.get_pitch() * root.get_height()
+        elif isinstance(node, pg.mask.Mask):
+            # Cada linha da máscara ocupa palavras de 64 bits
+            w, h = node.get_size()
+            total += (w + 63) // 64 * 8 * h
+        elif isinstance(node, dict):
+            for item in node.values():
+                visit(item)
+        elif isinstance(node, (list, tuple)):
+            for item in node:
+                visit(item)
+
+    visit(value)
+    return total + sum(roots.values())
+
+
+class AssetCache:
+    """
+    Cache global (por processo) dos assets já carregados.
+
+    As animações são carregadas do disco uma única vez por chave
+    (imagem, json, target_size). Todas as instâncias de um mesmo tipo de
+    entidade passam a compartilhar os mesmos frames, então os frames
+    nunca devem ser modificados no lugar (use cópias ou transformações).
+    O mesmo vale para as imagens das camadas de background e os sons.
+
+    Falhas de carregamento também ficam registradas por (imagem, json):
+    depois da primeira falha, o disco não é mais acessado para aquela
+    spritesheet e as entidades usam direto o fallback compartilhado.
+
+    O tamanho (pixels + máscaras) de cada entrada de imagem é contabilizado.
+    Com um orçamento definido (set_budget), as entradas usadas há mais
+    tempo são descartadas até caber no orçamento, exceto as das cenas
+    fixadas (pin). Descartar só remove a referência do cache: a memória é
+    liberada quando nenhuma entidade usar mais aqueles frames.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AssetCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._animations = {}
+        # (imagem, json) -> lista de (imagem da camada, parallax_scale)
+        self._backgrounds = {}
+        # (imagem, json) -> sprites estáticas dos menus (SpriteLoader)
+        self._sprites = {}
+        # Imagens inteiras já convertidas: fundos dos menus e spritesheets
+        # entregues pelo preloader/warm-up, aguardando o loader
+        self._images = {}
+        self._sounds = {}
+        # (imagem, json) -> mensagem do erro da primeira tentativa
+        self._failed_loads = {}
+        # (tamanho, cor) -> (superfície, máscara) de fallback
+        self._fallbacks = {}
+
+        # Contabilidade de memória, em ordem de uso (mais antigo primeiro):
+        # (tipo, chave) -> {"bytes", "archetype", "scenes"}
+        self._usage = OrderedDict()
+        self._total_bytes = 0
+        self._budget = None
+        # Cena à qual são atribuídos os assets pedidos agora
+        self._scope = None
+        # Cenas cujos assets não podem ser descartados
+        self._pinned = set()
+        self._initialized = True
+
+    @staticmethod
+    def _make_key(image_path: str, json_path: str, target_size=None) -> tuple:
+        """Monta a chave do cache (listas do JSON viram tuplas)."""
+        if target_size is not None:
+            target_size = tuple(target_size)
+        return (image_path, json_path, target_size)
+
+    def __get_or_load(self, kind: str, key, image_path: str, json_path: str, load):
+        """
+        Busca a chave no cache do tipo 'kind'; se não existir, chama 'load'
+        uma única vez. Falhas ficam registradas e só são propagadas na
+        primeira tentativa.
+        """
+        cache = getattr(self, f"_{kind}")
+        value = cache.get(key)
+
+        if value is not None:
+            self.__touch(kind, key)
+        else:
+            # Falha já conhecida: não toca no disco nem repete o log
+            if (image_path, json_path) in self._failed_loads:
+                return None
+
+            try:
+                value = load()
+            except Exception as e:
+                # Registra a falha e propaga só desta vez para quem chamou
+                self._failed_loads[(image_path, json_path)] = str(e)
+                raise
+
+            cache[key] = value
+            self.__track(kind, key, value, json_path)
+
+        return value
+
+    # ------------------------------------------------------------------
+    # Orçamento de memória
+    # ------------------------------------------------------------------
+
+    def __track(self, kind: str, key, value, source_path: str):
+        """Registra o tamanho de uma nova entrada e aplica o orçamento."""
+        entry_bytes = asset_bytes(value)
+        archetype = self._archetype(source_path)
+        self._usage[(kind, key)] = {
+            "bytes": entry_bytes,
+            "archetype": archetype,
+            "scenes": {self._scope} if self._scope else set(),
+        }
+        self._total_bytes += entry_bytes
+        self.__enforce_budget()
+
+    @staticmethod
+    def _archetype(source_path: str) -> str:
+        """
+        Nome do arquétipo de um asset para a contabilidade: bioma + nome do
+        arquivo. Ex: assets/images/forest/enemies/cobra.json -> forest/cobra
+        """
+        parts = os.path.normpath(source_path).split(os.sep)
+        stem = os.path.splitext(parts[-1])[0]
+        if len(parts) > 3 and parts[:2] == ["assets", "images"]:
+            return f"{parts[2]}/{stem}"
+        return stem
+
+    def __touch(self, kind: str, key):
+        """Marca a entrada como usada agora (fim da fila do LRU)."""
+        entry = self._usage.get((kind, key))
+        if entry is not None:
+            self._usage.move_to_end((kind, key))
+            if self._scope:
+                entry["scenes"].add(self._scope)
+
+    def __untrack(self, kind: str, key):
+        entry = self._usage.pop((kind, key), None)
+        if entry is not None:
+            self._total_bytes -= entry["bytes"]
+
+    def __enforce_budget(self):
+        """Descarta as entradas menos usadas até caber no orçamento."""
+        if self._budget is None:
+            return
+
+        for kind, key in list(self._usage):
+            if self._total_bytes <= self._budget:
+                break
+            if self._usage[(kind, key)]["scenes"] & self._pinned:
+                continue
+            getattr(self, f"_{kind}").pop(key, None)
+            self.__untrack(kind, key)
+
+    def set_budget(self, budget_bytes: int | None):
+        """
+        Define o orçamento de memória das imagens em cache (None = sem limite).
+        """
+        self._budget = budget_bytes
+        self.__enforce_budget()
+
+    def set_scope(self, scene_key: str | None):
+        """
+        Define a cena à qual os assets pedidos a partir de agora são
+        atribuídos na contabilidade (ex: "forest", "menu").
+        """
+        self._scope = scene_key
+
+    @contextmanager
+    def scope(self, scene_key: str | None):
+        """Atribui à cena os assets pedidos dentro do bloco 'with'."""
+        previous = self._scope
+        self._scope = scene_key
+        try:
+            yield
+        finally:
+            self._scope = previous
+
+    def pin(self, scene_key: str):
+        """Impede que os assets da cena sejam descartados pelo orçamento."""
+        self._pinned.add(scene_key)
+
+    def unpin(self, scene_key: str):
+        """Libera os assets da cena para o descarte (LRU)."""
+        self._pinned.discard(scene_key)
+        self.__enforce_budget()
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes de pixels e máscaras atualmente em cache."""
+        return self._total_bytes
+
+    def memory_report(self) -> dict:
+        """
+        Resume o uso de memória do cache.
+
+        Returns:
+            dict: "total" e "budget" (bytes), "entries", "pinned" e os totais
+                  "by_scene" e "by_archetype" (bytes). Uma entrada usada
+                  por várias cenas conta no total de cada uma delas.
+        """
+        by_scene = {}
+        by_archetype = {}
+        for entry in self._usage.values():
+            for scene_key in entry["scenes"] or {None}:
+                by_scene[scene_key] = by_scene.get(scene_key, 0) + entry["bytes"]
+            archetype = entry["archetype"]
+            by_archetype[archetype] = by_archetype.get(archetype, 0) + entry["bytes"]
+
+        return {
+            "total": self._total_bytes,
+            "budget": self._budget,
+            "entries": len(self._usage),
+            "pinned": sorted(self._pinned),
+            "by_scene": by_scene,
+            "by_archetype": by_archetype,
+        }
+
+    def get_animations(
+        self, image_path: str, json_path: str, target_size=None
+    ) -> dict:
+        """
+        Retorna o dicionário de animações da spritesheet, carregando-o
+        apenas na primeira vez que a chave é pedida.
+
+        Args:
+            image_path (str): Caminho da spritesheet.
+            json_path (str): Caminho do JSON com os frames.
+            target_size (tuple[int, int] | None): Tamanho final dos frames.
+                                                  Se None, usa o valor do JSON.
+
+        Returns:
+            dict: Dicionário de animações compartilhado. Vazio se a
+                  spritesheet já falhou antes (use o fallback).
+
+        Raises:
+            Exception: Na primeira falha de carregamento da spritesheet.
+        """
+        key = self._make_key(image_path, json_path, target_size)
+
+        def load():
+            # Usa o atlas pré-processado (mmap) se existir; senão, PNG + JSON
+            animations = load_baked_animations(image_path, json_path, key[2])
+            if animations is None:
+                loader = EntityAnimationLoader(image_path, json_path)
+                animations = loader.load(key[2])
+            return animations
+
+        animations = self.__get_or_load(
+            "animations", key, image_path, json_path, load
+        )
+        return animations if animations is not None else {}
+
+    def get_background(self, image_path: str, json_path: str) -> list:
+        """
+        Retorna as imagens das camadas de background (já pré-compostas por
+        flatten_layers) e suas escalas de paralaxe. Cada BackgroundManager
+        cria suas próprias BackgroundLayer (com o próprio estado de
+        rolagem) a partir dessas imagens.
+
+        Returns:
+            list[tuple[pg.Surface, float]]: Lista de (imagem, parallax_scale).
+                                            Vazia se já falhou antes.
+
+        Raises:
+            Exception: Na primeira falha de carregamento da spritesheet.
+        """
+        def load():
+            layers = load_baked_layers(image_path, json_path)
+            if layers is None:
+                layers = BackgroundLayerLoader(image_path, json_path).load()
+            layer_images = flatten_layers(
+                [(layer.image, layer.parallax_scale) for layer in layers]
+            )
+            return [
+                (optimize_surface(image, image_path), parallax_scale)
+                for image, parallax_scale in layer_images
+            ]
+
+        layers = self.__get_or_load(
+            "backgrounds", (image_path, json_path), image_path, json_path, load
+        )
+        return layers if layers is not None else []
+
+    def is_loaded(self, image_path: str, json_path: str) -> bool:
+        """Indica se a spritesheet já está pronta (ou já falhou) no cache."""
+        if (image_path, json_path) in self._failed_loads:
+            return True
+        if (image_path, json_path) in self._backgrounds:
+            return True
+        if (image_path, json_path) in self._sprites:
+            return True
+        return any(key[:2] == (image_path, json_path) for key in self._animations)
+
+    def get_sprites(self, image_path: str, json_path: str) -> dict:
+        """
+        Retorna as sprites estáticas de uma spritesheet de menu
+        (o mesmo dicionário de SpriteLoader.load), carregadas uma única vez.
+        Vazio se a spritesheet já falhou antes.
+        """
+        def load():
+            return SpriteLoader(image_path, json_path).load()
+
+        sprites = self.__get_or_load(
+            "sprites", (image_path, json_path), image_path, json_path, load
+        )
+        return sprites if sprites is not None else {}
+
+    def get_image(self, image_path: str, convert_alpha: bool = True) -> pg.Surface:
+        """
+        Retorna uma imagem inteira (ex: fundo de menu), carregada uma única
+        vez e compartilhada. Não deve ser modificada no lugar.
+        """
+        image = self._images.get(image_path)
+        if image is None:
+            image = load_image(image_path, convert_alpha=convert_alpha)
+            if convert_alpha:
+                image = optimize_surface(image, image_path)
+            self.put_image(image_path, image)
+        else:
+            self.__touch("images", image_path)
+        return image
+
+    def put_image(self, image_path: str, image: pg.Surface):
+        """
+        Entrega uma imagem já decodificada e convertida (ex: pelo preloader),
+        usada no lugar da leitura do disco por get_image ou pelo próximo
+        loader dessa spritesheet.
+        """
+        self.__untrack("images", image_path)
+        self._images[image_path] = image
+        self.__track("images", image_path, image, image_path)
+
+    def take_image(self, image_path: str, convert_alpha: bool = True) -> pg.Surface:
+        """
+        Retorna a spritesheet entregue por put_image (removendo-a do cache)
+        ou, se não houver, carrega do disco.
+        """
+        image = self._images.pop(image_path, None)
+        if image is None:
+            image = load_image(image_path, convert_alpha=convert_alpha)
+        else:
+            self.__untrack("images", image_path)
+        return image
+
+    def has_image(self, image_path: str) -> bool:
+        """Indica se a imagem já está no cache."""
+        return image_path in self._images
+
+    def get_sound(self, sound_path: str) -> pg.mixer.Sound:
+        """
+        Retorna o som (carregado uma única vez e compartilhado).
+        Se o arquivo não puder ser carregado, usa um som mudo e registra a
+        falha para não tentar de novo.
+        """
+        sound = self._sounds.get(sound_path)
+
+        if sound is None:
+            try:
+                sound = pg.mixer.Sound(sound_path)
+            except (pg.error, FileNotFoundError) as e:
+                print(f"[AssetCache] Erro ao carregar som {sound_path}: {e}. Usando som mudo.")
+                sound = pg.mixer.Sound(buffer=bytes(4))
+            self._sounds[sound_path] = sound
+
+        return sound
+
+    def put_sound(self, sound_path: str, sound: pg.mixer.Sound):
+        """Registra um som já carregado (ex: pelo preloader)."""
+        self._sounds[sound_path] = sound
+
+    def has_sound(self, sound_path: str) -> bool:
+        """Indica se o som já está no cache."""
+        return sound_path in self._sounds
+
+    def has_failed(self, image_path: str, json_path: str) -> bool:
+        """Indica se a spritesheet já falhou ao carregar."""
+        return (image_path, json_path) in self._failed_loads
+
+    def get_fallback(
+        self, size: tuple[int, int], color: tuple[int, int, int]
+    ) -> tuple[pg.Surface, pg.Mask]:
+        """
+        Retorna a superfície sólida de fallback e sua máscara, criadas uma
+        única vez por (tamanho, cor) e compartilhadas entre as entidades.
+
+        Args:
+            size (tuple[int, int]): Tamanho da superfície.
+            color (tuple[int, int, int]): Cor de preenchimento.
+
+        Returns:
+            tuple[pg.Surface, pg.Mask]: Superfície de fallback e máscara.
+        """
+        key = (tuple(size), tuple(color))
+        fallback = self._fallbacks.get(key)
+
+        if fallback is None:
+            surface = pg.Surface(key[0], pg.SRCALPHA)
+            surface.fill(key[1])
+            fallback = (surface, pg.mask.from_surface(surface))
+            self._fallbacks[key] = fallback
+
+        return fallback
+
+    def unload_animations(self, image_path: str, json_path: str, target_size=None):
+        """Remove do cache as animações de uma spritesheet."""
+        key = self._make_key(image_path, json_path, target_size)
+        if key in self._animations:
+            del self._animations[key]
+            self.__untrack("animations", key)
+
+    def clear(self):
+        """Esvazia o cache inteiro, inclusive as falhas registradas."""
+        self._animations = {}
+        self._backgrounds = {}
+        self._sprites = {}
+        self._images = {}
+        self._sounds = {}
+        self._failed_loads = {}
+        self._fallbacks = {}
+        self._usage = OrderedDict()
+        self._total_bytes = 0
@@ -0,0 +1,127 @@
+import glob
+import json
+import os
+from .utils import load_json
+
+MANIFEST_PATH = os.path.join("assets", "manifest.json")
+SOURCE_PATTERN = os.path.join("assets", "images", "**", "*.json")
+
+
+def _normalize_entry(data: dict) -> dict | None:
+    """
+    Extrai de um JSON de spritesheet só o que os loaders usam, já com os
+    valores padrão preenchidos. Retorna None para JSONs que não são
+    spritesheets do jogo (ex: exportações brutas do Aseprite).
+    """
+    if "animations" in data:
+        return {
+            "target_size": data.get("target_size"),
+            "rle": data.get("rle"),
+            "animations": [
+                {
+                    "name": anim_data["name"],
+                    "frames_rect": anim_data["frames_rect"],
+                    "loop": anim_data.get("loop", True),
+                    "speed": anim_data.get("speed", 0.1),
+                }
+                for anim_data in data["animations"]
+            ],
+        }
+    elif "layers" in data:
+        return {
+            "target_size": data.get("target_size"),
+            "layers": [
+                {
+                    "name": layer_def.get("name", ""),
+                    "frame_rect": layer_def["frame_rect"],
+                    "parallax_scale": layer_def.get("parallax_scale", 1.0),
+                }
+                for layer_def in data["layers"]
+            ],
+        }
+    return None
+
+
+class AssetManifest:
+    """
+    Índice único com os dados de todas as spritesheets (frames, velocidade,
+    loop, target_size), gerado a partir dos JSONs em assets/images.
+
+    É carregado uma única vez e consultado pelo mesmo caminho de 'data'
+    usado nas configs das cenas. Se algum JSON fonte for mais novo que o
+    manifesto, ele é regerado automaticamente.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AssetManifest, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._entries = self.__load_or_build()
+        self._initialized = True
+
+    @staticmethod
+    def _key(json_path: str) -> str:
+        return os.path.normpath(json_path).replace(os.sep, "/")
+
+    def __load_or_build(self) -> dict:
+        """Lê o manifesto do disco ou o regera se estiver desatualizado."""
+        sources = glob.glob(SOURCE_PATTERN, recursive=True)
+
+        if os.path.exists(MANIFEST_PATH):
+            manifest_mtime = os.path.getmtime(MANIFEST_PATH)
+            if all(os.path.getmtime(path) <= manifest_mtime for path in sources):
+                entries = load_json(MANIFEST_PATH)
+                if entries:
+                    return entries
+
+        return self.build(sources)
+
+    def build(self, sources: list[str] | None = None) -> dict:
+        """
+        Gera o manifesto a partir dos JSONs fonte e o salva no disco.
+
+        Args:
+            sources (list[str] | None): JSONs a incluir. Se None, usa todos
+                                        os JSONs de assets/images.
+
+        Returns:
+            dict: Entradas do manifesto (caminho do JSON -> dados).
+        """
+        if sources is None:
+            sources = glob.glob(SOURCE_PATTERN, recursive=True)
+
+        entries = {}
+        for path in sorted(sources):
+            entry = _normalize_entry(load_json(path))
+            if entry is not None:
+                entries[self._key(path)] = entry
+
+        try:
+            with open(MANIFEST_PATH, mode="w", encoding="utf-8") as file:
+                json.dump(entries, file, separators=(",", ":"))
+        except OSError as e:
+            # Sem permissão de escrita: usa o índice só em memória
+            print(f"[AssetManifest] Erro ao salvar manifesto: {e}")
+
+        print(f"[AssetManifest] Manifesto gerado com {len(entries)} spritesheets")
+        return entries
+
+    def get(self, json_path: str) -> dict | None:
+        """
+        Retorna os dados da spritesheet, ou None se ela não estiver no índice.
+
+        Args:
+            json_path (str): Caminho do JSON (o mesmo das configs das cenas).
+        """
+        return self._entries.get(self._key(json_path))
+
+    def reload(self):
+        """Força a releitura (ou regeração) do manifesto."""
+        self._entries = self.__load_or_build()
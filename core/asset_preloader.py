@@ -0,0 +1,219 @@
+import queue
+import threading
+import pygame as pg
+from .asset_loader import AssetCache
+from .asset_baker import has_baked
+from .asset_manifest import AssetManifest
+from .surface_format import optimize_surface
+from .utils import load_json, find_spritesheets, find_sounds
+
+# Tipos de item aceitos por decode_asset/finalize_asset:
+#   "image"   -> caminho da imagem inteira (ex: fundo de menu)
+#   "sheet"   -> (imagem, json) de animações ou camadas de background
+#   "sprites" -> (imagem, json) de sprites estáticas de menu
+#   "sound"   -> caminho do som
+
+# Resultado de decode_asset para spritesheets com atlas atualizado: o
+# atlas é mapeado direto do disco, então o PNG não é decodificado
+BAKED = object()
+
+
+def decode_asset(kind: str, key):
+    """
+    Lê e decodifica um asset do disco, sem converter o formato.
+    Pode ser chamada fora da thread principal.
+    """
+    if kind == "sound":
+        return pg.mixer.Sound(key)
+    if kind == "sheet" and has_baked(*key):
+        return BAKED
+    image_path = key if kind == "image" else key[0]
+    return pg.image.load(image_path)
+
+
+def finalize_asset(kind: str, key, value):
+    """
+    Converte um asset decodificado por decode_asset e o guarda no
+    AssetCache. Deve ser chamada na thread principal. Se 'value' for None
+    (falha na decodificação), o cache tenta carregar e registra o erro.
+    """
+    cache = AssetCache()
+
+    if kind == "sound":
+        if value is not None:
+            cache.put_sound(key, value)
+        else:
+            cache.get_sound(key)
+        return
+
+    if kind == "image":
+        if value is not None:
+            cache.put_image(key, optimize_surface(value.convert_alpha(), key))
+        else:
+            cache.get_image(key)
+        return
+
+    image_path, json_path = key
+    # Com atlas (BAKED), os loaders leem o mmap e a imagem inteira não entra no cache
+    if value is not None and value is not BAKED:
+        cache.put_image(image_path, value.convert_alpha())
+
+    try:
+        if kind == "sprites":
+            cache.get_sprites(image_path, json_path)
+        elif _is_background(json_path):
+            cache.get_background(image_path, json_path)
+        else:
+            cache.get_animations(image_path, json_path)
+    except Exception as e:
+        print(f"[AssetCache] Erro ao preparar {image_path}: {e}")
+
+
+def _is_background(json_path: str) -> bool:
+    """Diferencia spritesheets de background (camadas) das de animação."""
+    data = AssetManifest().get(json_path)
+    if data is None:
+        data = load_json(json_path)
+    return "layers" in data
+
+
+class AssetPreloader:
+    """
+    Pré-carrega em segundo plano os assets de uma cena (spritesheets,
+    background e sons) antes de a cena ser criada.
+
+    Uma thread de trabalho faz a parte lenta (decodificar PNG e áudio).
+    A finalização (convert_alpha, recorte dos frames e inclusão no
+    AssetCache) acontece na thread principal, em poll(), alguns itens por
+    quadro. Ao pedir outra cena, o pré-carregamento anterior é cancelado.
+    """
+
+    def __init__(self, items_per_poll: int = 1):
+        """
+        Args:
+            items_per_poll (int): Quantos itens finalizar a cada poll().
+        """
+        self._items_per_poll = items_per_poll
+        self._results = queue.Queue()
+        self._generation = 0
+        self._scene_key = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def scene_key(self):
+        """Cena sendo pré-carregada (ou None)."""
+        return self._scene_key
+
+    @property
+    def is_done(self) -> bool:
+        """Indica se todos os assets da cena pedida já estão no cache."""
+        return self._scene_key is not None and self._pending == 0
+
+    def request(self, scene_key: str, config_path: str | None = None):
+        """
+        Começa a pré-carregar a cena, cancelando o pedido anterior.
+
+        Args:
+            scene_key (str): Nome da cena (ex: "forest").
+            config_path (str | None): JSON da cena. Padrão: config/<cena>.json.
+        """
+        if scene_key == self._scene_key:
+            return
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        self._scene_key = scene_key
+        self._pending = -1  # desconhecido até a thread enviar a contagem
+        config = load_json(config_path or f"config/{scene_key}.json")
+
+        # A lista sai daqui, na thread principal: o cache é alterado aqui
+        # (poll, cenas, warm-up) e não pode ser lido pela thread de trabalho
+        cache = AssetCache()
+        spritesheets = [
+            pair for pair in find_spritesheets(config) if not cache.is_loaded(*pair)
+        ]
+        sounds = [path for path in find_sounds(config) if not cache.has_sound(path)]
+
+        worker = threading.Thread(
+            target=self.__work, args=(generation, spritesheets, sounds), daemon=True
+        )
+        worker.start()
+
+    def cancel(self):
+        """Cancela o pré-carregamento em andamento."""
+        with self._lock:
+            self._generation += 1
+        self._scene_key = None
+        self._pending = 0
+
+    def __is_stale(self, generation: int) -> bool:
+        with self._lock:
+            return generation != self._generation
+
+    def __work(self, generation: int, spritesheets: list, sounds: list):
+        """Thread de trabalho: decodifica os arquivos e enfileira os resultados."""
+        try:
+            self.__decode_all(generation, spritesheets, sounds)
+        except Exception as e:
+            # Sem isso o pedido ficaria pendente para sempre. A contagem final
+            # chega depois dos itens já enfileirados (a fila é FIFO)
+            print(f"[AssetPreloader] Erro no pré-carregamento: {e}")
+            self._results.put((generation, "count", None, 0))
+
+    def __decode_all(self, generation: int, spritesheets: list, sounds: list):
+        self._results.put((generation, "count", None, len(spritesheets) + len(sounds)))
+
+        for image_path, json_path in spritesheets:
+            if self.__is_stale(generation):
+                return
+            try:
+                # Só decodifica; a conversão de formato exige a thread principal
+                image = decode_asset("sheet", (image_path, json_path))
+            except (pg.error, FileNotFoundError) as e:
+                image = None
+                print(f"[AssetPreloader] Erro ao pré-carregar {image_path}: {e}")
+            self._results.put((generation, "sheet", (image_path, json_path), image))
+
+        for sound_path in sounds:
+            if self.__is_stale(generation):
+                return
+            try:
+                sound = decode_asset("sound", sound_path)
+            except (pg.error, FileNotFoundError):
+                sound = None  # get_sound registra o erro e usa o som mudo
+            self._results.put((generation, "sound", sound_path, sound))
+
+    def poll(self, max_items: int | None = None):
+        """
+        Finaliza na thread principal os itens já decodificados.
+        Deve ser chamado a cada quadro pelo menu que pediu o pré-carregamento.
+
+        Args:
+            max_items (int | None): Limite de itens neste quadro.
+                                    Padrão: items_per_poll; -1 para todos.
+        """
+        if max_items is None:
+            max_items = self._items_per_poll
+
+        processed = 0
+        while max_items < 0 or processed < max_items:
+            try:
+                generation, kind, key, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            # Resultados de um pedido cancelado são descartados
+            if generation != self._generation:
+                continue
+
+            if kind == "count":
+                self._pending = value
+                continue
+
+            with AssetCache().scope(self._scene_key):
+                finalize_asset(kind, key, value)
+            self._pending -= 1
+            processed += 1
@@ -0,0 +1,152 @@
+import glob
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pygame as pg
+from .asset_loader import AssetCache
+from .asset_preloader import decode_asset, finalize_asset
+from .utils import load_json, find_spritesheets, find_sounds, find_images
+
+
+def _timed_decode(kind: str, key):
+    """Decodifica um item e mede o tempo gasto (roda nas threads do pool)."""
+    start = time.perf_counter()
+    try:
+        value = decode_asset(kind, key)
+    except (pg.error, FileNotFoundError):
+        value = None  # finalize_asset tenta pelo cache, que registra o erro
+    return value, time.perf_counter() - start
+
+
+class AssetWarmup:
+    """
+    Aquecimento dos assets na inicialização: lista todas as imagens e sons
+    referenciados por config/*.json e pelos ASSETS dos menus, decodifica
+    tudo em paralelo num pool de threads e guarda no AssetCache antes do
+    primeiro quadro.
+
+    A decodificação (PNG/áudio) roda nas threads; a conversão das
+    superfícies e o recorte dos frames acontecem na thread principal,
+    conforme cada item fica pronto.
+    """
+
+    def __init__(self, config_dir: str = "config", menu_assets=None, workers: int | None = None):
+        """
+        Args:
+            config_dir (str): Pasta com os JSONs das cenas.
+            menu_assets (list[dict] | None): ASSETS dos menus. Se None, usa menu.MENUS.
+            workers (int | None): Threads do pool. Se None, usa o número de CPUs.
+        """
+        self._config_dir = config_dir
+        self._menu_assets = menu_assets
+        self._workers = workers or os.cpu_count() or 1
+
+    def collect(self) -> list[tuple[str, str, object]]:
+        """
+        Lista os itens a aquecer como (cena, tipo, chave), com tipo e chave
+        no formato aceito por decode_asset/finalize_asset, ignorando o que
+        já está no cache. A cena é o nome do JSON de config (ou "menu").
+        """
+        configs = {
+            os.path.splitext(os.path.basename(config_path))[0]: load_json(config_path)
+            for config_path in sorted(glob.glob(os.path.join(self._config_dir, "*.json")))
+        }
+
+        menu_assets = self._menu_assets
+        if menu_assets is None:
+            # Importação tardia para evitar importação circular
+            from menu import MENUS
+
+            menu_assets = [menu_cls.ASSETS for menu_cls in MENUS]
+
+        cache = AssetCache()
+        items = []
+        for scene_key, config in configs.items():
+            items += [(scene_key, "sheet", pair) for pair in find_spritesheets(config)]
+        items += [("menu", "sprites", pair) for pair in find_spritesheets(menu_assets)]
+        items = [item for item in items if not cache.is_loaded(*item[2])]
+        items += [
+            ("menu", "image", path)
+            for path in find_images(menu_assets)
+            if not cache.has_image(path)
+        ]
+        for scene_key, config in [*configs.items(), ("menu", menu_assets)]:
+            items += [
+                (scene_key, "sound", path)
+                for path in find_sounds(config)
+                if not cache.has_sound(path)
+            ]
+
+        # Remove repetições (ex: o mesmo som em duas cenas)
+        unique = {}
+        for scene_key, kind, key in items:
+            unique.setdefault((kind, key), scene_key)
+        return [(scene_key, kind, key) for (kind, key), scene_key in unique.items()]
+
+    def run(self, progress=None, parallel: bool = True) -> dict:
+        """
+        Aquece o cache.
+
+        Args:
+            progress (callable | None): Chamado na thread principal após cada
+                item como progress(prontos, total, chave). Serve para
+                desenhar uma tela de carregamento.
+            parallel (bool): Se False, decodifica um item por vez na thread
+                principal (usado para comparação).
+
+        Returns:
+            dict: Tempos em ms: "collect", "decode" (soma do tempo de
+                  decodificação de cada item), "finalize" (tempo na thread
+                  principal) e "total" (tempo de parede), além de "items"
+                  e "workers".
+        """
+        start = time.perf_counter()
+        items = self.collect()
+        collect_time = time.perf_counter() - start
+
+        decode_time = 0.0
+        finalize_time = 0.0
+        done = 0
+
+        cache = AssetCache()
+
+        def finish(scene_key, kind, key, value):
+            nonlocal finalize_time, done
+            finalize_start = time.perf_counter()
+            with cache.scope(scene_key):
+                finalize_asset(kind, key, value)
+            finalize_time += time.perf_counter() - finalize_start
+            done += 1
+            if progress is not None:
+                progress(done, len(items), key)
+
+        if parallel and items:
+            with ThreadPoolExecutor(max_workers=self._workers) as pool:
+                futures = {
+                    pool.submit(_timed_decode, kind, key): (scene_key, kind, key)
+                    for scene_key, kind, key in items
+                }
+                for future in as_completed(futures):
+                    value, elapsed = future.result()
+                    decode_time += elapsed
+                    finish(*futures[future], value)
+        else:
+            for scene_key, kind, key in items:
+                value, elapsed = _timed_decode(kind, key)
+                decode_time += elapsed
+                finish(scene_key, kind, key, value)
+
+        timings = {
+            "items": len(items),
+            "workers": self._workers if parallel else 1,
+            "collect": collect_time * 1000,
+            "decode": decode_time * 1000,
+            "finalize": finalize_time * 1000,
+            "total": (time.perf_counter() - start) * 1000,
+        }
+        print(
+            f"[AssetWarmup] {timings['items']} itens em {timings['total']:.0f} ms "
+            f"({timings['workers']} threads; decodificação {timings['decode']:.0f} ms, "
+            f"finalização {timings['finalize']:.0f} ms)"
+        )
+        return timings
@@ -2,13 +2,73 @@ import pygame as pg
 from config import SCREEN_WIDTH
 
 
+def flatten_layers(layer_images: list) -> list:
+    """
+    Pré-compõe as camadas de um background: junta as camadas vizinhas com
+    o mesmo paralaxe e o mesmo tamanho (que sempre se movem juntas, ex:
+    camadas fixas com parallax_scale 0.0) em uma única imagem e descarta
+    camadas totalmente transparentes. O grupo do fundo vira uma superfície
+    opaca, que custa um blit sem mistura de alpha por quadro.
+
+    Args:
+        layer_images (list[tuple[pg.Surface, float]]): (imagem, parallax_scale),
+                                                       do fundo para a frente.
+
+    Returns:
+        list[tuple[pg.Surface, float]]: Camadas finais, na mesma ordem.
+    """
+    groups = []
+    for image, parallax_scale in layer_images:
+        # Camada sem nenhum pixel visível: não precisa ser desenhada
+        if image.get_bounding_rect().width == 0:
+            continue
+
+        last = groups[-1] if groups else None
+        if (
+            last is not None
+            and last[1] == parallax_scale
+            and last[0][0].get_size() == image.get_size()
+        ):
+            last[0].append(image)
+        else:
+            groups.append(([image], parallax_scale))
+
+    flattened = []
+    for i, (images, parallax_scale) in enumerate(groups):
+        if i == 0:
+            # Fundo: nada aparece atrás dele, então pode ser opaco
+            composite = pg.Surface(images[0].get_size()).convert()
+            composite.fill((0, 0, 0))
+        elif len(images) > 1:
+            composite = pg.Surface(images[0].get_size(), pg.SRCALPHA).convert_alpha()
+        else:
+            flattened.append((images[0], parallax_scale))
+            continue
+
+        for image in images:
+            composite.blit(image, (0, 0))
+        flattened.append((composite, parallax_scale))
+
+    return flattened
+
+
 class BackgroundLayer:
     """
     Representa uma única camada de background que pode rolar horizontalmente.
     A imagem é ladrilhável para criar um efeito de rolagem contínuo.
+
+    Modos de desenho:
+    - "strip" (padrão): usa a largura real da superfície de destino e uma
+      faixa com a imagem repetida (montada uma vez por largura de destino);
+      cada quadro custa no máximo dois blits recortados, cobrindo
+      exatamente os pixels visíveis;
+    - "tiles": desenha a imagem inteira lado a lado, quantas vezes forem
+      necessárias para cobrir SCREEN_WIDTH (comportamento antigo).
     """
 
-    def __init__(self, image: pg.Surface, parallax_scale: float = 1.0):
+    RENDER_MODES = ("strip", "tiles")
+
+    def __init__(self, image: pg.Surface, parallax_scale: float = 1.0, render_mode: str = "strip"):
         """
         Inicializa a camada do background.
 
@@ -16,11 +76,20 @@ class BackgroundLayer:
             image (pg.Surface): A imagem da camada, já dimensionada.
             parallax_scale (float): A escala de velocidade para o efeito paralaxe.
                                     Valores menores se movem mais devagar (mais distantes).
+            render_mode (str): "strip" ou "tiles".
         """
+        if render_mode not in self.RENDER_MODES:
+            raise ValueError(f"[BackgroundLayer] Modo de desenho inválido: {render_mode}")
+
         self.image = image
         self.parallax_scale = parallax_scale
+        self.render_mode = render_mode
         self.scroll_x = 0.0
         self._image_width = self.image.get_width()
+        self._image_height = self.image.get_height()
+        # Faixa repetida e a largura de destino para a qual foi montada
+        self._strip = None
+        self._strip_dest_width = None
 
     def update(self, global_scroll_x: float):
         """
@@ -35,6 +104,50 @@ class BackgroundLayer:
         """
         Desenha a camada na tela, repetindo-a para preencher o espaço.
         """
+        if self.render_mode == "strip":
+            self.__render_strip(screen)
+        else:
+            self.__render_tiles(screen)
+
+    def __build_strip(self, dest_width: int):
+        """
+        Monta a faixa com a imagem repetida até cobrir a largura de destino.
+        Se uma cópia já basta, a faixa é a própria imagem (sem cópia).
+        """
+        copies = -(-dest_width // self._image_width)
+        if copies <= 1:
+            self._strip = self.image
+        else:
+            flags = self.image.get_flags() & pg.SRCALPHA
+            strip = pg.Surface((self._image_width * copies, self._image_height), flags)
+            strip = strip.convert_alpha() if flags else strip.convert()
+            for i in range(copies):
+                strip.blit(self.image, (i * self._image_width, 0))
+            self._strip = strip
+        self._strip_dest_width = dest_width
+
+    def __render_strip(self, screen: pg.Surface):
+        """Desenha no máximo dois recortes da faixa, só a parte visível."""
+        dest_width = screen.get_width()
+        if dest_width != self._strip_dest_width:
+            self.__build_strip(dest_width)
+
+        strip_width = self._strip.get_width()
+        offset = int(self.scroll_x % strip_width)
+
+        # Do deslocamento até o fim da faixa...
+        first_width = min(strip_width - offset, dest_width)
+        screen.blit(self._strip, (0, 0), (offset, 0, first_width, self._image_height))
+
+        # ...e, se faltar, o começo da faixa em seguida
+        if first_width < dest_width:
+            screen.blit(
+                self._strip,
+                (first_width, 0),
+                (0, 0, dest_width - first_width, self._image_height),
+            )
+
+    def __render_tiles(self, screen: pg.Surface):
         # Calcula o deslocamento para a rolagem
         offset = self.scroll_x % self._image_width
 
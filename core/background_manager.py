@@ -1,10 +1,15 @@
 import pygame as pg
-from .asset_loader import BackgroundLayerLoader
+from .asset_loader import AssetCache
+from .background_layer import BackgroundLayer
 
 
 class BackgroundManager:
     """
     Gerencia e renderiza as camadas de background, com suporte a paralaxe.
+
+    As imagens recebidas do AssetCache já vêm pré-compostas (ver
+    flatten_layers): camadas vizinhas com o mesmo paralaxe viram uma só e
+    a camada do fundo é opaca.
     """
 
     def __init__(self, background_cfg: dict):
@@ -14,6 +19,8 @@ class BackgroundManager:
         Args:
             layers (list[BackgroundLayer]): Lista de camadas de background já carregadas.
             background_cfg (dict): Dicionário de configuração para fallbacks e parallax.
+                                   "render_mode" escolhe o modo de desenho das
+                                   camadas ("strip" ou "tiles", ver BackgroundLayer).
         """
         self._layers = []
         self._fallback_color: tuple[int, int, int]
@@ -27,15 +34,21 @@ class BackgroundManager:
     def _load_layers(self, config: dict):
         """
         Carrega as camadas do spritesheet definido na configuração.
+        As imagens vêm do cache global (atlas pré-processado ou PNG + JSON);
+        cada manager cria suas próprias camadas com o estado de rolagem.
         Em caso de falha, não faz nada, permitindo que o fallback seja usado.
         """
         spritesheet_cfg = config.get("spritesheet", {})
         if spritesheet_cfg:
             try:
-                loader = BackgroundLayerLoader(
+                layer_images = AssetCache().get_background(
                     spritesheet_cfg["image"], spritesheet_cfg["data"]
                 )
-                self._layers = loader.load()
+                render_mode = config.get("render_mode", "strip")
+                self._layers = [
+                    BackgroundLayer(image, parallax_scale=parallax_scale, render_mode=render_mode)
+                    for image, parallax_scale in layer_images
+                ]
 
             except Exception as e:
                 print(f"[Background] Erro ao carregar background: {e}. Usando fallback")
@@ -19,11 +19,31 @@ class BaseMenu:
         self._options = []
         self._buttons = []  # Lista para armazenar os botões
         self.__btn_idx = 0
+        # Áreas que mudaram desde o último quadro desenhado
+        self._dirty_rects = []
 
     @property
     def _current_button(self):
         return self._buttons[self.__btn_idx]
 
+    def invalidate(self, rect=None):
+        """Marca uma área para ser redesenhada (None = tela inteira)."""
+        if rect is None:
+            rect = self._game_state.screen.get_rect()
+        self._dirty_rects.append(pg.Rect(rect))
+
+    def is_dirty(self) -> bool:
+        return bool(self._dirty_rects)
+
+    def collect_dirty(self) -> list:
+        """Retorna e limpa as áreas que mudaram (lista vazia = nada mudou)."""
+        dirty, self._dirty_rects = self._dirty_rects, []
+        return dirty
+
+    def is_busy(self) -> bool:
+        """Indica se o menu tem trabalho em andamento mesmo sem mudar na tela."""
+        return False
+
     def _create_buttons(self):
         if self._options:
             screen_center_x = self._game_state.screen.get_width() // 2
@@ -62,8 +82,10 @@ class BaseMenu:
     def _move_selection(self, direction):
         if self._buttons:
             self._buttons[self.__btn_idx].selected = False  # Desseleciona o botão atual
+            self.invalidate(self._buttons[self.__btn_idx].rect)
             self.__btn_idx = (self.__btn_idx + direction) % len(self._buttons)
             self._buttons[self.__btn_idx].selected = True  # Seleciona o novo botão
+            self.invalidate(self._buttons[self.__btn_idx].rect)
 
     def _select_option(self):
         # Este método deve ser implementado pelas subclasses para lidar com a seleção de opções
@@ -0,0 +1,120 @@
+from bisect import bisect_left, bisect_right
+from itertools import count
+import pygame as pg
+
+
+class BatchGroup(pg.sprite.Group):
+    """
+    Grupo de sprites desenhado em lote: os pares (imagem, rect) vão para
+    uma lista reaproveitada entre quadros e seguem para a tela numa única
+    chamada Surface.fblits (quando existe) ou Surface.blits.
+
+    A ordem de desenho é estável e mantida na inserção: camada ('_layer',
+    como no LayeredUpdates; 0 por padrão) e, dentro da camada, a ordem em
+    que os sprites entraram. Nada é ordenado a cada quadro.
+
+    Com passo fixo de simulação, snapshot() guarda as posições antes de
+    cada passo e 'interpolation' (0 a 1) faz o draw desenhar cada sprite
+    entre a posição anterior e a atual.
+
+    Diferente do Group, draw não registra os rects desenhados (clear não
+    tem efeito).
+    """
+
+    # Deslocamentos maiores que isso (px) são teletransportes: sem interpolação
+    MAX_INTERPOLATION_DISTANCE = 200
+
+    def __init__(self, *sprites):
+        self._order = []  # sprites em ordem de desenho
+        self._order_keys = []  # (camada, sequência) de cada sprite em _order
+        self._keys = {}  # sprite -> (camada, sequência)
+        self._sequence = count()
+        self._batch = []  # [[imagem, rect]] reaproveitados entre quadros
+        self._previous = {}  # sprite -> (x, y) do rect antes do último passo
+        self.interpolation = 1.0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        if sprite in self._keys:
+            return
+        if layer is None:
+            layer = getattr(sprite, "_layer", 0)
+        key = (layer, next(self._sequence))
+        self._keys[sprite] = key
+        index = bisect_right(self._order_keys, key)
+        self._order_keys.insert(index, key)
+        self._order.insert(index, sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        key = self._keys.pop(sprite, None)
+        if key is not None:
+            index = bisect_left(self._order_keys, key)
+            del self._order_keys[index]
+            del self._order[index]
+        self._previous.pop(sprite, None)
+
+    def snapshot(self):
+        """Guarda a posição atual de cada sprite (chamar antes de cada passo)."""
+        self._previous = {sprite: sprite.rect.topleft for sprite in self._order}
+
+    def draw_position(self, sprite) -> tuple[float, float]:
+        """
+        Canto superior esquerdo onde draw desenha o sprite (com a
+        interpolação). Desenhos que acompanham um sprite (ex: o escudo do
+        player) devem partir daqui, e não da posição do último passo.
+        """
+        rect = sprite.rect
+        start = self._previous.get(sprite) if self.interpolation < 1.0 else None
+        if start is not None:
+            dx = rect.x - start[0]
+            dy = rect.y - start[1]
+            limit = self.MAX_INTERPOLATION_DISTANCE
+            if (dx or dy) and abs(dx) < limit and abs(dy) < limit:
+                alpha = self.interpolation
+                return start[0] + dx * alpha, start[1] + dy * alpha
+        return rect.x, rect.y
+
+    def sprites(self):
+        """Sprites na ordem de desenho."""
+        return list(self._order)
+
+    def draw(self, surface, bgsurf=None, special_flags=0):
+        """Desenha todos os sprites numa única chamada de blit em lote."""
+        batch = self._batch
+        order = self._order
+        size = len(order)
+
+        # Ajusta o tamanho da lista reaproveitada (só quando o grupo muda)
+        if len(batch) < size:
+            batch.extend([None, None] for _ in range(size - len(batch)))
+        elif len(batch) > size:
+            del batch[size:]
+
+        alpha = self.interpolation
+        if alpha >= 1.0 or not self._previous:
+            for item, sprite in zip(batch, order):
+                item[0] = sprite.image
+                item[1] = sprite.rect
+        else:
+            previous = self._previous
+            limit = self.MAX_INTERPOLATION_DISTANCE
+            for item, sprite in zip(batch, order):
+                item[0] = sprite.image
+                rect = sprite.rect
+                item[1] = rect
+                start = previous.get(sprite)
+                if start is not None:
+                    dx = rect.x - start[0]
+                    dy = rect.y - start[1]
+                    if (dx or dy) and abs(dx) < limit and abs(dy) < limit:
+                        item[1] = (start[0] + dx * alpha, start[1] + dy * alpha)
+
+        if special_flags:
+            surface.blits([(image, rect, None, special_flags) for image, rect in batch], False)
+        elif hasattr(surface, "fblits"):
+            surface.fblits(batch)
+        else:
+            surface.blits(batch, False)
+        return []
@@ -7,7 +7,10 @@ class CollisionManager:
     """
 
     def check_collision(
-        self, player: pg.sprite.GroupSingle, other_entity_group: pg.sprite.Group
+        self,
+        player: pg.sprite.GroupSingle,
+        other_entity_group: pg.sprite.Group,
+        candidates: list | None = None,
     ) -> bool:
         """
         Verifica a colisão pixel-perfect entre o jogador e o grupo de entidades.
@@ -16,10 +19,24 @@ class CollisionManager:
         Args:
             player (pg.sprite.GroupSingle): A instância do sprite do jogador.
             other_group (pg.sprite.Group): O grupo contendo as outras entidades.
+            candidates (list | None): Sprites que podem colidir, já filtrados
+                por uma fase ampla (ex: MotionEngine.near). Devem incluir todo
+                sprite do grupo que cruza o rect do jogador. None testa o grupo todo.
 
         Returns:
             bool: True se houve colisão, False caso contrário.
         """
+        if candidates is not None:
+            player_sprite = player.sprite
+            collided_entities = [
+                entity
+                for entity in candidates
+                if other_entity_group.has(entity) and pg.sprite.collide_mask(player_sprite, entity)
+            ]
+            for entity in collided_entities:
+                entity.kill()
+            return bool(collided_entities)
+
         # Usa spritecollide com a função de colisão de máscara.
         # Retorna uma lista de sprites de entidades que colidiram.
         collided_entities = pg.sprite.spritecollide(
@@ -1,5 +1,7 @@
 import pygame as pg
-from .asset_loader import EntityAnimationLoader
+from .asset_loader import AssetCache
+from .frame_variants import FrameVariantCache
+from .motion_engine import STEERED
 
 
 class Entity(pg.sprite.Sprite):
@@ -39,19 +41,31 @@ class Entity(pg.sprite.Sprite):
         self._animation_speed = 0.1
         self._loop_animation = True
         self._animation_finished = False
+        # Transformação aplicada a todos os frames (ver frame_variants)
+        self._frame_variant = None
+        self._fallback_image = None
+        self._fallback_mask = None
+        # Motor de movimento vetorizado (ver motion_engine), se a entidade entrou em um
+        self._motion = None
+        self._motion_slot = None
+        self._motion_kind = None
 
     def __load_animations(self, config: dict):
         """
         Carrega as animações do spritesheet definido na configuração.
-        Em caso de falha, não faz nada, permitindo que o fallback seja usado.
+        As animações vêm do cache global, então só a primeira entidade de
+        cada tipo lê o disco; as demais compartilham os mesmos frames.
+        Em caso de falha, não faz nada, permitindo que o fallback seja usado
+        (o erro é exibido apenas na primeira tentativa).
         """
         spritesheet_cfg = config.get("spritesheet", {})
         if spritesheet_cfg:
             try:
-                loader = EntityAnimationLoader(
-                    spritesheet_cfg["image"], spritesheet_cfg["data"]
+                self._animations = AssetCache().get_animations(
+                    spritesheet_cfg["image"],
+                    spritesheet_cfg["data"],
+                    spritesheet_cfg.get("target_size"),
                 )
-                self._animations = loader.load()
 
             except Exception as e:
                 print(f"[Entity] Erro ao carregar spritesheet: {e}. Usando fallback.")
@@ -69,16 +83,37 @@ class Entity(pg.sprite.Sprite):
             fallback_color = tuple(entity_cfg.get("fallback_color", (255, 0, 255)))
             self.__create_fallback_image(fallback_size, fallback_color)
 
-        # Configura o rect e a máscara iniciais
+        # Configura o rect inicial (a máscara já foi definida acima)
         self.rect = self.image.get_rect(center=(x, y))
-        self.mask = pg.mask.from_surface(self.image)
 
     def __create_fallback_image(
         self, size: tuple[int, int], color: tuple[int, int, int]
     ):
-        """Cria uma imagem de superfície sólida como fallback."""
-        self.image = pg.Surface(size, pg.SRCALPHA)
-        self.image.fill(color)
+        """Usa a imagem sólida de fallback (compartilhada pelo cache)."""
+        self._fallback_image, self._fallback_mask = AssetCache().get_fallback(
+            size, color
+        )
+        self.__apply_frame()
+
+    def __apply_frame(self):
+        """
+        Define a imagem e a máscara a partir do frame atual, aplicando a
+        transformação ativa (se houver) através do cache de variações.
+        """
+        if self._current_animation:
+            anim_data = self._animations[self._current_animation]
+            image = anim_data["frames"][self._current_frame]
+            # Máscara pré-calculada no carregamento
+            mask = anim_data["masks"][self._current_frame]
+        else:
+            image = self._fallback_image
+            mask = self._fallback_mask
+
+        if self._frame_variant:
+            image, mask = FrameVariantCache().get(image, self._frame_variant)
+
+        self.image = image
+        self.mask = mask
 
     def __animate(self, delta_time: float):
         """Avança o quadro da animação com base no delta_time."""
@@ -90,19 +125,25 @@ class Entity(pg.sprite.Sprite):
 
             if self._animation_timer >= self._animation_speed:
                 self._animation_timer -= self._animation_speed
+                self.advance_frame()
 
-                next_frame_index = self._current_frame + 1
+    def advance_frame(self):
+        """
+        Passa para o próximo quadro da animação atual (quem chama controla
+        o tempo: __animate ou o MotionEngine).
+        """
+        frames = self._animations[self._current_animation]["frames"]
+        next_frame_index = self._current_frame + 1
 
-                if self._loop_animation:
-                    self._current_frame = next_frame_index % len(frames)
-                elif next_frame_index < len(frames):
-                    self._current_frame = next_frame_index
-                else:
-                    self._animation_finished = True
+        if self._loop_animation:
+            self._current_frame = next_frame_index % len(frames)
+        elif next_frame_index < len(frames):
+            self._current_frame = next_frame_index
+        else:
+            self._animation_finished = True
 
-                # Atualiza a imagem e a máscara
-                self.image = frames[self._current_frame]
-                self.mask = pg.mask.from_surface(self.image)
+        # Atualiza a imagem e a máscara
+        self.__apply_frame()
 
     def set_animation(self, name: str):
         """
@@ -126,8 +167,67 @@ class Entity(pg.sprite.Sprite):
             self._animation_finished = False
 
             # Define a imagem e máscara iniciais da nova animação
-            self.image = anim_data["frames"][0]
-            self.mask = pg.mask.from_surface(self.image)
+            self.__apply_frame()
+
+            if self._motion is not None and self._motion_kind != STEERED:
+                self._motion.set_animation(self._motion_slot, self.__animation_clock())
+
+    def set_frame_variant(self, variant: tuple | None):
+        """
+        Define uma transformação (espelhamento, rotação ou escala) aplicada
+        a todos os frames da entidade, inclusive após trocas de frame.
+
+        Args:
+            variant (tuple | None): Chave criada por flip_variant,
+                                    rotate_variant ou scale_variant.
+                                    None remove a transformação.
+        """
+        self._frame_variant = variant
+        if self._current_animation or self._fallback_image:
+            self.__apply_frame()
+
+    def motion_params(self) -> dict | None:
+        """
+        Parâmetros de MotionEngine.add que descrevem o movimento da entidade
+        (arquétipo, posição, velocidade...). None: a entidade não usa o motor.
+        """
+        return None
+
+    def attach_motion(self, engine) -> bool:
+        """
+        Passa o movimento da entidade para o motor vetorizado. A partir daí
+        o update da entidade só cuida do que não é movimento (animação,
+        decisões em Python) e o motor move, atualiza o rect e remove.
+
+        Fora STEERED (perseguição decidida em Python), o motor também
+        avança o tempo da animação e a cena deixa de chamar o update.
+
+        Returns:
+            bool: True se a entidade entrou no motor.
+        """
+        params = self.motion_params()
+        if engine is None or params is None:
+            return False
+        self._motion = engine
+        self._motion_kind = params["kind"]
+        if self._motion_kind != STEERED:
+            params["animation"] = self.__animation_clock()
+        self._motion_slot = engine.add(self, **params)
+        return True
+
+    def __animation_clock(self) -> tuple[float, float] | None:
+        """(velocidade, timer) da animação em andamento, ou None se parada."""
+        if self._animation_finished or not self._current_animation:
+            return None
+        if not self._animations[self._current_animation]["frames"]:
+            return None
+        return self._animation_speed, self._animation_timer
+
+    def kill(self):
+        if self._motion is not None:
+            self._motion.remove(self._motion_slot)
+            self._motion = None
+        super().kill()
 
     def update(self, delta_time: float):
         """
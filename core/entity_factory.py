@@ -5,8 +5,14 @@ from typing import Type, Callable, Any
 class EntityFactory:
     """Classe base para todos os obstáculos."""
 
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
+        """
+        Args:
+            rng (random.Random | None): Fluxo usado para sortear a entidade
+                (ex: SceneRandom.spawn). None usa o módulo random global.
+        """
         self.__entries: list[tuple[Callable[..., Any], float]] = []
+        self.__rng = rng if rng is not None else random
 
     def register(self, entity_cls: Type, weight=1.0):
         self.__entries.append(
@@ -22,6 +28,6 @@ class EntityFactory:
         weights = (70, 30)
         """
         classes, weights = zip(*self.__entries)
-        entity_classes = random.choices(classes, weights=weights, k=len(self.__entries))
-        entity_cls = random.choice(entity_classes)
+        entity_classes = self.__rng.choices(classes, weights=weights, k=len(self.__entries))
+        entity_cls = self.__rng.choice(entity_classes)
         return entity_cls(*args, **kwargs)
@@ -1,5 +1,111 @@
 import pygame as pg
 
+# Caracteres pré-renderizados na faixa do atlas (os demais entram sob demanda)
+ATLAS_CHARSET = "0123456789.,:-+%m "
+
+
+class GlyphAtlas:
+    """
+    Atlas de glifos de uma combinação (fonte, tamanho, cor): cada caractere
+    é renderizado uma única vez e o texto é montado com blits dos glifos.
+    Ideal para números e textos curtos que mudam com frequência (HUD).
+    """
+
+    def __init__(self, font: pg.font.Font, color, antialias: bool = True):
+        """
+        Args:
+            font (pg.font.Font): Fonte já carregada.
+            color: Cor do texto.
+            antialias (bool): Suavização das bordas.
+        """
+        self.font = font
+        self.color = tuple(color)
+        self.antialias = antialias
+        self.height = font.get_height()
+        self._glyphs = {}
+        self.__build_strip(ATLAS_CHARSET)
+
+    def __build_strip(self, charset: str):
+        """Renderiza os caracteres em uma única faixa e guarda views de cada glifo."""
+        glyphs = [self.font.render(char, self.antialias, self.color) for char in charset]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        height = max([self.height] + [glyph.get_height() for glyph in glyphs])
+        self._strip = pg.Surface((max(width, 1), height), pg.SRCALPHA)
+
+        x = 0
+        for char, glyph in zip(charset, glyphs):
+            self._strip.blit(glyph, (x, 0))
+            self._glyphs[char] = self._strip.subsurface(
+                (x, 0, glyph.get_width(), glyph.get_height())
+            )
+            x += glyph.get_width()
+
+    def glyph(self, char: str) -> pg.Surface:
+        """Retorna o glifo do caractere (renderizado na primeira vez)."""
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, self.antialias, self.color)
+            self._glyphs[char] = glyph
+        return glyph
+
+    def size(self, text: str) -> tuple[int, int]:
+        """Tamanho (largura, altura) do texto montado com os glifos."""
+        return sum(self.glyph(char).get_width() for char in text), self.height
+
+    def draw(self, surface: pg.Surface, text: str, pos) -> pg.Rect:
+        """
+        Desenha o texto direto na superfície, glifo por glifo (sem criar
+        superfícies novas).
+
+        Returns:
+            pg.Rect: Área ocupada pelo texto.
+        """
+        x, y = pos
+        for char in text:
+            glyph = self.glyph(char)
+            surface.blit(glyph, (x, y))
+            x += glyph.get_width()
+        return pg.Rect(pos[0], y, x - pos[0], self.height)
+
+    def render(self, text: str) -> pg.Surface:
+        """Monta o texto em uma superfície nova (com alpha)."""
+        text_surface = pg.Surface(self.size(text), pg.SRCALPHA)
+        self.draw(text_surface, text, (0, 0))
+        return text_surface
+
+
+class CachedText:
+    """
+    Texto renderizado que só é refeito quando o valor muda.
+    Uso típico: chamar set(valor) a cada quadro e desenhar 'surface'.
+    """
+
+    def __init__(self, atlas: GlyphAtlas, value=""):
+        self._atlas = atlas
+        self._value = None
+        self.surface = None
+        self.set(value)
+
+    def set(self, value) -> bool:
+        """
+        Atualiza o valor; a superfície só é refeita se ele mudou.
+
+        Returns:
+            bool: True se o texto foi refeito.
+        """
+        if value == self._value:
+            return False
+        self._value = value
+        self.surface = self._atlas.render(str(value))
+        return True
+
+    @property
+    def value(self):
+        return self._value
+
+    def get_rect(self, **kwargs) -> pg.Rect:
+        return self.surface.get_rect(**kwargs)
+
 
 class FontManager:
     _instance = None
@@ -15,23 +121,43 @@ class FontManager:
             return
         pg.font.init()
         self._fonts = {}
+        # (nome, tamanho, negrito, cor) -> GlyphAtlas
+        self._atlases = {}
         self._initialized = True
 
-    def load_font(self, name, size, font_path=None):
-        if (name, size) not in self._fonts:
+    def load_font(self, name, size, font_path=None, bold=False):
+        if (name, size, bold) not in self._fonts:
             if font_path:
                 font = pg.font.Font(font_path, size)
+                font.set_bold(bold)
             else:
-                font = pg.font.SysFont(name, size)
-            self._fonts[(name, size)] = font
-        return self._fonts[(name, size)]
+                font = pg.font.SysFont(name, size, bold=bold)
+            self._fonts[(name, size, bold)] = font
+        return self._fonts[(name, size, bold)]
+
+    def get_font(self, name, size, bold=False):
+        return self._fonts.get((name, size, bold))
+
+    def get_atlas(self, name, size, color, bold=False, font_path=None) -> GlyphAtlas:
+        """
+        Retorna o atlas de glifos da fonte na cor pedida (criado uma única vez).
+        """
+        key = (name, size, bold, tuple(color))
+        if key not in self._atlases:
+            font = self.load_font(name, size, font_path, bold)
+            self._atlases[key] = GlyphAtlas(font, color)
+        return self._atlases[key]
 
-    def get_font(self, name, size):
-        return self._fonts.get((name, size))
+    def cached_text(self, name, size, color, value="", bold=False, font_path=None) -> CachedText:
+        """
+        Cria um texto em cache que só é renderizado de novo quando muda.
+        """
+        return CachedText(self.get_atlas(name, size, color, bold, font_path), value)
 
-    def unload_font(self, name, size):
-        if (name, size) in self._fonts:
-            del self._fonts[(name, size)]
+    def unload_font(self, name, size, bold=False):
+        if (name, size, bold) in self._fonts:
+            del self._fonts[(name, size, bold)]
 
     def unload_all_fonts(self):
         self._fonts = {}
+        self._atlases = {}
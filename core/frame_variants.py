@@ -0,0 +1,101 @@
+import weakref
+import pygame as pg
+from .surface_format import is_rle, rle_accelerate
+
+# Passo de quantização das rotações (em graus): 360 / 10 = 36 variações por frame
+ROTATION_STEP = 10
+# Passo de quantização dos redimensionamentos (em pixels)
+SCALE_STEP = 10
+
+
+def quantize(value: float, step: int) -> int:
+    """Arredonda um valor para o múltiplo de 'step' mais próximo."""
+    return int(round(value / step) * step)
+
+
+def flip_variant(flip_x: bool = True, flip_y: bool = False) -> tuple:
+    """Retorna a chave de transformação de um espelhamento."""
+    return ("flip", bool(flip_x), bool(flip_y))
+
+
+def rotate_variant(angle: float) -> tuple:
+    """
+    Retorna a chave de transformação de uma rotação.
+    O ângulo é quantizado em ROTATION_STEP graus para limitar o cache.
+    """
+    return ("rotate", quantize(angle, ROTATION_STEP) % 360)
+
+
+def scale_variant(size: tuple[int, int]) -> tuple:
+    """Retorna a chave de transformação de um redimensionamento."""
+    return ("scale", (int(size[0]), int(size[1])))
+
+
+class FrameVariantCache:
+    """
+    Cache global de frames transformados (espelhados, rotacionados ou
+    redimensionados) junto com suas máscaras de colisão.
+
+    As chaves são o próprio frame de origem (referência fraca) e a chave
+    de transformação criada por flip_variant/rotate_variant/scale_variant.
+    Como os frames das animações são compartilhados pelo AssetCache,
+    cada transformação é calculada uma única vez por frame.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(FrameVariantCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        # Frames que deixarem de existir são removidos automaticamente
+        self._variants = weakref.WeakKeyDictionary()
+        self._initialized = True
+
+    def get(self, frame: pg.Surface, variant: tuple) -> tuple[pg.Surface, pg.Mask]:
+        """
+        Retorna a versão transformada do frame e sua máscara.
+
+        Args:
+            frame (pg.Surface): Frame de origem (não é modificado).
+            variant (tuple): Chave de transformação.
+
+        Returns:
+            tuple[pg.Surface, pg.Mask]: Imagem transformada e sua máscara.
+        """
+        frame_variants = self._variants.get(frame)
+        if frame_variants is None:
+            frame_variants = {}
+            self._variants[frame] = frame_variants
+
+        entry = frame_variants.get(variant)
+        if entry is None:
+            image = self.__apply(frame, variant)
+            entry = (image, pg.mask.from_surface(image))
+            # A variação herda a codificação RLE do frame de origem
+            if is_rle(frame):
+                rle_accelerate(image)
+            frame_variants[variant] = entry
+
+        return entry
+
+    def __apply(self, frame: pg.Surface, variant: tuple) -> pg.Surface:
+        """Executa a transformação descrita pela chave."""
+        kind = variant[0]
+        if kind == "flip":
+            return pg.transform.flip(frame, variant[1], variant[2])
+        elif kind == "rotate":
+            return pg.transform.rotate(frame, variant[1])
+        elif kind == "scale":
+            return pg.transform.scale(frame, variant[1])
+
+        raise ValueError(f"[FrameVariantCache] Transformação desconhecida: {variant}")
+
+    def clear(self):
+        """Esvazia o cache de variações."""
+        self._variants = weakref.WeakKeyDictionary()
@@ -1,5 +1,7 @@
 import pygame as pg
 from enum import Enum
+from .asset_loader import AssetCache
+from .input_record import InputRecorder, numbered_path
 
 class State(Enum):
     """Estados possíveis do jogo"""
@@ -16,30 +18,72 @@ class State(Enum):
 class GameState:
     """Gerencia os diferentes estados do jogo"""
 
-    def __init__(self, screen: pg.Surface):
+    def __init__(
+        self,
+        screen: pg.Surface,
+        tick_rate: float = 60,
+        max_catchup_steps: int = 5,
+        seed: int | None = None,
+        motion_engine: str = "python",
+    ):
         """
         Inicializa o gerenciador de estados.
 
         Args:
             screen (pygame.Surface): Superfície principal do jogo
+            tick_rate (float): Passos de simulação por segundo durante o jogo
+                (independente da taxa de quadros).
+            max_catchup_steps (int): Máximo de passos num único quadro; o
+                atraso além disso é descartado (ex: carregamento ou pausa do GC).
+            seed (int | None): Semente dos geradores aleatórios das cenas.
+                Com ela, cada partida de uma cena repete a mesma sequência;
+                None sorteia uma semente nova a cada partida.
+            motion_engine (str): Motor de movimento das cenas ("python" ou
+                "numpy"; ver core/motion_engine.py).
         """
         self.screen = screen
         self.current_state = State.MAIN_MENU
         self.current_scene = None
+        self.current_scene_key = None
+        self.seed = seed
+        self.motion_engine = motion_engine
         # Tempo entre dois frames (em s); Para deixar o jogo mais suave
         self.delta_time = 0
         # Tempo do frame anterior (em s)
         self.last_time = pg.time.get_ticks() / 1000.0
 
+        # Simulação em passo fixo: o tempo acumulado é consumido em passos
+        # de 'tick_time' e o que sobra vira a fração de interpolação
+        self.tick_time = 1.0 / tick_rate
+        self.max_catchup_steps = max_catchup_steps
+        self.interpolation = 1.0
+        self._accumulator = 0.0
+        self._previous_scroll = None
+        # Passos simulados desde que a cena atual começou
+        self.scene_tick = 0
+
+        # Gravação e replay das ações do jogador (ver core/input_record.py)
+        self.recorder = None
+        self.replay = None
+        self._record_path = None
+        self._recordings = 0
+        self._replay_restore = None  # (semente, tick_time) anteriores ao replay
+
         # Importações tardias para evitar importação circular
         from menu import MainMenu
 
+        # Assets pedidos pelos menus entram na contabilidade como "menu"
+        AssetCache().set_scope("menu")
         self.main_menu = MainMenu(self)  # Não passa background_image_path por enquanto
         self.scene_select_menu = None
         self.pause_menu = None
         self.game_over_menu = None
         self.high_scores_menu = None
 
+        # Redesenho completo no próximo quadro (troca de estado ou de superfície)
+        self._full_redraw = True
+        self._last_target = None
+
     def handle_event(self, event: pg.event.Event):
         """
         Processa eventos do Pygame.
@@ -84,6 +128,30 @@ class GameState:
 
         return None
 
+    def __update_asset_scope(self, new_state, scene_key):
+        """
+        Atualiza no AssetCache a cena dona dos assets pedidos a partir de
+        agora e quais cenas ficam fixadas (fora do descarte por orçamento).
+        """
+        cache = AssetCache()
+
+        if new_state == State.PLAYING:
+            if self.current_state == State.PAUSE:
+                cache.set_scope(self.current_scene_key)
+                return
+            # Fixa os assets da nova cena antes de liberar os da anterior
+            cache.pin(scene_key)
+            if self.current_scene_key not in (None, scene_key):
+                cache.unpin(self.current_scene_key)
+            cache.set_scope(scene_key)
+            return
+
+        cache.set_scope("menu")
+        # Voltando aos menus principais, a cena deixa de estar ativa
+        if new_state in (State.MAIN_MENU, State.SCENE_SELECT) and self.current_scene_key:
+            cache.unpin(self.current_scene_key)
+            self.current_scene_key = None
+
     def change_state(self, new_state, scene_key=""):
         """
         Muda o estado atual do jogo.
@@ -92,9 +160,23 @@ class GameState:
             new_state (State): Novo estado
             scene (str, optional): Nome do cenário (para o estado PLAYING)
         """
+        self.__update_asset_scope(new_state, scene_key)
+
+        if new_state in (State.GAME_OVER, State.MAIN_MENU, State.SCENE_SELECT):
+            self.__finish_scene()
+
         if new_state == State.PLAYING:
             if self.current_state != State.PAUSE:
+                self.current_scene_key = scene_key
                 self.current_scene = self.load_scene(scene_key)
+                self._previous_scroll = None
+                self.scene_tick = 0
+                rng = getattr(self.current_scene, "rng", None)
+                if rng is not None:
+                    # Semente para repetir a partida com --seed
+                    print(f"[GameState] Cena '{scene_key}' com semente {rng.seed}")
+                    if self._record_path and self.replay is None:
+                        self.recorder = InputRecorder(scene_key, rng.seed, 1.0 / self.tick_time)
         elif new_state == State.SCENE_SELECT:
             from menu import SceneSelectMenu  # Importa SceneSelectMenu
 
@@ -121,6 +203,10 @@ class GameState:
 
         # Atualizar o novo estado do jogo
         self.current_state = new_state
+        self._full_redraw = True
+        # O tempo parado no menu (ou carregando a cena) não conta no delta
+        self.last_time = pg.time.get_ticks() / 1000.0
+        self._accumulator = 0.0
 
     def update(self):
         """Atualiza o estado atual do jogo."""
@@ -136,7 +222,7 @@ class GameState:
                 self.scene_select_menu.update(self.delta_time)
         elif self.current_state == State.PLAYING:
             if self.current_scene:
-                self.current_scene.update(self.delta_time)
+                self.__run_ticks(self.current_scene)
         elif self.current_state == State.PAUSE:
             if self.pause_menu:
                 self.pause_menu.update(self.delta_time)
@@ -147,13 +233,184 @@ class GameState:
             if self.high_scores_menu:
                 self.high_scores_menu.update(self.delta_time)
 
+    def __run_ticks(self, scene):
+        """
+        Avança a cena em passos fixos pelo tempo acumulado, com no máximo
+        'max_catchup_steps' passos por quadro.
+        """
+        self._accumulator += min(self.delta_time, self.tick_time * self.max_catchup_steps)
+
+        steps = 0
+        while self._accumulator >= self.tick_time and steps < self.max_catchup_steps:
+            if self.replay is not None and not self.__apply_replay(scene):
+                break
+            self.__snapshot(scene)
+            self.scene_tick += 1  # antes do passo: um game over nele já conta
+            scene.update(self.tick_time)
+            self._accumulator -= self.tick_time
+            steps += 1
+            if self.current_state != State.PLAYING:
+                break  # a cena terminou (game over) ou pausou no meio dos passos
+
+        # Descarta o atraso que não coube nos passos deste quadro
+        self._accumulator %= self.tick_time
+        self.interpolation = self._accumulator / self.tick_time
+
+    def __apply_replay(self, scene) -> bool:
+        """
+        Aplica as ações gravadas para o próximo passo. Retorna False (e
+        volta ao menu) quando a partida gravada já terminou.
+        """
+        if self.replay.finished(self.scene_tick):
+            self.change_state(State.MAIN_MENU)
+            return False
+        for action in self.replay.actions_at(self.scene_tick):
+            getattr(scene.player, action)()
+        return True
+
+    def accept_action(self, action: str) -> bool:
+        """
+        Chamado pelas cenas antes de aplicar uma ação do jogador vinda do
+        teclado ou joystick: grava a ação (se houver gravação) e diz se ela
+        deve ser aplicada. Durante um replay as entradas ao vivo são ignoradas.
+        """
+        if self.replay is not None:
+            return False
+        if self.recorder is not None:
+            self.recorder.record(self.scene_tick, action)
+        return True
+
+    def start_recording(self, path: str):
+        """
+        Grava as ações de cada partida a partir da próxima cena carregada.
+        A primeira partida é salva em 'path' e as seguintes com sufixo
+        numérico (partida-2.rec, ...).
+        """
+        self._record_path = path
+
+    def stop_recording(self):
+        """Salva a partida em andamento (se houver) e encerra a gravação."""
+        self.__finish_scene()
+        self._record_path = None
+
+    def start_replay(self, replay):
+        """
+        Inicia a cena de uma gravação (InputReplay) com a mesma semente e a
+        mesma taxa de passos, aplicando as ações gravadas no lugar das
+        entradas. Ao fim da partida semente e taxa voltam ao que eram.
+        """
+        self.__finish_scene()
+        self._replay_restore = (self.seed, self.tick_time)
+        self.seed = replay.seed
+        self.tick_time = 1.0 / replay.tick_rate
+        replay.rewind()
+        self.replay = replay
+        self.change_state(State.PLAYING, replay.scene)
+
+    def __finish_scene(self):
+        """Salva a gravação e encerra o replay da partida que terminou."""
+        score_manager = getattr(self.current_scene, "score_manager", None)
+        score = score_manager.get_score() if score_manager else None
+
+        if self.recorder is not None:
+            self._recordings += 1
+            path = numbered_path(self._record_path, self._recordings)
+            self.recorder.save(path, self.scene_tick, score)
+            self.recorder = None
+
+        if self.replay is not None:
+            print(
+                f"[GameState] Replay terminou no passo {self.scene_tick} "
+                f"(pontuação {score}, gravada {self.replay.score})"
+            )
+            self.seed, self.tick_time = self._replay_restore
+            self.replay = None
+
+    def __snapshot(self, scene):
+        """Guarda o estado anterior ao passo, usado para interpolar o desenho."""
+        scene.all_sprites_group.snapshot()
+        self._previous_scroll = scene.scroll_manager.scroll_x
+
+    def __interpolate(self, scene):
+        """
+        Prepara o desenho entre o penúltimo e o último passo. Toda cena
+        tem 'all_sprites_group' (BatchGroup), 'scroll_manager',
+        'background_manager' e 'interpolation'.
+
+        Interpolados aqui: os sprites de all_sprites_group e o fundo. O
+        resto do render da cena usa as posições do último passo, exceto o
+        que a própria cena interpola. Ela lê a fração em
+        scene.interpolation (0 a 1). Desenhos presos a um sprite usam
+        all_sprites_group.draw_position.
+        """
+        alpha = self.interpolation
+        scene.interpolation = alpha
+        scene.all_sprites_group.interpolation = alpha
+        if self._previous_scroll is not None:
+            previous = self._previous_scroll
+            scroll_x = scene.scroll_manager.scroll_x
+            scene.background_manager.update(previous + (scroll_x - previous) * alpha)
+
+    def current_menu(self):
+        """Menu do estado atual (None durante o jogo ou ao finalizar)."""
+        return {
+            State.MAIN_MENU: self.main_menu,
+            State.SCENE_SELECT: self.scene_select_menu,
+            State.PAUSE: self.pause_menu,
+            State.GAME_OVER: self.game_over_menu,
+            State.HIGH_SCORES: self.high_scores_menu,
+        }.get(self.current_state)
+
+    def invalidate(self):
+        """Força o redesenho completo no próximo quadro."""
+        self._full_redraw = True
+
+    def is_idle(self) -> bool:
+        """
+        Indica se nada vai mudar até chegar uma entrada: um menu estático,
+        sem áreas pendentes e sem trabalho em andamento.
+        """
+        menu = self.current_menu()
+        return (
+            menu is not None
+            and not self._full_redraw
+            and not menu.is_dirty()
+            and not menu.is_busy()
+        )
+
     def render(self, screen: pg.Surface):
         """
-        Renderiza o estado atual do jogo.
+        Renderiza o estado atual do jogo. Menus só são redesenhados nas
+        áreas que mudaram.
 
         Args:
             screen (pygame.Surface): Superfície onde renderizar
+
+        Returns:
+            list[pg.Rect] | None: Áreas alteradas da superfície; None quando
+            o quadro inteiro mudou e lista vazia quando nada mudou.
         """
+        if screen is not self._last_target:
+            self._last_target = screen
+            self._full_redraw = True
+
+        menu = self.current_menu()
+        dirty = None
+        if menu is not None:
+            dirty = menu.collect_dirty()
+            if self._full_redraw:
+                dirty = None
+            elif not dirty:
+                return []
+            else:
+                screen.set_clip(dirty[0].unionall(dirty[1:]))
+        self._full_redraw = False
+
+        self.__render_state(screen)
+        screen.set_clip(None)
+        return dirty
+
+    def __render_state(self, screen: pg.Surface):
         if self.current_state == State.MAIN_MENU:
             self.main_menu.render(screen)
         elif self.current_state == State.SCENE_SELECT:
@@ -161,6 +418,7 @@ class GameState:
                 self.scene_select_menu.render(screen)
         elif self.current_state == State.PLAYING:
             if self.current_scene:
+                self.__interpolate(self.current_scene)
                 self.current_scene.render(screen)
         elif self.current_state == State.PAUSE:
             if self.pause_menu:
@@ -0,0 +1,152 @@
+import gzip
+import json
+import os
+
+# Ações do jogador que podem ser gravadas (métodos dos players das cenas)
+PLAYER_ACTIONS = (
+    "start_thrust",
+    "stop_thrust",
+    "start_dive",
+    "stop_dive",
+    "start_move_left",
+    "stop_move_left",
+    "start_move_right",
+    "stop_move_right",
+)
+
+RECORDING_VERSION = 1
+
+
+def _open(path: str, mode: str):
+    """Abre o arquivo de gravação (comprimido com gzip se terminar em .gz)."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class InputRecorder:
+    """
+    Grava as ações do jogador de uma partida com o passo de simulação em
+    que aconteceram, junto com a cena, a semente e a taxa de passos: o
+    suficiente para repetir a partida exatamente com InputReplay.
+
+    No arquivo (JSON compacto) cada evento é [passos desde o evento
+    anterior, índice da ação em "actions"].
+    """
+
+    def __init__(self, scene: str, seed: int, tick_rate: float):
+        self.scene = scene
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self._events = []  # (passo, ação)
+
+    def record(self, tick: int, action: str):
+        """Registra a ação, aplicada antes do passo 'tick' da cena."""
+        self._events.append((tick, action))
+
+    def __len__(self):
+        return len(self._events)
+
+    def save(self, path: str, ticks: int, score=None):
+        """
+        Salva a gravação.
+
+        Args:
+            path (str): Arquivo de destino (.gz para comprimir).
+            ticks (int): Passos simulados até o fim da partida.
+            score: Pontuação final (para conferir o replay).
+        """
+        events = []
+        last = 0
+        for tick, action in self._events:
+            events.append([tick - last, PLAYER_ACTIONS.index(action)])
+            last = tick
+
+        data = {
+            "version": RECORDING_VERSION,
+            "scene": self.scene,
+            "seed": self.seed,
+            "tick_rate": self.tick_rate,
+            "ticks": ticks,
+            "score": score,
+            "actions": list(PLAYER_ACTIONS),
+            "events": events,
+        }
+        with _open(path, "w") as file:
+            json.dump(data, file, separators=(",", ":"))
+        print(f"[InputRecorder] {len(events)} ações em {ticks} passos salvas em {path}")
+
+
+class InputReplay:
+    """
+    Gravação carregada de um arquivo, entregue passo a passo: a cada passo
+    da simulação, actions_at(tick) diz quais ações aplicar antes dele.
+    """
+
+    def __init__(self, scene: str, seed: int, tick_rate: float, events, ticks=None, score=None):
+        """
+        Args:
+            scene (str): Chave da cena gravada.
+            seed (int): Semente da cena na gravação.
+            tick_rate (float): Passos por segundo usados na gravação.
+            events (list[tuple[int, str]]): (passo, ação) em ordem.
+            ticks (int | None): Passos até o fim da partida gravada.
+            score: Pontuação final gravada.
+        """
+        self.scene = scene
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.ticks = ticks
+        self.score = score
+        self._events = list(events)
+        self._cursor = 0
+
+    @classmethod
+    def load(cls, path: str) -> "InputReplay":
+        with _open(path, "r") as file:
+            data = json.load(file)
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Versão de gravação não suportada: {data.get('version')}")
+
+        names = data["actions"]
+        events = []
+        tick = 0
+        for delta, index in data["events"]:
+            tick += delta
+            events.append((tick, names[index]))
+        return cls(
+            data["scene"],
+            data["seed"],
+            data["tick_rate"],
+            events,
+            data.get("ticks"),
+            data.get("score"),
+        )
+
+    def rewind(self):
+        self._cursor = 0
+
+    def actions_at(self, tick: int) -> list:
+        """Ações a aplicar antes do passo 'tick' (os passos devem ser crescentes)."""
+        actions = []
+        events = self._events
+        while self._cursor < len(events) and events[self._cursor][0] <= tick:
+            actions.append(events[self._cursor][1])
+            self._cursor += 1
+        return actions
+
+    def finished(self, tick: int) -> bool:
+        """Indica se a partida gravada terminou no passo 'tick'."""
+        return self.ticks is not None and tick >= self.ticks
+
+
+def numbered_path(path: str, index: int) -> str:
+    """
+    Caminho da gravação de número 'index' de uma sessão: a primeira usa o
+    próprio caminho, as seguintes ganham um sufixo (partida-2.rec, ...).
+    """
+    if index <= 1:
+        return path
+    base, ext = os.path.splitext(path[:-3] if path.endswith(".gz") else path)
+    suffix = ".gz" if path.endswith(".gz") else ""
+    return f"{base}-{index}{ext}{suffix}"
@@ -0,0 +1,272 @@
+import pygame as pg
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+try:
+    import numpy as np
+except ImportError:  # dependência opcional: sem ela fica o movimento em Python
+    np = None
+
+MOTION_ENGINES = ("python", "numpy")
+
+# Arquétipos de movimento
+LINEAR = 0  # velocidade constante
+ZIGZAG = 1  # y = base + sen(fase) * amplitude, fase += frequência * dt
+BOUNCE = 2  # inverte a velocidade vertical a cada 'interval' segundos
+STEERED = 3  # velocidade decidida em Python a cada passo (perseguição)
+
+# Âncora do rect na posição
+CENTER = 0
+MIDBOTTOM = 1
+
+
+def create_motion_engine(name: str):
+    """
+    Cria o motor de movimento configurado ("numpy"), ou None para o
+    movimento em Python de cada entidade ("python" ou NumPy ausente).
+    """
+    if name == "numpy":
+        if np is None:
+            print("[MotionEngine] NumPy não está instalado; usando o movimento em Python.")
+            return None
+        return MotionEngine()
+    if name != "python":
+        print(f"[MotionEngine] Motor desconhecido '{name}'; usando o movimento em Python.")
+    return None
+
+
+class MotionEngine:
+    """
+    Movimento de obstáculos e inimigos em estrutura de arrays (NumPy):
+    posição, velocidade e parâmetros de cada arquétipo ficam em arrays e
+    todos avançam num único passo vetorizado por tick. Só os rects que
+    aparecem na tela são atualizados, e quem sai pela esquerda é removido.
+
+    O tempo das animações também fica aqui (a entidade só é chamada quando
+    troca de quadro), então a cena não chama o update das entidades que
+    não são STEERED.
+
+    As entidades entram com Entity.attach_motion e saem com kill().
+    """
+
+    def __init__(self, capacity: int = 256, bounds=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        """
+        Args:
+            capacity (int): Vagas iniciais (os arrays dobram quando enchem).
+            bounds (tuple[int, int]): Tamanho da área visível.
+        """
+        self.bounds = bounds
+        self._sprites = []  # vaga -> sprite (None se livre)
+        self._free = []  # vagas livres
+        self._size = 0  # maior vaga já usada + 1
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        """Cria (ou aumenta) os arrays mantendo o conteúdo das vagas usadas."""
+        old = getattr(self, "_capacity", 0)
+        arrays = {
+            "_pos": (np.float64, (capacity, 2)),
+            "_vel": (np.float64, (capacity, 2)),
+            "_kind": (np.int8, capacity),
+            "_anchor": (np.int8, capacity),
+            "_active": (np.bool_, capacity),
+            "_shown": (np.bool_, capacity),  # rect atualizado no último passo
+            "_size_wh": (np.int64, (capacity, 2)),
+            "_left": (np.int64, capacity),
+            "_top": (np.int64, capacity),
+            "_base_y": (np.float64, capacity),
+            "_amplitude": (np.float64, capacity),
+            "_frequency": (np.float64, capacity),
+            "_timer": (np.float64, capacity),
+            "_interval": (np.float64, capacity),
+            "_animated": (np.bool_, capacity),
+            "_anim_speed": (np.float64, capacity),
+            "_anim_timer": (np.float64, capacity),
+        }
+        for name, (dtype, shape) in arrays.items():
+            array = np.zeros(shape, dtype=dtype)
+            if old:
+                array[:old] = getattr(self, name)
+            setattr(self, name, array)
+
+        self._sprites.extend([None] * (capacity - old))
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self._capacity = capacity
+
+    def __len__(self):
+        return self._capacity - len(self._free)
+
+    def add(
+        self,
+        sprite,
+        kind: int,
+        position,
+        velocity=(0.0, 0.0),
+        anchor: int = CENTER,
+        amplitude: float = 0.0,
+        frequency: float = 0.0,
+        timer: float = 0.0,
+        interval: float = 0.0,
+        animation: tuple[float, float] | None = None,
+    ) -> int:
+        """
+        Registra um sprite e retorna a vaga dele. Para ZIGZAG, a posição y
+        é a linha base da oscilação. 'animation' é (velocidade, timer) da
+        animação que o motor deve avançar (chamando sprite.advance_frame).
+        """
+        if not self._free:
+            self._allocate(self._capacity * 2)
+        slot = self._free.pop()
+        self._size = max(self._size, slot + 1)
+
+        self._sprites[slot] = sprite
+        self._pos[slot] = position
+        self._vel[slot] = velocity
+        self._kind[slot] = kind
+        self._anchor[slot] = anchor
+        self._active[slot] = True
+        self._shown[slot] = True  # o rect inicial pode estar na tela
+        self._size_wh[slot] = sprite.rect.size
+        self._left[slot], self._top[slot] = sprite.rect.topleft
+        self._base_y[slot] = position[1]
+        self._amplitude[slot] = amplitude
+        self._frequency[slot] = frequency
+        self._timer[slot] = timer
+        self._interval[slot] = interval
+        self.set_animation(slot, animation)
+        return slot
+
+    def remove(self, slot: int):
+        if self._sprites[slot] is None:
+            return
+        self._sprites[slot] = None
+        self._active[slot] = False
+        self._shown[slot] = False
+        self._animated[slot] = False
+        self._free.append(slot)
+        while self._size and not self._active[self._size - 1]:
+            self._size -= 1
+
+    def set_animation(self, slot: int, animation: tuple[float, float] | None):
+        """Troca o relógio da animação da vaga ((velocidade, timer) ou None)."""
+        self._animated[slot] = animation is not None
+        if animation is not None:
+            self._anim_speed[slot], self._anim_timer[slot] = animation
+
+    def set_velocity(self, slot: int, velocity):
+        self._vel[slot] = velocity
+
+    def position(self, slot: int) -> tuple[float, float]:
+        x, y = self._pos[slot]
+        return float(x), float(y)
+
+    def step(self, delta_time: float):
+        """
+        Avança todas as entidades um passo, atualiza os rects visíveis e
+        remove as que saíram pela esquerda da tela.
+        """
+        n = self._size
+        if n == 0:
+            return
+
+        active = self._active[:n]
+        kind = self._kind[:n]
+        pos = self._pos[:n]
+        vel = self._vel[:n]
+        timer = self._timer[:n]
+
+        # Zigue-zague: a fase avança e define a altura antes do deslocamento
+        zigzag = active & (kind == ZIGZAG)
+        if zigzag.any():
+            timer[zigzag] += delta_time * self._frequency[:n][zigzag]
+            pos[zigzag, 1] = self._base_y[:n][zigzag] + np.sin(timer[zigzag]) * self._amplitude[:n][zigzag]
+
+        # Quique: inverte a velocidade vertical quando o timer vence
+        bounce = active & (kind == BOUNCE)
+        if bounce.any():
+            timer[bounce] += delta_time
+            flip = bounce & (timer >= self._interval[:n])
+            vel[flip, 1] *= -1
+            timer[flip] = 0.0
+
+        pos += vel * delta_time
+
+        self.__animate(n, active, delta_time)
+        self.__sync(n, active)
+
+    def __animate(self, n: int, active, delta_time: float):
+        """Avança os timers de animação e troca o quadro de quem venceu."""
+        animated = active & self._animated[:n]
+        if not animated.any():
+            return
+        speed = self._anim_speed[:n]
+        timer = self._anim_timer[:n]
+        timer[animated] += delta_time
+        due = np.flatnonzero(animated & (timer >= speed))
+        timer[due] -= speed[due]
+        for slot in due.tolist():
+            sprite = self._sprites[slot]
+            sprite.advance_frame()
+            if sprite._animation_finished:
+                self._animated[slot] = False
+
+    def __sync(self, n: int, active):
+        """Calcula os rects, atualiza os visíveis e remove os que saíram da tela."""
+        width = self._size_wh[:n, 0]
+        height = self._size_wh[:n, 1]
+        # rect.center = (int(x), int(y)): int() trunca em direção a zero
+        cx = np.trunc(self._pos[:n, 0]).astype(np.int64)
+        cy = np.trunc(self._pos[:n, 1]).astype(np.int64)
+        left = cx - width // 2
+        top = np.where(self._anchor[:n] == MIDBOTTOM, cy - height, cy - height // 2)
+        self._left[:n] = left
+        self._top[:n] = top
+
+        screen_w, screen_h = self.bounds
+        visible = active & (left < screen_w) & (left + width > 0) & (top < screen_h) & (top + height > 0)
+        # Também atualiza quem acabou de sair, para não deixar um rect antigo na borda
+        shown = self._shown[:n]
+        update = visible | (shown & active)
+        shown[:] = visible
+
+        sprites = self._sprites
+        for slot, x, y in zip(
+            np.flatnonzero(update).tolist(), left[update].tolist(), top[update].tolist()
+        ):
+            sprites[slot].rect.topleft = (x, y)
+
+        # A perseguição em Python lê '_position': devolve a posição nova
+        for slot in np.flatnonzero(active & (self._kind[:n] == STEERED)).tolist():
+            x, y = self._pos[slot]
+            sprites[slot]._position.update(float(x), float(y))
+
+        # Saiu pela esquerda (rect.right < 0)
+        for slot in np.flatnonzero(active & (left + width < 0)).tolist():
+            sprite = sprites[slot]
+            sprite.rect.topleft = (int(left[slot]), int(top[slot]))
+            sprite.kill()
+
+    def near(self, rect: pg.Rect) -> list:
+        """
+        Sprites cujo rect cruza 'rect' (fase ampla da colisão): só eles
+        precisam do teste por máscara.
+        """
+        n = self._size
+        if n == 0:
+            return []
+        left = self._left[:n]
+        top = self._top[:n]
+        width = self._size_wh[:n, 0]
+        height = self._size_wh[:n, 1]
+        hit = (
+            self._active[:n]
+            & (left < rect.right)
+            & (left + width > rect.left)
+            & (top < rect.bottom)
+            & (top + height > rect.top)
+        )
+        sprites = []
+        for slot in np.flatnonzero(hit).tolist():
+            sprite = self._sprites[slot]
+            sprite.rect.topleft = (int(left[slot]), int(top[slot]))
+            sprites.append(sprite)
+        return sprites
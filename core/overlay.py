@@ -0,0 +1,96 @@
+import math
+import pygame as pg
+
+
+class Overlay:
+    """
+    Superfície com alpha alocada uma única vez. O conteúdo é desenhado por
+    uma função e só é refeito quando os parâmetros passados a 'update' mudam.
+    """
+
+    def __init__(self, size, draw):
+        """
+        Args:
+            size (tuple[int, int]): Tamanho da superfície.
+            draw (callable): draw(surface, *params) desenha o conteúdo numa
+                superfície já limpa (transparente).
+        """
+        self.surface = pg.Surface(size, pg.SRCALPHA)
+        self._draw = draw
+        self._params = None
+
+    def update(self, *params) -> pg.Surface:
+        """Redesenha o conteúdo se os parâmetros mudaram e retorna a superfície."""
+        if params != self._params:
+            self.surface.fill((0, 0, 0, 0))
+            self._draw(self.surface, *params)
+            self._params = params
+        return self.surface
+
+    def get_rect(self, **kwargs) -> pg.Rect:
+        return self.surface.get_rect(**kwargs)
+
+
+class PulseOverlay:
+    """
+    Animação de pulso pré-calculada: 'count' quadros desenhados uma única
+    vez para fases igualmente espaçadas em [0, 1). A cada quadro do jogo
+    só se escolhe qual deles desenhar.
+    """
+
+    def __init__(self, size, draw, count: int = 24):
+        """
+        Args:
+            size (tuple[int, int]): Tamanho de cada quadro.
+            draw (callable): draw(surface, phase) desenha o quadro da fase
+                (0.0 a 1.0) numa superfície transparente.
+            count (int): Quantidade de quadros pré-calculados.
+        """
+        self.size = tuple(size)
+        self._frames = []
+        for i in range(count):
+            frame = pg.Surface(size, pg.SRCALPHA)
+            draw(frame, i / count)
+            self._frames.append(frame)
+
+    def frame(self, phase: float) -> pg.Surface:
+        """Quadro mais próximo da fase (qualquer número real; usa a parte fracionária)."""
+        count = len(self._frames)
+        return self._frames[int(phase * count) % count]
+
+    @staticmethod
+    def phase(angle: float) -> float:
+        """Converte o ângulo de um seno (radianos) em fase de 0 a 1."""
+        return (angle / (2 * math.pi)) % 1.0
+
+
+class LineOverlay:
+    """
+    Linha com transparência desenhada numa superfície de rascunho
+    persistente. Só a caixa que contém a linha é limpa e copiada para a
+    tela, em vez de uma superfície do tamanho da tela por quadro.
+    """
+
+    def __init__(self, size, width: int = 1):
+        """
+        Args:
+            size (tuple[int, int]): Tamanho da área de desenho (normalmente a tela).
+            width (int): Espessura da linha.
+        """
+        self.surface = pg.Surface(size, pg.SRCALPHA)
+        self.width = width
+        self._dirty = None
+
+    def draw(self, screen: pg.Surface, color, start, end) -> pg.Rect:
+        """
+        Desenha a linha (cor com alpha) de 'start' a 'end' na tela.
+
+        Returns:
+            pg.Rect: Área da tela atualizada.
+        """
+        if self._dirty is not None:
+            self.surface.fill((0, 0, 0, 0), self._dirty)
+        rect = pg.draw.line(self.surface, color, start, end, self.width)
+        screen.blit(self.surface, rect, rect)
+        self._dirty = rect
+        return rect
@@ -0,0 +1,369 @@
+import math
+import time
+import pygame as pg
+
+# Modos de escala da tela virtual para a tela real
+SCALE_MODES = ("smooth", "nearest", "integer")
+
+# Resoluções internas: "native" resolve o quadro direto na tela real;
+# "logical" mantém a resolução lógica e só amplia com vizinho mais próximo
+INTERNAL_RESOLUTIONS = ("native", "logical")
+
+# Backends do smoothscale conhecidos pelo pygame (nem todos existem em toda CPU)
+SMOOTHSCALE_BACKENDS = ("GENERIC", "MMX", "SSE", "SSE2", "NEON")
+
+
+def pick_smoothscale_backend(source_size, target_size, repeat: int = 5) -> str:
+    """
+    Mede os backends de smoothscale disponíveis nesta CPU com os tamanhos
+    reais da apresentação, ativa o mais rápido e retorna o nome dele.
+    """
+    source = pg.Surface(source_size)
+    target = pg.Surface(target_size)
+    original = pg.transform.get_smoothscale_backend()
+
+    best, best_time = original, None
+    for backend in SMOOTHSCALE_BACKENDS:
+        try:
+            pg.transform.set_smoothscale_backend(backend)
+        except ValueError:
+            continue  # não suportado nesta CPU
+        pg.transform.smoothscale(source, target_size, target)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            pg.transform.smoothscale(source, target_size, target)
+        elapsed = time.perf_counter() - start
+        if best_time is None or elapsed < best_time:
+            best, best_time = backend, elapsed
+
+    pg.transform.set_smoothscale_backend(best)
+    return best
+
+
+class Presenter:
+    """
+    Etapa de apresentação: leva a tela virtual (onde o jogo desenha) para a
+    tela real, mantendo a proporção com barras pretas (letterbox).
+
+    - "smooth": escala suavizada (smoothscale);
+    - "nearest": vizinho mais próximo (mais rápido, pixels duros);
+    - "integer": maior múltiplo inteiro que cabe na tela (pixels nítidos).
+    Quando a escala é 1, o jogo desenha direto na tela real (passthrough).
+
+    A resolução interna é onde o quadro é resolvido com o filtro do modo
+    antes da ampliação final (vizinho mais próximo) até a tela: "native"
+    (direto na tela), "logical" (só a ampliação final, o caminho mais
+    barato) ou um tamanho (largura, altura) qualquer.
+
+    As cenas sempre desenham na resolução lógica: a resolução interna só
+    muda a qualidade da ampliação, não o custo de desenhar a cena. Como o
+    custo do smoothscale segue o tamanho do destino, um tamanho entre a
+    lógica e a nativa não economiza nada (e gera um aviso).
+
+    O destino da escala é uma subsuperfície da tela, criada uma única vez
+    por geometria, e as barras só são limpas quando a geometria muda.
+    """
+
+    def __init__(
+        self,
+        screen: pg.Surface,
+        virtual_size,
+        mode: str = "smooth",
+        backend: str = "auto",
+        internal_resolution="native",
+    ):
+        """
+        Args:
+            screen (pg.Surface): Tela real (pg.display.get_surface()).
+            virtual_size (tuple[int, int]): Resolução da tela virtual.
+            mode (str): Um de SCALE_MODES.
+            backend (str): Backend do smoothscale, ou "auto" para medir e
+                escolher o mais rápido.
+            internal_resolution (str | tuple[int, int]): Um de
+                INTERNAL_RESOLUTIONS ou um tamanho (largura, altura).
+        """
+        if mode not in SCALE_MODES:
+            raise ValueError(f"Modo de escala inválido: {mode} (use {', '.join(SCALE_MODES)})")
+        self.mode = mode
+        self._backend = backend
+        self._virtual_size = tuple(virtual_size)
+        self._virtual = pg.Surface(self._virtual_size)
+        self._internal_resolution = self.__check_resolution(internal_resolution)
+        self._screen = None
+        self._screen_size = None
+        self._internal = None
+        self.configure(screen)
+
+    @property
+    def surface(self) -> pg.Surface:
+        """Superfície onde o jogo deve desenhar neste quadro."""
+        return self._target
+
+    @property
+    def passthrough(self) -> bool:
+        return self._target is not self._virtual
+
+    @property
+    def internal_resolution(self):
+        return self._internal_resolution
+
+    @property
+    def internal_size(self) -> tuple[int, int]:
+        """Tamanho em que o quadro é resolvido antes da ampliação final."""
+        return self._internal_size
+
+    def set_internal_resolution(self, resolution):
+        """Troca a resolução interna (o buffer só é realocado se o tamanho mudar)."""
+        resolution = self.__check_resolution(resolution)
+        if resolution != self._internal_resolution:
+            self._internal_resolution = resolution
+            self.__configure_internal()
+
+    @staticmethod
+    def __check_resolution(resolution):
+        if isinstance(resolution, str):
+            if resolution not in INTERNAL_RESOLUTIONS:
+                raise ValueError(
+                    f"Resolução interna inválida: {resolution} "
+                    f"(use {', '.join(INTERNAL_RESOLUTIONS)} ou [largura, altura])"
+                )
+            return resolution
+        return tuple(int(value) for value in resolution)
+
+    def configure(self, screen: pg.Surface):
+        """Recalcula a geometria para a tela atual e limpa as barras."""
+        self._screen = screen
+        self._screen_size = screen.get_size()
+        real_width, real_height = self._screen_size
+        virtual_width, virtual_height = self._virtual_size
+
+        ratio = min(real_width / virtual_width, real_height / virtual_height)
+        mode = self.mode
+        if mode == "integer":
+            if ratio >= 1:
+                ratio = int(ratio)
+            else:
+                mode = "smooth"  # a tela é menor que a virtual: não há múltiplo inteiro
+
+        self.rect = pg.Rect(0, 0, int(virtual_width * ratio), int(virtual_height * ratio))
+        self.rect.center = (real_width // 2, real_height // 2)
+
+        screen.fill((0, 0, 0))
+        destination = screen.subsurface(self.rect)
+
+        if self.rect.size == self._virtual_size:
+            # Escala 1: o jogo desenha direto na tela real
+            self._target = destination
+            self._scale = None
+        else:
+            self._target = self._virtual
+            self._scale = pg.transform.smoothscale if mode == "smooth" else pg.transform.scale
+            if mode == "smooth" and self._backend == "auto":
+                self._backend = pick_smoothscale_backend(self._virtual_size, self.rect.size)
+            elif mode == "smooth" and self._backend != pg.transform.get_smoothscale_backend():
+                pg.transform.set_smoothscale_backend(self._backend)
+        self._destination = destination
+        self._mode = mode
+        self.__configure_internal()
+
+        print(
+            f"[Presenter] {self._virtual_size[0]}x{self._virtual_size[1]} -> "
+            f"{self.rect.width}x{self.rect.height} "
+            f"({'passthrough' if self._scale is None else mode}"
+            f"{', ' + pg.transform.get_smoothscale_backend() if self._scale is pg.transform.smoothscale else ''})"
+        )
+
+    def __configure_internal(self):
+        """Escolhe o tamanho interno e aloca o buffer intermediário (se houver)."""
+        resolution = self._internal_resolution
+        if resolution == "native" or self._scale is None or self._mode == "integer":
+            size = self.rect.size
+        elif resolution == "logical":
+            size = self._virtual_size
+        else:
+            # Nunca maior que o destino
+            size = (min(resolution[0], self.rect.width), min(resolution[1], self.rect.height))
+        self._internal_size = size
+
+        if size not in (self.rect.size, self._virtual_size) and (
+            size[0] > self._virtual_size[0] or size[1] > self._virtual_size[1]
+        ):
+            print(
+                f"[Presenter] Resolução interna {size[0]}x{size[1]} fica entre a lógica "
+                f"e a nativa: custa quase o mesmo que \"native\" (use \"native\" ou \"logical\")"
+            )
+
+        if size in (self.rect.size, self._virtual_size):
+            self._internal = None
+        elif self._internal is None or self._internal.get_size() != size:
+            self._internal = pg.Surface(size)
+
+    def invalidate(self):
+        """Força recalcular a geometria (e limpar as barras) no próximo quadro."""
+        self._screen_size = None
+
+    def present(self, dirty=None):
+        """
+        Escala a tela virtual para a tela real (sem alocar superfícies).
+
+        Args:
+            dirty (list[pg.Rect] | None): Áreas da tela virtual que mudaram.
+                None escala o quadro inteiro.
+
+        Returns:
+            list[pg.Rect] | None: Áreas da tela real a atualizar
+            (pg.display.update); None quando a tela inteira mudou.
+        """
+        screen = pg.display.get_surface()
+        if screen is not self._screen or screen.get_size() != self._screen_size:
+            self.configure(screen)
+            dirty = None  # as barras foram limpas: apresenta tudo
+        if dirty is not None:
+            return self.__present_rects(dirty)
+        if self._scale is None:
+            return None
+        if self._internal_size == self.rect.size:
+            self._scale(self._virtual, self.rect.size, self._destination)
+        elif self._internal is None:
+            # Resolução lógica: só a ampliação final
+            pg.transform.scale(self._virtual, self.rect.size, self._destination)
+        else:
+            self._scale(self._virtual, self._internal_size, self._internal)
+            pg.transform.scale(self._internal, self.rect.size, self._destination)
+        return None
+
+    def __present_rects(self, dirty):
+        """
+        Escala só as áreas alteradas, cada uma para a área correspondente da
+        tela. As áreas são alinhadas à grade em que a escala leva pixels
+        inteiros em pixels inteiros, então o resultado é idêntico ao do
+        quadro inteiro. Ampliação suavizada ou com resolução interna
+        intermediária não tem esse alinhamento: nesses casos apresenta o
+        quadro inteiro.
+        """
+        offset = self.rect.topleft
+        if self._scale is None:
+            return [pg.Rect(rect).move(offset) for rect in dirty]
+
+        virtual_width, virtual_height = self._virtual_size
+        dest_width, dest_height = self.rect.size
+        if self._internal_size == self.rect.size:
+            scale = self._scale
+            if scale is pg.transform.smoothscale and (
+                dest_width > virtual_width or dest_height > virtual_height
+            ):
+                return self.present()
+        elif self._internal is None:
+            scale = pg.transform.scale  # resolução lógica
+        else:
+            return self.present()
+
+        grid_x = virtual_width // math.gcd(virtual_width, dest_width)
+        grid_y = virtual_height // math.gcd(virtual_height, dest_height)
+
+        updated = []
+        for rect in dirty:
+            left = rect.left // grid_x * grid_x
+            top = rect.top // grid_y * grid_y
+            right = min(-(-rect.right // grid_x) * grid_x, virtual_width)
+            bottom = min(-(-rect.bottom // grid_y) * grid_y, virtual_height)
+            if left >= right or top >= bottom:
+                continue
+            source = pg.Rect(left, top, right - left, bottom - top)
+            target = pg.Rect(
+                left * dest_width // virtual_width,
+                top * dest_height // virtual_height,
+                (right - left) * dest_width // virtual_width,
+                (bottom - top) * dest_height // virtual_height,
+            )
+            scale(self._virtual.subsurface(source), target.size, self._destination.subsurface(target))
+            updated.append(target.move(offset))
+        return updated
+
+
+class DynamicResolution:
+    """
+    Ajuste automático da resolução interna do Presenter pelo tempo de
+    quadro: desce um degrau quando a média passa do orçamento e sobe de
+    novo quando sobra folga. Cada troca espera 'cooldown' quadros para a
+    média refletir a nova resolução.
+
+    Com os degraus padrão ("native" e "logical") isso troca a qualidade
+    da escala por velocidade (smoothscale até a tela ou ampliação por
+    vizinho mais próximo a partir da resolução lógica). A cena continua
+    desenhada na resolução lógica nos dois casos.
+
+    Ao descer, mede quanto o degrau economizou; só volta a subir quando a
+    média atual mais essa economia cabe no orçamento (evita ficar
+    alternando entre dois degraus).
+    """
+
+    def __init__(
+        self,
+        presenter: Presenter,
+        budget_ms: float,
+        levels=INTERNAL_RESOLUTIONS,
+        window: int = 30,
+        headroom: float = 0.9,
+        cooldown: int = 120,
+    ):
+        """
+        Args:
+            presenter (Presenter): Etapa de apresentação a ajustar.
+            budget_ms (float): Orçamento de um quadro (ex: 1000 / FPS).
+            levels (list): Resoluções internas, da melhor para a mais barata.
+            window (int): Quadros na média do tempo de quadro.
+            headroom (float): Fração do orçamento que o custo previsto do
+                degrau de cima precisa respeitar para subir.
+            cooldown (int): Quadros de espera após cada troca.
+        """
+        self._presenter = presenter
+        self._budget = budget_ms
+        self._levels = list(levels)
+        self._window = window
+        self._headroom = headroom
+        self._cooldown = cooldown
+        self._samples = []
+        self._wait = 0
+        # Economia medida (ms) ao descer de cada degrau
+        self._savings = {}
+        self._dropped = None  # (degrau de origem, média antes de descer)
+        current = presenter.internal_resolution
+        self.level = self._levels.index(current) if current in self._levels else 0
+        presenter.set_internal_resolution(self._levels[self.level])
+
+    def update(self, frame_ms: float):
+        """
+        Registra o tempo de trabalho do quadro (sem a espera do clock) e
+        troca a resolução interna quando necessário.
+        """
+        if self._wait > 0:
+            self._wait -= 1
+            return
+        self._samples.append(frame_ms)
+        if len(self._samples) < self._window:
+            return
+
+        average = sum(self._samples) / len(self._samples)
+        self._samples.clear()
+        if self._dropped is not None:
+            level, before = self._dropped
+            self._savings[level] = max(before - average, 0.0)
+            self._dropped = None
+
+        if average > self._budget and self.level < len(self._levels) - 1:
+            self._dropped = (self.level, average)
+            self.__set_level(self.level + 1, average)
+        elif self.level > 0:
+            predicted = average + self._savings.get(self.level - 1, 0.0)
+            if predicted < self._budget * self._headroom:
+                self.__set_level(self.level - 1, average)
+
+    def __set_level(self, level: int, average: float):
+        self.level = level
+        self._wait = self._cooldown
+        self._presenter.set_internal_resolution(self._levels[level])
+        print(
+            f"[DynamicResolution] quadro médio {average:.1f} ms "
+            f"(orçamento {self._budget:.1f} ms) -> resolução interna {self._levels[level]}"
+        )
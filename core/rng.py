@@ -0,0 +1,51 @@
+import random
+
+# Fluxos independentes de cada cena
+RNG_STREAMS = ("spawn", "movement", "powerups")
+
+
+class SceneRandom:
+    """
+    Gerador de números aleatórios de uma cena, dividido em fluxos
+    independentes ('spawn', 'movement' e 'powerups'). Cada fluxo é um
+    random.Random semeado a partir de (semente, cena, fluxo): com a mesma
+    semente a cena gera exatamente a mesma sequência, e sortear mais num
+    fluxo (ex: um inimigo novo) não altera os outros.
+    """
+
+    def __init__(self, seed: int | None = None, scene: str = ""):
+        """
+        Args:
+            seed (int | None): Semente da partida. None sorteia uma nova
+                (disponível depois em 'seed' para repetir a partida).
+            scene (str): Chave da cena (cenas diferentes recebem sequências
+                diferentes com a mesma semente).
+        """
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.scene = scene
+        for name in RNG_STREAMS:
+            setattr(self, name, random.Random(f"{seed}:{scene}:{name}"))
+
+    def getstate(self) -> dict:
+        """Estado de todos os fluxos (para salvar e restaurar com setstate)."""
+        return {name: getattr(self, name).getstate() for name in RNG_STREAMS}
+
+    def setstate(self, state: dict):
+        for name in RNG_STREAMS:
+            getattr(self, name).setstate(state[name])
+
+
+_shared = None
+
+
+def shared_random() -> SceneRandom:
+    """
+    Gerador sem semente fixa para entidades criadas fora de uma cena (sem
+    um SceneRandom próprio). Criado uma única vez.
+    """
+    global _shared
+    if _shared is None:
+        _shared = SceneRandom()
+    return _shared
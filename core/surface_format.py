@@ -0,0 +1,149 @@
+import pygame as pg
+
+# Cores candidatas a colorkey, na ordem de preferência
+COLORKEY_CANDIDATES = [(255, 0, 255), (0, 255, 255), (1, 2, 3), (254, 1, 253)]
+
+SURFACE_FORMATS = ("opaque", "colorkey", "alpha")
+
+# Relatório por asset: caminho -> {"opaque": n, "colorkey": n, "alpha": n}
+_format_report = {}
+
+
+def classify_surface(surface: pg.Surface) -> str:
+    """
+    Classifica uma superfície com alpha por pixel pela transparência:
+    - "opaque": nenhum pixel transparente;
+    - "colorkey": cada pixel é totalmente opaco ou totalmente transparente;
+    - "alpha": há pixels semitransparentes.
+    """
+    if not surface.get_flags() & pg.SRCALPHA:
+        return "colorkey" if surface.get_colorkey() is not None else "opaque"
+
+    area = surface.get_width() * surface.get_height()
+    solid = pg.mask.from_surface(surface, 254).count()
+    if solid == area:
+        return "opaque"
+
+    visible = pg.mask.from_surface(surface, 0).count()
+    return "colorkey" if visible == solid else "alpha"
+
+
+def _free_colorkey(surface: pg.Surface):
+    """Escolhe uma cor que não aparece em nenhum pixel visível da superfície."""
+    for color in COLORKEY_CANDIDATES:
+        used = pg.mask.from_threshold(surface, (*color, 255), (1, 1, 1, 1)).count()
+        if used == 0:
+            return color
+    return None
+
+
+def optimize_surface(surface: pg.Surface, source: str) -> pg.Surface:
+    """
+    Converte a superfície para o formato mais rápido de desenhar:
+    - totalmente opaca: formato opaco da tela (blit sem mistura de alpha);
+    - transparência binária: formato opaco com colorkey;
+    - com pixels semitransparentes: mantém o alpha por pixel.
+    O caminho escolhido é registrado no relatório (surface_format_report).
+
+    Args:
+        surface (pg.Surface): Superfície já convertida com convert_alpha().
+        source (str): Caminho do asset (chave do relatório).
+
+    Returns:
+        pg.Surface: A própria superfície (alpha) ou uma nova, convertida.
+    """
+    kind = classify_surface(surface)
+
+    if surface.get_flags() & pg.SRCALPHA:
+        if kind == "opaque":
+            surface = surface.convert()
+        elif kind == "colorkey":
+            color = _free_colorkey(surface)
+            if color is None:
+                kind = "alpha"
+            else:
+                keyed = pg.Surface(surface.get_size()).convert()
+                keyed.fill(color)
+                keyed.blit(surface, (0, 0))
+                keyed.set_colorkey(color)
+                surface = keyed
+
+    stats = _format_report.setdefault(source, dict.fromkeys(SURFACE_FORMATS, 0))
+    stats[kind] += 1
+    return surface
+
+
+def surface_format_report() -> dict:
+    """
+    Retorna, por asset, quantas superfícies ficaram opacas, com colorkey
+    ou com alpha por pixel.
+    """
+    return {source: dict(stats) for source, stats in _format_report.items()}
+
+
+# Fração mínima de pixels transparentes para o modo "auto" usar RLE
+RLE_AUTO_THRESHOLD = 0.25
+
+
+def transparency_ratio(surface: pg.Surface) -> float:
+    """Fração dos pixels da superfície que são transparentes (0.0 a 1.0)."""
+    area = surface.get_width() * surface.get_height()
+    if area == 0:
+        return 0.0
+    return 1.0 - pg.mask.from_surface(surface).count() / area
+
+
+def rle_accelerate(surface: pg.Surface) -> bool:
+    """
+    Marca a superfície para ser codificada em RLE (o SDL codifica no
+    primeiro blit). Só vale para superfícies com colorkey ou alpha por
+    pixel. Retorna True se a superfície foi marcada.
+    """
+    colorkey = surface.get_colorkey()
+    if colorkey is not None:
+        surface.set_colorkey(colorkey, pg.RLEACCEL)
+        return True
+    if surface.get_flags() & pg.SRCALPHA:
+        surface.set_alpha(255, pg.RLEACCEL)
+        return True
+    return False
+
+
+def rle_clear(surface: pg.Surface):
+    """Desliga a codificação RLE da superfície."""
+    colorkey = surface.get_colorkey()
+    if colorkey is not None:
+        surface.set_colorkey(colorkey)
+    elif surface.get_flags() & pg.SRCALPHA:
+        surface.set_alpha(255)
+
+
+def is_rle(surface: pg.Surface) -> bool:
+    """Indica se a superfície foi marcada para RLE."""
+    return bool(surface.get_flags() & (pg.RLEACCEL | pg.RLEACCELOK))
+
+
+def apply_rle(frames: list, mode, threshold: float = RLE_AUTO_THRESHOLD) -> int:
+    """
+    Aplica RLE aos frames de uma spritesheet conforme a flag "rle" do JSON:
+    - True: todos os frames;
+    - "auto": só os frames com pelo menos 'threshold' de transparência;
+    - False: nenhum (desliga também o RLE que o pygame liga sozinho ao
+      redimensionar superfícies com colorkey);
+    - None (flag ausente): mantém os frames como estão.
+    As máscaras de colisão devem ser calculadas antes (travar uma
+    superfície RLE para ler os pixels desfaz a codificação).
+
+    Returns:
+        int: Quantos frames ficaram marcados para RLE.
+    """
+    if mode is None:
+        return sum(is_rle(frame) for frame in frames)
+
+    count = 0
+    for frame in frames:
+        if mode is True or (mode == "auto" and transparency_ratio(frame) >= threshold):
+            count += rle_accelerate(frame)
+        else:
+            rle_clear(frame)
+    return count
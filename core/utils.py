@@ -39,3 +39,71 @@ def load_image(path, convert_alpha=True):
         surface = pg.Surface((50, 50), pg.SRCALPHA)
         surface.fill((255, 0, 255))  # Magenta para indicar erro
         return surface
+
+
+def find_spritesheets(config) -> list[tuple[str, str]]:
+    """
+    Percorre uma configuração (dict/list aninhados) e retorna os pares
+    (imagem, json) de todas as spritesheets referenciadas, sem repetição.
+    """
+    pairs = []
+
+    def collect(node):
+        if isinstance(node, dict):
+            if "image" in node and "data" in node:
+                pair = (node["image"], node["data"])
+                if pair not in pairs:
+                    pairs.append(pair)
+            for value in node.values():
+                collect(value)
+        elif isinstance(node, list):
+            for value in node:
+                collect(value)
+
+    collect(config)
+    return pairs
+
+
+def find_sounds(config) -> list[str]:
+    """
+    Percorre uma configuração (dict/list aninhados) e retorna os caminhos
+    de todos os sons referenciados pela chave "sound", sem repetição.
+    """
+    sounds = []
+
+    def collect(node):
+        if isinstance(node, dict):
+            sound = node.get("sound")
+            if isinstance(sound, str) and sound not in sounds:
+                sounds.append(sound)
+            for value in node.values():
+                collect(value)
+        elif isinstance(node, list):
+            for value in node:
+                collect(value)
+
+    collect(config)
+    return sounds
+
+
+def find_images(config) -> list[str]:
+    """
+    Percorre uma configuração (dict/list aninhados) e retorna os caminhos
+    das imagens avulsas (chave "image" sem "data", ex: fundos de menu),
+    sem repetição.
+    """
+    images = []
+
+    def collect(node):
+        if isinstance(node, dict):
+            image = node.get("image")
+            if isinstance(image, str) and "data" not in node and image not in images:
+                images.append(image)
+            for value in node.values():
+                collect(value)
+        elif isinstance(node, list):
+            for value in node:
+                collect(value)
+
+    collect(config)
+    return images
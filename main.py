@@ -1,17 +1,59 @@
 import pygame as pg
-from config import FPS
-from core import GameState
+from config import FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+from core import GameState, AssetCache, AssetWarmup, Presenter, DynamicResolution, InputReplay, load_json
+import argparse
 import sys
+import time
+
+# Espera máxima (ms) por uma entrada enquanto um menu estático está na tela
+IDLE_WAIT_MS = 250
+
+def draw_splash(screen, done, total):
+    """Desenha a barra de progresso do carregamento inicial."""
+    pg.event.pump()  # Mantém a janela respondendo durante o carregamento
+    width, height = screen.get_size()
+    bar = pg.Rect(0, 0, width // 2, 20)
+    bar.center = (width // 2, height // 2)
+
+    screen.fill((0, 0, 0))
+    pg.draw.rect(screen, (255, 255, 255), bar, 2)
+    fill = bar.inflate(-8, -8)
+    fill.width = int(fill.width * done / max(total, 1))
+    pg.draw.rect(screen, (255, 255, 255), fill)
+    pg.display.flip()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Flappy Pantaneiro")
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Semente dos geradores aleatórios das cenas (partidas reproduzíveis).",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="ARQUIVO",
+        default=None,
+        help="Grava as ações do jogador de cada partida (.gz para comprimir).",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="ARQUIVO",
+        default=None,
+        help="Repete uma partida gravada com --record, sem teclado.",
+    )
+    return parser.parse_args(argv)
 
 def main():
     """Função principal do jogo."""
+    args = parse_args()
     pg.init()
     pg.mixer.init()  # Inicializa o mixer de som
     pg.display.set_caption("Flappy Pantaneiro")
 
-    # 1. Defina a resolução para a qual seu jogo foi projetado.
-    # Esta será sua "tela virtual".
-    VIRTUAL_WIDTH, VIRTUAL_HEIGHT = 1080, 700
+    # 1. Resolução lógica para a qual o jogo foi projetado (a mesma usada
+    # pelas cenas em config.py). Esta será sua "tela virtual".
+    VIRTUAL_WIDTH, VIRTUAL_HEIGHT = SCREEN_WIDTH, SCREEN_HEIGHT
 
     # Carrega a música de fundo
     pg.mixer.music.load("songs/menus/trilha_sonora.mp3")
@@ -21,42 +63,85 @@ def main():
 
     # 2. Crie a tela real em modo tela cheia para detectar o tamanho do monitor.
     screen = pg.display.set_mode((0, 0), pg.FULLSCREEN)
-    REAL_WIDTH, REAL_HEIGHT = screen.get_size()
 
-    # 3. Crie a superfície virtual onde TODO o jogo será desenhado.
-    game_surface = pg.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
-
-    # 4. Calcule a escala para manter a proporção (letterboxing).
-    scale_ratio = min(REAL_WIDTH / VIRTUAL_WIDTH, REAL_HEIGHT / VIRTUAL_HEIGHT)
-    scaled_width = int(VIRTUAL_WIDTH * scale_ratio)
-    scaled_height = int(VIRTUAL_HEIGHT * scale_ratio)
-    
-    offset_x = (REAL_WIDTH - scaled_width) // 2
-    offset_y = (REAL_HEIGHT - scaled_height) // 2
+    game_config = load_json("config/game_config.json")
+
+    # 3. Crie a etapa de apresentação: a superfície virtual onde TODO o jogo
+    # será desenhado e a escala dela para a tela real, mantendo a proporção
+    # (letterboxing).
+    display_cfg = game_config.get("display", {})
+    internal_resolution = display_cfg.get("internal_resolution", "native")
+    presenter = Presenter(
+        screen,
+        (VIRTUAL_WIDTH, VIRTUAL_HEIGHT),
+        mode=display_cfg.get("scale_mode", "smooth"),
+        backend=display_cfg.get("smoothscale_backend", "auto"),
+        internal_resolution="native" if internal_resolution == "auto" else internal_resolution,
+    )
+    dynamic_resolution = None
+    if internal_resolution == "auto":
+        # Baixa a resolução interna quando o quadro passa do orçamento
+        budget_ms = display_cfg.get("frame_budget_ms") or 1000 / FPS
+        dynamic_resolution = DynamicResolution(presenter, budget_ms)
+
+    # 4. Aquece o cache de assets (imagens e sons) antes do primeiro quadro.
+    assets_cfg = game_config.get("assets", {})
+    budget_mb = assets_cfg.get("memory_budget_mb")
+    if budget_mb:
+        AssetCache().set_budget(int(budget_mb * 1024 * 1024))
+    if assets_cfg.get("warmup", False):
+        warmup = AssetWarmup(workers=assets_cfg.get("warmup_workers"))
+        warmup.run(progress=lambda done, total, key: draw_splash(screen, done, total))
+        presenter.invalidate()  # a tela de carregamento pintou por cima das barras
 
     clock = pg.time.Clock()
 
-    game_state = GameState(game_surface)
+    # Simulação em passo fixo, independente da taxa de quadros
+    simulation_cfg = game_config.get("simulation", {})
+    game_state = GameState(
+        presenter.surface,
+        tick_rate=simulation_cfg.get("tick_rate", FPS),
+        max_catchup_steps=simulation_cfg.get("max_catchup_steps", 5),
+        seed=args.seed,
+        motion_engine=simulation_cfg.get("motion_engine", "python"),
+    )
+    if args.record:
+        game_state.start_recording(args.record)
+    if args.replay:
+        game_state.start_replay(InputReplay.load(args.replay))
 
     running = True
     while running:
-        for event in pg.event.get():
+        if game_state.is_idle():
+            # Nada muda até chegar uma entrada: bloqueia em vez de girar a 60 FPS
+            event = pg.event.wait(IDLE_WAIT_MS)
+            events = [event, *pg.event.get()] if event.type != pg.NOEVENT else []
+        else:
+            events = pg.event.get()
+
+        frame_start = time.perf_counter()
+        for event in events:
             if event.type == pg.QUIT or (event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE):
                 running = False
             running = game_state.handle_event(event)
 
         game_state.update()
 
-        game_state.render(game_surface) # O método render agora desenha em 'game_surface'.
-
-        scaled_surface = pg.transform.smoothscale(game_surface, (scaled_width, scaled_height))
-        
-        screen.fill((0, 0, 0)) # Fundo preto para as "barras"
-        screen.blit(scaled_surface, (offset_x, offset_y))
-
-        pg.display.flip()
+        # O método render desenha na tela virtual e diz o que mudou
+        dirty = game_state.render(presenter.surface)
+
+        # Quadro sem mudanças: nada a compor nem apresentar
+        if dirty is None or dirty:
+            updated = presenter.present(dirty)
+            if updated is None:
+                pg.display.flip()
+            else:
+                pg.display.update(updated)
+            if dynamic_resolution is not None and dirty is None:
+                dynamic_resolution.update((time.perf_counter() - frame_start) * 1000)
         clock.tick(FPS)
 
+    game_state.stop_recording()  # salva a partida interrompida pelo fechamento
     pg.quit()
     sys.exit()
 
@@ -3,3 +3,6 @@ from .scene_select import SceneSelectMenu
 from .high_scores import HighScoresMenu
 from .pause import PauseMenu
 from .game_over import GameOverMenu
+
+# Menus cujos ASSETS entram no warm-up de inicialização
+MENUS = [MainMenu, SceneSelectMenu, HighScoresMenu, PauseMenu, GameOverMenu]
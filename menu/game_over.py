@@ -1,32 +1,42 @@
 import pygame as pg
-import json
-from core import State, GameState, BaseMenu, FontManager, Button
+from core import State, GameState, BaseMenu, FontManager, Button, AssetCache
 
 
 class GameOverMenu(BaseMenu):
+    # Assets do menu (também listados pelo warm-up de inicialização)
+    ASSETS = {
+        "background": {"image": "assets/images/menus/GameOver/fundo_gameOver_sheet.png"},
+        "buttons": {
+            "image": "assets/images/menus/GameOver/gameOver_sheet.png",
+            "data": "assets/images/menus/GameOver/gameOver.json",
+        },
+        "distancia": {
+            "image": "assets/images/menus/GameOver/distancia_sheet.png",
+            "data": "assets/images/menus/GameOver/distancia.json",
+        },
+        "choice": {"sound": "songs/menus/choice.mp3"},
+        "selected": {"sound": "songs/menus/selected.mp3"},
+        "death": {"sound": "songs/menus/gameOver.mp3"},
+    }
+
     def __init__(self, game_state: GameState, scene):
         super().__init__(game_state)
+        cache = AssetCache()
 
         self.font_manager = FontManager()
         self.font_title = self.font_manager.load_font(None, 74)
 
         # Carregar a imagem de fundo do menu GameOver diretamente
-        self.background_image = pg.image.load("assets/images/menus/GameOver/fundo_gameOver_sheet.png").convert_alpha()
+        self.background_image = cache.get_image(self.ASSETS["background"]["image"])
         self.background_rect = self.background_image.get_rect(center=(self._game_state.screen.get_width() // 2, self._game_state.screen.get_height() // 2))
 
-        # Botões normais
-        self.buttons_sheet = pg.image.load("assets/images/menus/GameOver/gameOver_sheet.png").convert_alpha()
-        with open("assets/images/menus/GameOver/gameOver.json", 'r') as f:
-            self.buttons_data = json.load(f)
-
-        # Quadro da distância
-        self.distancia_sheet = pg.image.load("assets/images/menus/GameOver/distancia_sheet.png").convert_alpha()
-        with open("assets/images/menus/GameOver/distancia.json", 'r') as f:
-            self.distancia_data = json.load(f)
-
         # Estrair as sprites dos botões e do quadro de distância
-        self.button_sprites = self._load_sprites(self.buttons_sheet, self.buttons_data)
-        self.distancia_sprite = self._load_sprites(self.distancia_sheet, self.distancia_data).get("button_distancia")
+        buttons = self.ASSETS["buttons"]
+        self.button_sprites = cache.get_sprites(buttons["image"], buttons["data"])
+        distancia = self.ASSETS["distancia"]
+        self.distancia_sprite = cache.get_sprites(
+            distancia["image"], distancia["data"]
+        ).get("button_distancia")
 
         self._options = [
             ("", self.__retry_scene),
@@ -42,30 +52,13 @@ class GameOverMenu(BaseMenu):
         self.score_manager.check_high_score()
 
         # SONS
-        self.sound_choice = pg.mixer.Sound("songs/menus/choice.mp3")  # Pré carrega o som de efeito de escolha
-        self.sound_selected = pg.mixer.Sound("songs/menus/selected.mp3")  # Pré carrega o som de efeito selecionado
+        self.sound_choice = cache.get_sound(self.ASSETS["choice"]["sound"])  # Pré carrega o som de efeito de escolha
+        self.sound_selected = cache.get_sound(self.ASSETS["selected"]["sound"])  # Pré carrega o som de efeito selecionado
         # Para a música e toca o som de game over
         pg.mixer.music.stop()
-        self.death_sound = pg.mixer.Sound("songs/menus/gameOver.mp3")
+        self.death_sound = cache.get_sound(self.ASSETS["death"]["sound"])
         self.death_sound.play()
 
-    def _load_sprites(self, sheet, data):
-        sprites = {}
-        for anim_data in data.get("animations", []):
-            anim_name = anim_data["name"]
-            frames = []
-            for frame_rect in anim_data["frames_rect"]:
-                x, y, w, h = frame_rect
-                frame = pg.Surface((w, h), pg.SRCALPHA)
-                frame.blit(sheet, (0, 0), (x, y, w, h))
-                
-                target_size = data.get("target_size")
-                if target_size:
-                    frame = pg.transform.scale(frame, target_size)
-                frames.append(frame)
-            sprites[anim_name] = frames[0] if frames else None 
-        return sprites
-
     def _create_buttons_with_sprites(self):
         if self._options:
             screen_center_x = self._game_state.screen.get_width() // 2
@@ -120,11 +113,13 @@ class GameOverMenu(BaseMenu):
             if btn['selected']:
                 current_idx = i
                 btn['selected'] = False
+                self.invalidate(btn['rect'])
                 break
         
         if current_idx != -1:
             new_idx = (current_idx + direction) % len(self._custom_buttons)
             self._custom_buttons[new_idx]['selected'] = True
+            self.invalidate(self._custom_buttons[new_idx]['rect'])
             self.sound_choice.play()  # Toca o som de escolha sempre que muda de botão
 
     def __retry_scene(self):
@@ -1,5 +1,5 @@
 import pygame as pg
-from core import State, GameState, ScoreManager, FontManager, BaseMenu
+from core import State, GameState, ScoreManager, FontManager, BaseMenu, AssetCache
 
 # =========== adicionado para joystick
 pg.joystick.init()
@@ -12,8 +12,15 @@ else:
 # ====================================
 
 class HighScoresMenu(BaseMenu):
+    # Assets do menu (também listados pelo warm-up de inicialização)
+    ASSETS = {
+        "background": {"image": "assets/images/menus/Scores/fundo_scores_sheet.png"},
+        "selected": {"sound": "songs/menus/selected.mp3"},
+    }
+
     def __init__(self, game_state: GameState):
         super().__init__(game_state)
+        cache = AssetCache()
 
         self.font_manager = FontManager()
         self.font_score = self.font_manager.load_font(None, 45)
@@ -21,7 +28,7 @@ class HighScoresMenu(BaseMenu):
         self.scores = ScoreManager().high_scores
 
         # Carregar fundo do HighScores (apenas uma imagem estática)
-        self.background = pg.image.load("assets/images/menus/Scores/fundo_scores_sheet.png").convert_alpha()
+        self.background = cache.get_image(self.ASSETS["background"]["image"])
         self.background_rect = self.background.get_rect(center=(
             self._game_state.screen.get_width() // 2,
             self._game_state.screen.get_height() // 2
@@ -29,7 +36,7 @@ class HighScoresMenu(BaseMenu):
 
                 # --- Controle de música ---
         # salvar posição da trilha sonora antes de pausar
-        self.sound_selected = pg.mixer.Sound("songs/menus/selected.mp3")  # Pré carrega o som de efeito selecionado
+        self.sound_selected = cache.get_sound(self.ASSETS["selected"]["sound"])  # Pré carrega o som de efeito selecionado
         self.music_pos = pg.mixer.music.get_pos() / 1000.0  # posição em segundos
         pg.mixer.music.pause()
         # tocar música calma em loop infinito
@@ -1,26 +1,33 @@
 import pygame as pg
-import json
-from core import State, GameState, BaseMenu
+from core import State, GameState, BaseMenu, AssetCache
 
 
 class PauseMenu(BaseMenu):
+    # Assets do menu (também listados pelo warm-up de inicialização)
+    ASSETS = {
+        "background": {"image": "assets/images/menus/Pause/fundo_pause_sheet.png"},
+        "buttons": {
+            "image": "assets/images/menus/Pause/pause_sheet.png",
+            "data": "assets/images/menus/Pause/pause.json",
+        },
+        "selected": {"sound": "songs/menus/selected.mp3"},
+        "choice": {"sound": "songs/menus/choice.mp3"},
+    }
+
     def __init__(self, game_state: GameState):
         super().__init__(game_state)
+        cache = AssetCache()
 
-        # Carregar a imagem de fundo do menu Pause
-        self.background_image = pg.image.load("assets/images/menus/Pause/fundo_pause_sheet.png").convert_alpha()
+        # Carregar a imagem de fundo do menu Pause (em cache)
+        self.background_image = cache.get_image(self.ASSETS["background"]["image"])
         self.background_rect = self.background_image.get_rect(center=(
             self._game_state.screen.get_width() // 2,
             self._game_state.screen.get_height() // 2
         ))
 
-        # Carregar spritesheet e JSON dos botões
-        self.button_sheet = pg.image.load("assets/images/menus/Pause/pause_sheet.png").convert_alpha()
-        with open("assets/images/menus/Pause/pause.json", 'r') as f:
-            self.button_data = json.load(f)
-
-        # Extrair sprites dos botões
-        self.button_sprites = self._load_button_sprites()
+        # Extrair sprites dos botões da spritesheet
+        buttons = self.ASSETS["buttons"]
+        self.button_sprites = cache.get_sprites(buttons["image"], buttons["data"])
 
         # Opções do menu
         self._options = [
@@ -30,29 +37,11 @@ class PauseMenu(BaseMenu):
         self._create_buttons_with_sprites()
 
         # Sons
-        self.sound_selected = pg.mixer.Sound("songs/menus/selected.mp3")  # som de confirmação
-        self.sound_choice = pg.mixer.Sound("songs/menus/choice.mp3")      # som de navegação
+        self.sound_selected = cache.get_sound(self.ASSETS["selected"]["sound"])  # som de confirmação
+        self.sound_choice = cache.get_sound(self.ASSETS["choice"]["sound"])      # som de navegação
 
         pg.mixer.music.pause()   # música pausa ao abrir o Pause
 
-    def _load_button_sprites(self):
-        sprites = {}
-        for anim_data in self.button_data.get("animations", []):
-            anim_name = anim_data["name"]
-            frames = []
-            for frame_rect in anim_data["frames_rect"]:
-                x, y, w, h = frame_rect
-                frame = pg.Surface((w, h), pg.SRCALPHA)
-                frame.blit(self.button_sheet, (0, 0), (x, y, w, h))
-
-                target_size = self.button_data.get("target_size")
-                if target_size:
-                    frame = pg.transform.scale(frame, target_size)
-                frames.append(frame)
-
-            sprites[anim_name] = frames[0] if frames else None
-        return sprites
-
     def _create_buttons_with_sprites(self):
         if not self._options:
             return
@@ -105,11 +94,13 @@ class PauseMenu(BaseMenu):
             if btn['selected']:
                 current_idx = i
                 btn['selected'] = False
+                self.invalidate(btn['rect'])
                 break
 
         if current_idx != -1:
             new_idx = (current_idx + direction) % len(self._custom_buttons)
             self._custom_buttons[new_idx]['selected'] = True
+            self.invalidate(self._custom_buttons[new_idx]['rect'])
             self.sound_choice.play()  # toca som ao navegar
 
     def __resume_game(self):
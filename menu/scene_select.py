@@ -1,6 +1,5 @@
 import pygame as pg
-import json
-from core import State, GameState, BaseMenu
+from core import State, GameState, BaseMenu, AssetCache, AssetPreloader
 
 # =========== adicionado para joystick
 pg.joystick.init()
@@ -13,22 +12,34 @@ else:
 # ====================================
 
 class SceneSelectMenu(BaseMenu):
+    # Cena correspondente a cada botão, na ordem do menu
+    SCENE_KEYS = ["forest", "water", "sky"]
+
+    # Assets do menu (também listados pelo warm-up de inicialização)
+    ASSETS = {
+        "background": {"image": "assets/images/menus/SelectedGame/fundo_selectedGame_sheet.png"},
+        "buttons": {
+            "image": "assets/images/menus/SelectedGame/selectedGame_sheet.png",
+            "data": "assets/images/menus/SelectedGame/selectedGame.json",
+        },
+        "selected": {"sound": "songs/menus/selected.mp3"},
+        "navigate": {"sound": "songs/menus/choice.mp3"},
+    }
+
     def __init__(self, game_state: GameState):
         super().__init__(game_state)
+        cache = AssetCache()
 
-        # Fundo do menu
-        self.background_image = pg.image.load("assets/images/menus/SelectedGame/fundo_selectedGame_sheet.png").convert_alpha()
+        # Fundo do menu (em cache)
+        self.background_image = cache.get_image(self.ASSETS["background"]["image"])
         self.background_rect = self.background_image.get_rect(center=(
             self._game_state.screen.get_width() // 2,
             self._game_state.screen.get_height() // 2
         ))
 
-        # Spritesheet e JSON dos botões
-        self.button_sheet = pg.image.load("assets/images/menus/SelectedGame/selectedGame_sheet.png").convert_alpha()
-        with open("assets/images/menus/SelectedGame/selectedGame.json", 'r') as f:
-            self.button_data = json.load(f)
-
-        self.button_sprites = self._load_button_sprites()
+        # Sprites dos botões (spritesheet + JSON)
+        buttons = self.ASSETS["buttons"]
+        self.button_sprites = cache.get_sprites(buttons["image"], buttons["data"])
 
         # Botões do menu
         self._options = [
@@ -39,25 +50,21 @@ class SceneSelectMenu(BaseMenu):
         self._create_buttons_with_sprites()
 
         # Sons
-        self.sound_selected = pg.mixer.Sound("songs/menus/selected.mp3")   # Som de confirmar
-        self.sound_navigate = pg.mixer.Sound("songs/menus/choice.mp3")   # Som de navegar
-
-    def _load_button_sprites(self):
-        sprites = {}
-        for anim_data in self.button_data.get("animations", []):
-            name = anim_data["name"]
-            frames = []
-            for rect in anim_data["frames_rect"]:
-                x, y, w, h = rect
-                frame = pg.Surface((w, h), pg.SRCALPHA)
-                frame.blit(self.button_sheet, (0, 0), (x, y, w, h))
-
-                target_size = self.button_data.get("target_size")
-                if target_size:
-                    frame = pg.transform.scale(frame, target_size)
-                frames.append(frame)
-            sprites[name] = frames[0] if frames else None
-        return sprites
+        self.sound_selected = cache.get_sound(self.ASSETS["selected"]["sound"])   # Som de confirmar
+        self.sound_navigate = cache.get_sound(self.ASSETS["navigate"]["sound"])   # Som de navegar
+
+        # Pré-carrega em segundo plano os assets da cena destacada
+        self._preloader = AssetPreloader()
+        self.__preload_highlighted()
+
+    def __preload_highlighted(self):
+        """Troca o pré-carregamento para a cena do botão destacado."""
+        current = self._current_button
+        if current is None:
+            return
+        idx = self._custom_buttons.index(current)
+        if idx < len(self.SCENE_KEYS):
+            self._preloader.request(self.SCENE_KEYS[idx])
 
     def _create_buttons_with_sprites(self):
         screen_center_x = self._game_state.screen.get_width() // 2
@@ -107,15 +114,22 @@ class SceneSelectMenu(BaseMenu):
             if btn['selected']:
                 idx = i
                 btn['selected'] = False
+                self.invalidate(btn['rect'])
                 break
 
         if idx != -1:
             new_idx = (idx + direction) % len(self._custom_buttons)
             self._custom_buttons[new_idx]['selected'] = True
+            self.invalidate(self._custom_buttons[new_idx]['rect'])
             # toca o som de navegação
             self.sound_navigate.play()
+            self.__preload_highlighted()
 
     def __select_scene(self, scene_number):
+        # Finaliza o que já foi decodificado e descarta o restante
+        self._preloader.poll(-1)
+        self._preloader.cancel()
+
         if scene_number == 1:
             self.sound_selected.play()
             self._game_state.change_state(State.PLAYING, "forest")
@@ -147,8 +161,12 @@ class SceneSelectMenu(BaseMenu):
             elif event.type == pg.JOYBUTTONDOWN:
                 self._select_option()
 
+    def is_busy(self) -> bool:
+        # Ainda finalizando o pré-carregamento da cena destacada
+        return self._preloader.scene_key is not None and not self._preloader.is_done
+
     def update(self, delta_time=None):
-        pass
+        self._preloader.poll()
 
     def render(self, screen):
         # Fundo
@@ -1,6 +1,6 @@
 import pygame as pg
-import random
-from core import Entity, EntityFactory
+from core import Entity, EntityFactory, AssetCache, SceneRandom, shared_random
+from core.motion_engine import STEERED
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 from .forest_player import ForestPlayer
 
@@ -26,12 +26,19 @@ class ForestEnemies(Entity):
 
         self.rect.center = (int(self._position.x), int(self._position.y))
 
+    def motion_params(self):
+        return {"kind": STEERED, "position": tuple(self._position), "velocity": tuple(self._velocity)}
+
     def update(self, delta_time: float):
         """
         Aplica o movimento e remove o inimigo se ele sair muito da tela.
         A lógica de como calcular a velocidade é deixada para as subclasses.
         """
         super().update(delta_time)
+        if self._motion is not None:
+            # O MotionEngine integra a velocidade decidida pela subclasse
+            self._motion.set_velocity(self._motion_slot, self._velocity)
+            return
 
         self._position += self._velocity * delta_time
         self.rect.center = (int(self._position.x), int(self._position.y))
@@ -45,10 +52,11 @@ class Cobra(ForestEnemies):
     Cobra que spawna no topo e cai na diagonal tentando acertar o jogador.
     """
 
-    def __init__(self, cfg, player_ref):
+    def __init__(self, cfg, player_ref, rng: SceneRandom | None = None):
         # Posição inicial
-        start_x = random.randint(350, SCREEN_WIDTH - 50)  
-        start_y = random.randint(0, 50)  # no topo da tela
+        rng = rng or shared_random()
+        start_x = rng.spawn.randint(350, SCREEN_WIDTH - 50)  
+        start_y = rng.spawn.randint(0, 50)  # no topo da tela
         super().__init__(cfg["cobra_cfg"], start_x, start_y, player_ref)
 
         # Velocidade
@@ -61,9 +69,14 @@ class Cobra(ForestEnemies):
             direction = direction.normalize()
         self._velocity = direction * self.speed
 
-        self.sound_cobra = pg.mixer.Sound("songs/forest/cobra.mp3")  # Carrega o som da cobra
+        self.sound_cobra = AssetCache().get_sound(cfg["cobra_cfg"]["sound"])  # Som da cobra (em cache)
         self.sound_cobra.play()  # toca o som da cobra ao spawnar
 
+    def motion_params(self):
+        # O update avança o movimento da classe base duas vezes por passo;
+        # fica no caminho em Python para o jogo ser o mesmo nos dois motores
+        return None
+
     def update(self, delta_time: float):
         # Apenas move na direção definida
         super().update(delta_time)
@@ -79,7 +92,7 @@ class Javali(ForestEnemies):
     JUMP_VELOCITY = -450
     GROUND_Y = SCREEN_HEIGHT - 25
 
-    def __init__(self, cfg, player_ref):
+    def __init__(self, cfg, player_ref, rng: SceneRandom | None = None):
         start_x = SCREEN_WIDTH + 50
         start_y = self.GROUND_Y
         super().__init__(cfg["javali_cfg"], start_x, start_y, player_ref)
@@ -102,7 +115,12 @@ class Javali(ForestEnemies):
 
         self.set_animation("run")
 
-        self.sound_javali = pg.mixer.Sound("songs/forest/javali.mp3")  # Carrega o som do javali
+        self.sound_javali = AssetCache().get_sound(cfg["javali_cfg"]["sound"])  # Som do javali (em cache)
+
+    def motion_params(self):
+        # Pulo e gravidade próprios, somados ao movimento da classe base
+        # (ForestEnemies.update): fica no caminho em Python
+        return None
 
     def update(self, delta_time: float):
         # Avança animações (Entity.update)
@@ -155,8 +173,8 @@ class Mosquito(ForestEnemies):
     levemente na vertical em direção ao jogador.
     """
 
-    def __init__(self, cfg, player_ref):
-        start_y = random.randint(50, SCREEN_HEIGHT - 50)
+    def __init__(self, cfg, player_ref, rng: SceneRandom | None = None):
+        start_y = (rng or shared_random()).spawn.randint(50, SCREEN_HEIGHT - 50)
         super().__init__(
             cfg["mosquito_cfg"], SCREEN_WIDTH + 50, start_y, player_ref
         )
@@ -170,7 +188,7 @@ class Mosquito(ForestEnemies):
         self._update_target_timer = 0.0
         self.reaction_time = 0.3
 
-        self.sound_mosquito = pg.mixer.Sound("songs/forest/mosquito.mp3")  # Carrega o som do mosquito
+        self.sound_mosquito = AssetCache().get_sound(cfg["mosquito_cfg"]["sound"])  # Som do mosquito (em cache)
         self.sound_mosquito.play()  # toca o som do mosquito ao spawnar
         
     def update(self, delta_time: float):
@@ -208,9 +226,12 @@ class ForestEnemySpawner:
     Gerencia a criação e o timing de spawn dos inimigos da ForestScene.
     """
 
-    def __init__(self, enemies_cfg: dict):
+    def __init__(self, enemies_cfg: dict, rng: SceneRandom | None = None, motion=None):
         self._config = enemies_cfg
-        self._factory = EntityFactory()
+        # Fluxos aleatórios da cena (sorteio e posição dos inimigos)
+        self._rng = rng or shared_random()
+        self._motion = motion  # MotionEngine da cena (None: movimento em Python)
+        self._factory = EntityFactory(self._rng.spawn)
         self._timer = (
             5.0  # Começa com um delay para não aparecer inimigos imediatamente
         )
@@ -231,6 +252,8 @@ class ForestEnemySpawner:
         if self._timer >= spawn_interval:
             self._timer = 0
             # Passa a configuração E a referência do jogador para o inimigo ser criado
-            return self._factory.create_random(self._config, player_ref=player_ref)
+            enemy = self._factory.create_random(self._config, player_ref=player_ref, rng=self._rng)
+            enemy.attach_motion(self._motion)
+            return enemy
 
         return None
@@ -1,6 +1,6 @@
 import pygame as pg
 from config import SCREEN_HEIGHT
-from core import Entity
+from core import Entity, AssetCache
 
 class ForestFogo(Entity):
     """
@@ -15,7 +15,7 @@ class ForestFogo(Entity):
         # Define a animação inicial como 'burn'
         self.set_animation("burn")
 
-        self.sound_fogo = pg.mixer.Sound("songs/forest/fogo.mp3")  # Carrega o som do fogo
+        self.sound_fogo = AssetCache().get_sound(fogo_cfg["sound"])  # Som do fogo (em cache)
         self.sound_fogo.play()  # toca o som do fogo
 
     def update(self, delta_time: float):
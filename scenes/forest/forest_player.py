@@ -1,6 +1,6 @@
 import pygame as pg
 from config import SCREEN_HEIGHT
-from core import Entity
+from core import Entity, AssetCache
 
 class ForestPlayer(Entity):
     def __init__(self, player_cfg: dict, invincible: bool = False):
@@ -26,7 +26,7 @@ class ForestPlayer(Entity):
         # Posicionamento do rect
         self.rect.center = (int(self.__position.x), int(self.__position.y))
 
-        self.sound_die = pg.mixer.Sound("songs/forest/macaco.mp3")  # Carrega o som da morte do macaco
+        self.sound_die = AssetCache().get_sound(player_cfg["sound"])  # Som da morte do macaco (em cache)
 
     @property
     def invincible(self):
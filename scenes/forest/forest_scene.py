@@ -6,6 +6,10 @@ from core import (
     CollisionManager,
     ScrollerManager,
     BackgroundManager,
+    FontManager,
+    BatchGroup,
+    SceneRandom,
+    create_motion_engine,
     load_json,
 )
 from .forest_player import ForestPlayer
@@ -25,14 +29,26 @@ class ForestScene:
         self.game_state = game_state
         self.config = load_json("./config/forest.json")
 
+        # Gerador aleatório da cena: mesma semente, mesma sequência de spawns
+        self.rng = SceneRandom(game_state.seed, "forest")
+
+        # Movimento vetorizado de obstáculos e inimigos (None: cada entidade se move)
+        self.motion = create_motion_engine(game_state.motion_engine)
+
         # Instanciar os gerenciadores
         self.scroll_manager = ScrollerManager(self.config["scroller_cfg"])
         self.background_manager = BackgroundManager(self.config["background_cfg"])
         self.score_manager = ScoreManager(self.config)
         self.collision_manager = CollisionManager()
 
+        # Texto da pontuação (só é renderizado de novo quando muda)
+        self.score_text = FontManager().cached_text(None, 36, (255, 255, 255))
+
         # Criar grupos de sprites
-        self.all_sprites_group = pg.sprite.Group()
+        self.all_sprites_group = BatchGroup()  # desenho em lote
+        # Fração entre os dois últimos passos no quadro sendo desenhado
+        # (definida pelo GameState antes de cada render)
+        self.interpolation = 1.0
         self.obstacles_group = pg.sprite.Group()
         self.enemies_group = pg.sprite.Group()
         self.player_group = pg.sprite.GroupSingle()
@@ -48,7 +64,15 @@ class ForestScene:
         self.all_sprites_group.add(self.fogo)
 
         # Instanciar o spawner de inimigos
-        self.enemy_spawner = ForestEnemySpawner(self.config["enemies_cfg"])
+        self.enemy_spawner = ForestEnemySpawner(self.config["enemies_cfg"], self.rng, self.motion)
+
+    def perform(self, action: str):
+        """
+        Aplica uma ação do jogador (ex: "start_thrust"). As entradas passam
+        por aqui para o GameState poder gravá-las (ou ignorá-las num replay).
+        """
+        if self.game_state.accept_action(action):
+            getattr(self.player, action)()
 
     def handle_event(self, event: pg.event.Event):
         """Processa eventos do Pygame.
@@ -58,18 +82,18 @@ class ForestScene:
         """
         if event.type == pg.KEYDOWN:
             if event.key == pg.K_UP:
-                self.player.start_thrust()
+                self.perform("start_thrust")
             elif event.key == pg.K_DOWN:
-                self.player.start_dive()
+                self.perform("start_dive")
             elif event.key == pg.K_ESCAPE:
                 self.game_state.change_state(State.PAUSE)
 
         # --- Eventos de Tecla Solta ---
         elif event.type == pg.KEYUP:
             if event.key == pg.K_UP:
-                self.player.stop_thrust()
+                self.perform("stop_thrust")
             elif event.key == pg.K_DOWN:
-                self.player.stop_dive()
+                self.perform("stop_dive")
 
         # =========== adicionado para joystick
 
@@ -78,16 +102,16 @@ class ForestScene:
             if event.axis == 1:
                 # Para cima (valor negativo)
                 if int(event.value) == -1:
-                    self.player.start_thrust()
-                    self.player.stop_dive() # Impede movimento simultâneo
+                    self.perform("start_thrust")
+                    self.perform("stop_dive") # Impede movimento simultâneo
                 # Para baixo (valor positivo)
                 elif int(event.value) == 1:
-                    self.player.start_dive()
-                    self.player.stop_thrust() # Impede movimento simultâneo
+                    self.perform("start_dive")
+                    self.perform("stop_thrust") # Impede movimento simultâneo
                 # Analógico no centro (zona morta)
                 else:
-                    self.player.stop_thrust()
-                    self.player.stop_dive()
+                    self.perform("stop_thrust")
+                    self.perform("stop_dive")
 
         # --- Adicional: Pausar com o botão do Joystick ---
         elif joystick != None and event.type == pg.JOYBUTTONDOWN:
@@ -112,13 +136,18 @@ class ForestScene:
         # Atualizar entidades (jogador, obstáculos e inimigos)
         self.player.update(delta_time)
         self.fogo.update(delta_time)   
-        self.obstacles_group.update(delta_time)
+        if self.motion is None:
+            self.obstacles_group.update(delta_time)
         self.enemies_group.update(delta_time)
+        if self.motion is not None:
+            # Movimento e animação dos obstáculos (e movimento dos inimigos)
+            self.motion.step(delta_time)
 
         # Verificar colisões
         if not self.player.invincible:
             if self.collision_manager.check_collision(
-                self.player_group, self.obstacles_group  # Player com obstáculos
+                self.player_group, self.obstacles_group,  # Player com obstáculos
+                self.motion.near(self.player.rect) if self.motion else None,
             ) or self.collision_manager.check_collision(
                 self.player_group, self.enemies_group  # Player com inimigos
             ):
@@ -144,10 +173,8 @@ class ForestScene:
         self.all_sprites_group.draw(screen)
 
         # Renderizar pontuação
-        font = pg.font.SysFont(None, 36)
-        score_text = font.render(
-            f"Distância: {self.score_manager.get_score()}", True, (255, 255, 255)
-        )
+        self.score_text.set(f"Distância: {self.score_manager.get_score()}")
+        score_text = self.score_text.surface
         # Obter as dimensões da tela
         screen_width, screen_height = screen.get_size()
 
@@ -1,11 +1,10 @@
 import pygame as pg
-import random
 import math  # Adiciona import do math
-from core import Entity
+from core import Entity, SceneRandom, shared_random
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class Coin(Entity):
-    def __init__(self):
+    def __init__(self, rng: SceneRandom | None = None):
         # Criar sprite simples da moeda
         coin_cfg = {
             "fallback_size": [32, 32],
@@ -13,7 +12,7 @@ class Coin(Entity):
         }
         
         x = SCREEN_WIDTH + 50
-        y = random.randint(50, SCREEN_HEIGHT - 150)
+        y = (rng or shared_random()).powerups.randint(50, SCREEN_HEIGHT - 150)
         
         super().__init__(coin_cfg, x, y)
         
@@ -48,7 +47,8 @@ class Coin(Entity):
                 self.kill()
 
 class CoinSpawner:
-    def __init__(self):
+    def __init__(self, rng: SceneRandom | None = None):
+        self._rng = rng
         self.timer = 0
         self.spawn_interval = 3.0  # A cada 3 segundos
     
@@ -56,5 +56,5 @@ class CoinSpawner:
         self.timer += delta_time
         if self.timer >= self.spawn_interval:
             self.timer = 0
-            return Coin()
+            return Coin(self._rng)
         return None
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pygame as pg
-import random
-from core import Entity, EntityFactory
+from core import Entity, EntityFactory, SceneRandom, shared_random, flip_variant
+from core.motion_engine import STEERED
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 from .player import SkyPlayer
 from .projectiles import Projectile
@@ -27,12 +27,19 @@ class Enemy(Entity):
 
         self.rect.center = (int(self._position.x), int(self._position.y))
 
+    def motion_params(self):
+        return {"kind": STEERED, "position": tuple(self._position), "velocity": tuple(self._velocity)}
+
     def update(self, delta_time: float):
         """
         Aplica o movimento e remove o inimigo se ele sair muito da tela.
         A lógica de como calcular a velocidade é deixada para as subclasses.
         """
         super().update(delta_time)
+        if self._motion is not None:
+            # O MotionEngine integra a velocidade decidida pela subclasse
+            self._motion.set_velocity(self._motion_slot, self._velocity)
+            return
 
         self._position += self._velocity * delta_time
         self.rect.center = (int(self._position.x), int(self._position.y))
@@ -48,8 +55,8 @@ class ChaserDrone(Enemy):
     levemente na vertical em direção ao jogador.
     """
 
-    def __init__(self, cfg, player_ref):
-        start_y = random.randint(50, SCREEN_HEIGHT - 50)
+    def __init__(self, cfg, player_ref, rng: SceneRandom | None = None):
+        start_y = (rng or shared_random()).spawn.randint(50, SCREEN_HEIGHT - 50)
         super().__init__(
             cfg["chaser_drone_cfg"], SCREEN_WIDTH + 50, start_y, player_ref
         )
@@ -95,9 +102,12 @@ class EnemySpawner:
     Gerencia a criação e o timing de spawn dos inimigos da DemoScene.
     """
 
-    def __init__(self, enemies_cfg: dict):
+    def __init__(self, enemies_cfg: dict, rng: SceneRandom | None = None, motion=None):
         self._config = enemies_cfg
-        self._factory = EntityFactory()
+        # Fluxos aleatórios da cena (sorteio e posição dos inimigos)
+        self._rng = rng or shared_random()
+        self._motion = motion  # MotionEngine da cena (None: movimento em Python)
+        self._factory = EntityFactory(self._rng.spawn)
         self._timer = (
             5.0  # Começa com um delay para não aparecer inimigos imediatamente
         )
@@ -116,10 +126,11 @@ class EnemySpawner:
         if self._timer >= spawn_interval:
             self._timer = 0
             # Passa a configuração E a referência do jogador para o inimigo ser criado
-            enemy = self._factory.create_random(self._config, player_ref=player_ref)
+            enemy = self._factory.create_random(self._config, player_ref=player_ref, rng=self._rng)
             # Bloqueia drones se boss ainda não apareceu
             if isinstance(enemy, ChaserDrone) and not allow_drones:
                 return None
+            enemy.attach_motion(self._motion)
             return enemy
 
         return None
@@ -241,9 +252,8 @@ class FlyBoss(Entity):
         self.shoot_timer = 0
         self.shoot_interval = 2.0 
         
-        if hasattr(self, 'image'):
-            self.image = pg.transform.flip(self.image, True, False)
-            self.mask = pg.mask.from_surface(self.image)
+        # Sprite espelhada: todos os frames vêm do cache de variações
+        self.set_frame_variant(flip_variant(True, False))
         
         self.rect.center = self._position
     
@@ -345,15 +355,9 @@ class FlyBoss(Entity):
             projectile = self._shoot_at_player()
         
         self.rect.center = (int(self._position.x), int(self._position.y))
+        # A classe base já troca para o frame espelhado (set_frame_variant)
         super().update(delta_time)
         
-        # Flip da sprite
-        if hasattr(self, '_animations') and self._current_animation:
-            anim_data = self._animations[self._current_animation]
-            if anim_data["frames"]:
-                self.image = pg.transform.flip(anim_data["frames"][self._current_frame], True, False)
-                self.mask = pg.mask.from_surface(self.image)
-        
         return projectile
 
     def _shoot_at_player(self):
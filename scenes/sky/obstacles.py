@@ -1,8 +1,8 @@
 import math
 import pygame as pg
-from core import Entity, EntityFactory
+from core import Entity, EntityFactory, SceneRandom, shared_random, SCALE_STEP, quantize, scale_variant
+from core.motion_engine import LINEAR, ZIGZAG, MIDBOTTOM
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
-import random 
 
 
 class SkyObstacle(Entity):
@@ -15,9 +15,14 @@ class SkyObstacle(Entity):
         # Atualiza o rect com a posição inicial
         self.rect.center = (int(self._position.x), int(self._position.y))
 
+    def motion_params(self):
+        return {"kind": LINEAR, "position": tuple(self._position), "velocity": tuple(self._velocity)}
+
     def update(self, delta_time):
         """Atualiza o estado do obstáculo."""
         super().update(delta_time)
+        if self._motion is not None:
+            return  # movido pelo MotionEngine
 
         self._position += self._velocity * delta_time
         self.rect.center = (int(self._position.x), int(self._position.y))
@@ -36,20 +41,32 @@ class SkyObstacle(Entity):
 
 
 class ZigZagBee(SkyObstacle):
-    def __init__(self, cfg):
-        y = random.randint(50, SCREEN_HEIGHT - 100)
+    def __init__(self, cfg, rng: SceneRandom | None = None):
+        rng = rng or shared_random()
+        y = rng.spawn.randint(50, SCREEN_HEIGHT - 100)
         super().__init__(cfg["zigzag_bee_cfg"], SCREEN_WIDTH + 80, y, speed_x=-150, speed_y=0)  # +80 pixels fora
         
-        self.amplitude = random.randint(80, 120)  # Altura do zigue-zague
-        self.frequency = random.uniform(3.0, 5.0)  # Velocidade do zigue-zague
+        self.amplitude = rng.movement.randint(80, 120)  # Altura do zigue-zague
+        self.frequency = rng.movement.uniform(3.0, 5.0)  # Velocidade do zigue-zague
         self.timer = 0
         self.original_y = y
-        
+
+    def motion_params(self):
+        return {
+            "kind": ZIGZAG,
+            "position": (self._position.x, self.original_y),
+            "velocity": tuple(self._velocity),
+            "amplitude": self.amplitude,
+            "frequency": self.frequency,
+            "timer": self.timer,
+        }
+
     def update(self, delta_time):
-        self.timer += delta_time * self.frequency
-        
-        # Movimento senoidal mais suave
-        self._position.y = self.original_y + math.sin(self.timer) * self.amplitude
+        if self._motion is None:
+            self.timer += delta_time * self.frequency
+
+            # Movimento senoidal mais suave
+            self._position.y = self.original_y + math.sin(self.timer) * self.amplitude
         
         super().update(delta_time)
 
@@ -59,12 +76,17 @@ class ObstacleSpawner:
     Gerencia a criação e o timing de spawn dos obstáculos para a DemoScene.
     """
 
-    def __init__(self, obstacles_cfg: dict):
+    def __init__(self, obstacles_cfg: dict, rng: SceneRandom | None = None, motion=None):
         """
         Inicializa o gerenciador, cria a fábrica e registra os obstáculos da demo.
+        O 'rng' da cena sorteia os obstáculos e é repassado a cada um deles;
+        com um MotionEngine ('motion') os obstáculos criados passam a ser
+        movidos por ele.
         """
         self._config = obstacles_cfg
-        self._factory = EntityFactory()
+        self._rng = rng or shared_random()
+        self._motion = motion
+        self._factory = EntityFactory(self._rng.spawn)
         self._timer = 0.0
 
         # self._factory.register(FallingRock, weight=10)
@@ -89,14 +111,21 @@ class ObstacleSpawner:
 
         if self._timer >= spawn_interval:
             self._timer = 0
-            return self._factory.create_random(self._config)
+            return self.create()
 
         return None
 
+    def create(self) -> SkyObstacle:
+        """Cria um obstáculo sorteado (já no motor de movimento, se houver)."""
+        obstacle = self._factory.create_random(self._config, rng=self._rng)
+        obstacle.attach_motion(self._motion)
+        return obstacle
+
 class GroundTronco(SkyObstacle):
-    def __init__(self, cfg):
+    def __init__(self, cfg, rng: SceneRandom | None = None):
+        rng = rng or shared_random()
         # Altura aleatória mais limitada para evitar esticamento excessivo
-        tronco_height = random.randint(120, 250)  # Reduzido para ficar mais natural
+        tronco_height = rng.spawn.randint(120, 250)  # Reduzido para ficar mais natural
         
         # Posição: vem da direita
         x = SCREEN_WIDTH + 100  # Mais longe da borda
@@ -113,15 +142,26 @@ class GroundTronco(SkyObstacle):
             else:
                 final_height = tronco_height
             
+            # Quantiza a altura para reaproveitar as variações em cache
+            final_height = max(SCALE_STEP, quantize(final_height, SCALE_STEP))
+
             # Mantém a proporção
             aspect_ratio = original_size[0] / original_size[1]
             new_width = int(final_height * aspect_ratio)
             
-            self.image = pg.transform.scale(self.image, (new_width, final_height))
+            self.set_frame_variant(scale_variant((new_width, final_height)))
             self.rect = self.image.get_rect()
             self.rect.centerx = x
             self.rect.bottom = SCREEN_HEIGHT  # Base sempre no chão
-            self.mask = pg.mask.from_surface(self.image)
+
+    def motion_params(self):
+        # Base presa ao chão: o motor posiciona o rect pelo meio da base
+        return {
+            "kind": LINEAR,
+            "position": (self._position.x, SCREEN_HEIGHT),
+            "velocity": tuple(self._velocity),
+            "anchor": MIDBOTTOM,
+        }
     
     def update(self, delta_time):
         """Atualiza o tronco que se move horizontalmente"""
@@ -1,17 +1,16 @@
 import pygame as pg
-import random
-from core import Entity
+from core import Entity, SceneRandom, shared_random
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class PowerUp(Entity):
-    def __init__(self, power_type):
+    def __init__(self, power_type, rng: SceneRandom | None = None):
         cfg = {
             "fallback_size": [32, 32],
             "fallback_color": self._get_color(power_type)
         }
         
         x = SCREEN_WIDTH + 50
-        y = random.randint(100, SCREEN_HEIGHT - 200)
+        y = (rng or shared_random()).powerups.randint(100, SCREEN_HEIGHT - 200)
         super().__init__(cfg, x, y)
         
         self._position = pg.math.Vector2(x, y)
@@ -1,6 +1,6 @@
 import pygame as pg
 import math
-from core import Entity
+from core import Entity, rotate_variant
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class Projectile(Entity):
@@ -14,12 +14,10 @@ class Projectile(Entity):
         self._velocity = direction * 400  # A velocidade pode ser ajustada
         self.lifetime = 5.0
         
-        # Rotaciona sprite na direção do movimento
-        if hasattr(self, 'image'):
-            angle = pg.math.Vector2(1, 0).angle_to(direction)
-            self.image = pg.transform.rotate(self.image, -angle)
-            self.rect = self.image.get_rect(center=self.rect.center)
-            self.mask = pg.mask.from_surface(self.image)
+        # Rotaciona sprite na direção do movimento (ângulo quantizado e em cache)
+        angle = pg.math.Vector2(1, 0).angle_to(direction)
+        self.set_frame_variant(rotate_variant(-angle))
+        self.rect = self.image.get_rect(center=self.rect.center)
         
     def update(self, delta_time):
         super().update(delta_time)
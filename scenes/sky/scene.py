@@ -1,5 +1,4 @@
 import math
-import random
 import pygame as pg
 from config import SCREEN_HEIGHT, SCREEN_WIDTH
 from core import (
@@ -9,6 +8,13 @@ from core import (
     CollisionManager,
     ScrollerManager,
     BackgroundManager,
+    FontManager,
+    BatchGroup,
+    SceneRandom,
+    create_motion_engine,
+    Overlay,
+    PulseOverlay,
+    LineOverlay,
     load_json,
 )
 from .player import SkyPlayer
@@ -16,7 +22,6 @@ from .obstacles import ObstacleSpawner
 from .enemies import EnemySpawner, JacareWarning, FlyBoss
 from .collectibles import Coin
 from .powerups import PowerUp
-import random
 
 pg.joystick.init()
 
@@ -26,19 +31,37 @@ if pg.joystick.get_count() > 0:
 else:
     joystick = None
 
+# Velocidade da pulsação do escudo (fase por segundo de jogo)
+SHIELD_PULSE_SPEED = 3.0
+
 class SkyScene:
     def __init__(self, game_state: GameState):
         self.game_state = game_state
         self.config = load_json("./config/sky.json")
 
+        # Gerador aleatório da cena: mesma semente, mesma sequência de spawns
+        self.rng = SceneRandom(game_state.seed, "sky")
+
+        # Movimento vetorizado de obstáculos e inimigos (None: cada entidade se move)
+        self.motion = create_motion_engine(game_state.motion_engine)
+
         # Instanciar os gerenciadores
         self.scroll_manager = ScrollerManager(self.config["scroller_cfg"])
         self.background_manager = BackgroundManager(self.config["background_cfg"])
         self.score_manager = ScoreManager(self.config)
         self.collision_manager = CollisionManager()
 
+        # Textos da interface (só são renderizados de novo quando mudam)
+        font_manager = FontManager()
+        self.score_text = font_manager.cached_text("Arial", 32, (255, 255, 255), bold=True)
+        self.label_text = font_manager.cached_text("Arial", 18, (200, 200, 200), "DISTÂNCIA")
+        self.warning_text = font_manager.cached_text("Arial", 20, (255, 0, 0), "PERIGO!", bold=True)
+
         # Criar grupos de sprites
-        self.all_sprites_group = pg.sprite.Group()
+        self.all_sprites_group = BatchGroup()  # desenho em lote
+        # Fração entre os dois últimos passos no quadro sendo desenhado
+        # (definida pelo GameState antes de cada render)
+        self.interpolation = 1.0
         self.obstacles_group = pg.sprite.Group()
         self.enemies_group = pg.sprite.Group()
         self.player_group = pg.sprite.GroupSingle()
@@ -50,10 +73,10 @@ class SkyScene:
             self.all_sprites_group.add(self.player)
 
         # Instanciar o spawner de obstáculos
-        self.obstacle_spawner = ObstacleSpawner(self.config["obstacles_cfg"])
+        self.obstacle_spawner = ObstacleSpawner(self.config["obstacles_cfg"], self.rng, self.motion)
 
         # Instanciar o spawner de inimigos
-        self.enemy_spawner = EnemySpawner(self.config["enemies_cfg"])
+        self.enemy_spawner = EnemySpawner(self.config["enemies_cfg"], self.rng, self.motion)
 
        # Instanciar o sistema de aviso e jacaré
         self.jacare_warning = JacareWarning()
@@ -86,6 +109,47 @@ class SkyScene:
 
         self.shield_effect_timer = 0
 
+        self.__create_overlays()
+
+    def __create_overlays(self):
+        """Cria uma única vez as superfícies transparentes da interface e dos efeitos."""
+        # Painel da pontuação
+        self.ui_panel = Overlay((300, 100), lambda surface, color: surface.fill(color))
+
+        # Fundo do texto "PERIGO!"
+        text_width, text_height = self.warning_text.surface.get_size()
+        self.warning_panel = Overlay(
+            (text_width + 10, text_height + 6), lambda surface, color: surface.fill(color)
+        )
+
+        # Círculo pulsante do aviso do jacaré (raio de 20 a 25)
+        def draw_warning(surface, phase):
+            pulse = (math.sin(phase * 2 * math.pi) + 1) / 2
+            pg.draw.circle(surface, (255, 0, 0), (25, 25), int(20 + 5 * pulse))
+            pg.draw.circle(surface, (255, 255, 0), (25, 25), 15)
+
+        self.warning_pulse = PulseOverlay((50, 50), draw_warning)
+
+        # Escudo pulsante azul (raio de 35 a 45)
+        def draw_shield(surface, phase):
+            radius = int(40 + 5 * math.sin(phase * 2 * math.pi))
+            center = (45, 45)
+            pg.draw.circle(surface, (100, 150, 255, 100), center, radius, 3)
+            pg.draw.circle(surface, (150, 200, 255, 50), center, radius - 5, 2)
+
+        self.shield_pulse = PulseOverlay((90, 90), draw_shield)
+
+        # Linha de aviso do ataque do boss
+        self.telegraph_line = LineOverlay((SCREEN_WIDTH, SCREEN_HEIGHT), 3)
+
+    def perform(self, action: str):
+        """
+        Aplica uma ação do jogador (ex: "start_thrust"). As entradas passam
+        por aqui para o GameState poder gravá-las (ou ignorá-las num replay).
+        """
+        if self.game_state.accept_action(action):
+            getattr(self.player, action)()
+
     def handle_event(self, event: pg.event.Event):
         """Processa eventos do Pygame.
 
@@ -94,18 +158,18 @@ class SkyScene:
         """
         if event.type == pg.KEYDOWN:
             if event.key == pg.K_UP:
-                self.player.start_thrust()
+                self.perform("start_thrust")
             elif event.key == pg.K_DOWN:
-                self.player.start_dive()
+                self.perform("start_dive")
             elif event.key == pg.K_ESCAPE:
                 self.game_state.change_state(State.PAUSE)
 
         # --- Eventos de Tecla Solta ---
         elif event.type == pg.KEYUP:
             if event.key == pg.K_UP:
-                self.player.stop_thrust()
+                self.perform("stop_thrust")
             elif event.key == pg.K_DOWN:
-                self.player.stop_dive()
+                self.perform("stop_dive")
 
         # =========== adicionado para joystick
 
@@ -114,16 +178,16 @@ class SkyScene:
             if event.axis == 1:
                 # Para cima (valor negativo)
                 if int(event.value) == -1:
-                    self.player.start_thrust()
-                    self.player.stop_dive() # Impede movimento simultâneo
+                    self.perform("start_thrust")
+                    self.perform("stop_dive") # Impede movimento simultâneo
                 # Para baixo (valor positivo)
                 elif int(event.value) == 1:
-                    self.player.start_dive()
-                    self.player.stop_thrust() # Impede movimento simultâneo
+                    self.perform("start_dive")
+                    self.perform("stop_thrust") # Impede movimento simultâneo
                 # Analógico no centro (zona morta)
                 else:
-                    self.player.stop_thrust()
-                    self.player.stop_dive()
+                    self.perform("stop_thrust")
+                    self.perform("stop_dive")
 
         # --- Adicional: Pausar com o botão do Joystick ---
         elif joystick != None and event.type == pg.JOYBUTTONDOWN:
@@ -147,8 +211,12 @@ class SkyScene:
 
         # Atualizar entidades (jogador, obstáculos e inimigos)
         self.player.update(delta_time)
-        self.obstacles_group.update(delta_time)
+        if self.motion is None:
+            self.obstacles_group.update(delta_time)
         self.enemies_group.update(delta_time)
+        if self.motion is not None:
+            # Movimento e animação dos obstáculos (e movimento dos inimigos)
+            self.motion.step(delta_time)
 
         # No método update, após atualizar enemies_group:
         for enemy in self.enemies_group:
@@ -183,7 +251,8 @@ class SkyScene:
         # Verificar colisões (mas não com o jacaré especial)
         if not self.player.invincible and not self.player_touched_bottom:  # <- Adicione esta condição
             if self.collision_manager.check_collision(
-                self.player_group, self.obstacles_group  # Player com obstáculos
+                self.player_group, self.obstacles_group,  # Player com obstáculos
+                self.motion.near(self.player.rect) if self.motion else None,
             ) or self.collision_manager.check_collision(
                 self.player_group, self.enemies_group  # Player com inimigos
             ):
@@ -243,6 +312,10 @@ class SkyScene:
                 self._deactivate_powerup(powerup_effect)
                 self.active_powerups.remove(powerup_effect)
 
+        # Pulsação do escudo: avança com o tempo de jogo, não com os quadros
+        if any(p["type"] == "shield" for p in self.active_powerups):
+            self.shield_effect_timer += SHIELD_PULSE_SPEED * delta_time
+
     def _activate_powerup(self, power_type):
         """Ativa efeito do power-up"""
         if power_type == "shield":
@@ -288,72 +361,66 @@ class SkyScene:
 
     def _render_ui(self, screen):
         """Renderiza interface melhorada"""
-        ui_surface = pg.Surface((300, 100), pg.SRCALPHA)  # Aumentei altura
-        ui_surface.fill((0, 0, 0, 128))
-        screen.blit(ui_surface, (10, 10))
-        
-        font_big = pg.font.SysFont("Arial", 32, bold=True)
-        font_small = pg.font.SysFont("Arial", 18)
+        screen.blit(self.ui_panel.update((0, 0, 0, 128)), (10, 10))
         
-        score_text = font_big.render(f"{self.score_manager.get_score()}m", True, (255, 255, 255))
-        label_text = font_small.render("DISTÂNCIA", True, (200, 200, 200))
-        
-        screen.blit(label_text, (20, 20))
-        screen.blit(score_text, (20, 40))
+        self.score_text.set(f"{self.score_manager.get_score()}m")
+
+        screen.blit(self.label_text.surface, (20, 20))
+        screen.blit(self.score_text.surface, (20, 40))
         
     def _render_jacare_warning(self, screen):
         if self.jacare_warning.visible:
-            pulse = (math.sin(pg.time.get_ticks() * 0.01) + 1) / 2
+            phase = PulseOverlay.phase(pg.time.get_ticks() * 0.01)
             
-            # Posição ajustada - mais longe da borda
-            warning_pos = (SCREEN_WIDTH - 80, int(self.jacare_warning.y))  # Muda de x para posição fixa
+            # Posição ajustada - mais longe da borda; segue o player como desenhado
+            _, player_y = self._drawn_position(self.player, self.player.position)
+            warning_y = min(player_y, SCREEN_HEIGHT - 20)
+            warning_pos = (SCREEN_WIDTH - 80, int(warning_y))  # Muda de x para posição fixa
             
             # Círculo pulsante
-            pg.draw.circle(screen, (255, 0, 0), warning_pos, int(20 + 5 * pulse))
-            pg.draw.circle(screen, (255, 255, 0), warning_pos, 15)
+            screen.blit(self.warning_pulse.frame(phase), (warning_pos[0] - 25, warning_pos[1] - 25))
             
             # Texto centralizado acima do círculo
-            font = pg.font.SysFont("Arial", 20, bold=True)
-            warning_text = font.render("PERIGO!", True, (255, 0, 0))
+            warning_text = self.warning_text.surface
             text_rect = warning_text.get_rect()
             text_rect.centerx = warning_pos[0]
             text_rect.bottom = warning_pos[1] - 30
             
             # Fundo para o texto
-            bg_surface = pg.Surface((text_rect.width + 10, text_rect.height + 6), pg.SRCALPHA)
-            bg_surface.fill((0, 0, 0, 180))
-            screen.blit(bg_surface, (text_rect.x - 5, text_rect.y - 3))
+            screen.blit(self.warning_panel.update((0, 0, 0, 180)), (text_rect.x - 5, text_rect.y - 3))
             screen.blit(warning_text, text_rect)
     
+    def _drawn_position(self, sprite, position) -> tuple[float, float]:
+        """
+        Converte a posição do último passo para onde o sprite foi desenhado
+        neste quadro (interpolado entre os dois últimos passos).
+        """
+        x, y = self.all_sprites_group.draw_position(sprite)
+        return position.x + x - sprite.rect.x, position.y + y - sprite.rect.y
+
     def _render_shield_effect(self, screen):
         """Renderiza efeito visual do escudo"""
         has_shield = any(p["type"] == "shield" for p in self.active_powerups)
         
         if has_shield:
-            self.shield_effect_timer += 0.05
             # Escudo pulsante azul
-            radius = int(40 + 5 * math.sin(self.shield_effect_timer))
-            shield_surface = pg.Surface((radius * 2, radius * 2), pg.SRCALPHA)
-            
-            # Círculo com transparência
-            pg.draw.circle(shield_surface, (100, 150, 255, 100), (radius, radius), radius, 3)
-            pg.draw.circle(shield_surface, (150, 200, 255, 50), (radius, radius), radius - 5, 2)
+            shield_surface = self.shield_pulse.frame(PulseOverlay.phase(self.shield_effect_timer))
             
-            pos = (int(self.player.position.x - radius), int(self.player.position.y - radius))
-            screen.blit(shield_surface, pos)
+            player_x, player_y = self._drawn_position(self.player, self.player.position)
+            screen.blit(shield_surface, (int(player_x - 45), int(player_y - 45)))
 
     def _render_boss_telegraph(self, screen):
         """Renderiza aviso visual quando boss vai atacar"""
         if self.current_boss and hasattr(self.current_boss, 'is_telegraphing') and self.current_boss.is_telegraphing:
             # Linha vermelha piscante do boss até o player
             alpha = int(128 + 127 * abs(math.sin(pg.time.get_ticks() * 0.01)))
-            boss_pos = (int(self.current_boss._position.x), int(self.current_boss._position.y))
-            player_pos = (int(self.player.position.x), int(self.player.position.y))
+            boss_x, boss_y = self._drawn_position(self.current_boss, self.current_boss._position)
+            player_x, player_y = self._drawn_position(self.player, self.player.position)
+            boss_pos = (int(boss_x), int(boss_y))
+            player_pos = (int(player_x), int(player_y))
             
-            # Superfície temporária para linha com transparência
-            line_surface = pg.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pg.SRCALPHA)
-            pg.draw.line(line_surface, (255, 0, 0, alpha), boss_pos, player_pos, 3)
-            screen.blit(line_surface, (0, 0))
+            # Linha com transparência (só a caixa da linha é copiada)
+            self.telegraph_line.draw(screen, (255, 0, 0, alpha), boss_pos, player_pos)
 
     def __spawn_obstacles(self, delta_time):
         if self.boss_active:
@@ -390,8 +457,8 @@ class SkyScene:
 
     def _create_coin(self):
         """Cria uma moeda usando a classe correta"""
-        return Coin()
+        return Coin(self.rng)
 
     def _create_powerup(self):
         power_types = ["shield", "speed", "shoot"]  # Mudou magnet para shoot
-        return PowerUp(random.choice(power_types))
+        return PowerUp(self.rng.powerups.choice(power_types), self.rng)
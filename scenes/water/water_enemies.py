@@ -1,6 +1,6 @@
 import pygame as pg
-import random
-from core import Entity, EntityFactory
+from core import Entity, EntityFactory, SceneRandom, shared_random
+from core.motion_engine import STEERED
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 from .water_player import WaterPlayer
 
@@ -26,12 +26,19 @@ class WaterEnemy(Entity):
 
         self.rect.center = (int(self._position.x), int(self._position.y))
 
+    def motion_params(self):
+        return {"kind": STEERED, "position": tuple(self._position), "velocity": tuple(self._velocity)}
+
     def update(self, delta_time: float):
         """
         Aplica o movimento e remove o inimigo se ele sair muito da tela.
         A lógica de como calcular a velocidade é deixada para as subclasses.
         """
         super().update(delta_time)
+        if self._motion is not None:
+            # O MotionEngine integra a velocidade decidida pela subclasse
+            self._motion.set_velocity(self._motion_slot, self._velocity)
+            return
 
         self._position += self._velocity * delta_time
         self.rect.center = (int(self._position.x), int(self._position.y))
@@ -47,8 +54,8 @@ class Anzol(WaterEnemy):
     levemente na vertical em direção ao jogador.
     """
 
-    def __init__(self, cfg, player_ref):
-        start_y = random.randint(50, SCREEN_HEIGHT - 50)
+    def __init__(self, cfg, player_ref, rng: SceneRandom | None = None):
+        start_y = (rng or shared_random()).spawn.randint(50, SCREEN_HEIGHT - 50)
         super().__init__(
             cfg["anzol_cfg"], SCREEN_WIDTH + 50, start_y, player_ref
         )
@@ -95,8 +102,8 @@ class HomingMissile(WaterEnemy):
     mas com uma capacidade de virada vertical muito reduzida.
     """
 
-    def __init__(self, cfg, player_ref):
-        start_y = random.randint(50, SCREEN_HEIGHT - 50)
+    def __init__(self, cfg, player_ref, rng: SceneRandom | None = None):
+        start_y = (rng or shared_random()).spawn.randint(50, SCREEN_HEIGHT - 50)
         super().__init__(
             cfg["homing_missile_cfg"], SCREEN_WIDTH + 50, start_y, player_ref
         )
@@ -152,9 +159,12 @@ class WaterEnemySpawner:
     Gerencia a criação e o timing de spawn dos inimigos da DemoScene.
     """
 
-    def __init__(self, enemies_cfg: dict):
+    def __init__(self, enemies_cfg: dict, rng: SceneRandom | None = None, motion=None):
         self._config = enemies_cfg
-        self._factory = EntityFactory()
+        # Fluxos aleatórios da cena (sorteio e posição dos inimigos)
+        self._rng = rng or shared_random()
+        self._motion = motion  # MotionEngine da cena (None: movimento em Python)
+        self._factory = EntityFactory(self._rng.spawn)
         self._timer = (
             5.0  # Começa com um delay para não aparecer inimigos imediatamente
         )
@@ -174,6 +184,8 @@ class WaterEnemySpawner:
         if self._timer >= spawn_interval:
             self._timer = 0
             # Passa a configuração E a referência do jogador para o inimigo ser criado
-            return self._factory.create_random(self._config, player_ref=player_ref)
+            enemy = self._factory.create_random(self._config, player_ref=player_ref, rng=self._rng)
+            enemy.attach_motion(self._motion)
+            return enemy
 
         return None
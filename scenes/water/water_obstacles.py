@@ -1,5 +1,6 @@
 import pygame as pg
-from core import Entity, EntityFactory
+from core import Entity, EntityFactory, SceneRandom, shared_random
+from core.motion_engine import LINEAR, BOUNCE
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class WaterObstacle(Entity):
@@ -12,9 +13,14 @@ class WaterObstacle(Entity):
         # Atualiza o rect com a posição inicial
         self.rect.center = (int(self._position.x), int(self._position.y))
 
+    def motion_params(self):
+        return {"kind": LINEAR, "position": tuple(self._position), "velocity": tuple(self._velocity)}
+
     def update(self, delta_time):
         """Atualiza o estado do obstáculo."""
         super().update(delta_time)
+        if self._motion is not None:
+            return  # movido pelo MotionEngine
 
         self._position += self._velocity * delta_time
         self.rect.center = (int(self._position.x), int(self._position.y))
@@ -25,7 +31,7 @@ class WaterObstacle(Entity):
 
 
 class Lata(WaterObstacle):
-    def __init__(self, cfg):
+    def __init__(self, cfg, rng: SceneRandom | None = None):
         y = -50  # fora da tela
         super().__init__(
             cfg["lata_cfg"], SCREEN_WIDTH, y, speed_x=-100, speed_y=200
@@ -33,18 +39,28 @@ class Lata(WaterObstacle):
 
 
 class Sacola(WaterObstacle):
-    def __init__(self, cfg):
+    def __init__(self, cfg, rng: SceneRandom | None = None):
         y = SCREEN_HEIGHT // 2
         super().__init__(
             cfg["sacola_cfg"], SCREEN_WIDTH, y, speed_x=-200, speed_y=150
         )
         self.timer = 0
 
+    def motion_params(self):
+        return {
+            "kind": BOUNCE,
+            "position": tuple(self._position),
+            "velocity": tuple(self._velocity),
+            "timer": self.timer,
+            "interval": 0.5,
+        }
+
     def update(self, delta_time):
-        self.timer += delta_time
-        if self.timer >= 0.5:
-            self._velocity.y *= -1
-            self.timer = 0
+        if self._motion is None:
+            self.timer += delta_time
+            if self.timer >= 0.5:
+                self._velocity.y *= -1
+                self.timer = 0
         super().update(delta_time)
 
 
@@ -53,12 +69,17 @@ class WaterObstacleSpawner:
     Gerencia a criação e o timing de spawn dos obstáculos para a DemoScene.
     """
 
-    def __init__(self, obstacles_cfg: dict):
+    def __init__(self, obstacles_cfg: dict, rng: SceneRandom | None = None, motion=None):
         """
         Inicializa o gerenciador, cria a fábrica e registra os obstáculos da demo.
+        O 'rng' da cena sorteia os obstáculos e é repassado a cada um deles;
+        com um MotionEngine ('motion') os obstáculos criados passam a ser
+        movidos por ele.
         """
         self._config = obstacles_cfg
-        self._factory = EntityFactory()
+        self._rng = rng or shared_random()
+        self._motion = motion
+        self._factory = EntityFactory(self._rng.spawn)
         self._timer = 0.0
 
         self._factory.register(Sacola, weight=10)
@@ -82,6 +103,12 @@ class WaterObstacleSpawner:
 
         if self._timer >= spawn_interval:
             self._timer = 0
-            return self._factory.create_random(self._config)
+            return self.create()
 
         return None
+
+    def create(self) -> WaterObstacle:
+        """Cria um obstáculo sorteado (já no motor de movimento, se houver)."""
+        obstacle = self._factory.create_random(self._config, rng=self._rng)
+        obstacle.attach_motion(self._motion)
+        return obstacle
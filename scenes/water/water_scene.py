@@ -6,6 +6,10 @@ from core import (
     CollisionManager,
     ScrollerManager,
     BackgroundManager,
+    FontManager,
+    BatchGroup,
+    SceneRandom,
+    create_motion_engine,
     load_json,
 )
 from .water_player import WaterPlayer
@@ -24,6 +28,12 @@ class WaterScene:
     def __init__(self, game_state: GameState):
         self.game_state = game_state
         self.config = load_json("./config/water.json")
+
+        # Gerador aleatório da cena: mesma semente, mesma sequência de spawns
+        self.rng = SceneRandom(game_state.seed, "water")
+
+        # Movimento vetorizado de obstáculos e inimigos (None: cada entidade se move)
+        self.motion = create_motion_engine(game_state.motion_engine)
     
     # Instanciar os gerenciadores
         self.scroll_manager = ScrollerManager(self.config["scroller_cfg"])
@@ -31,8 +41,14 @@ class WaterScene:
         self.score_manager = ScoreManager(self.config)
         self.collision_manager = CollisionManager()
 
+        # Texto da pontuação (só é renderizado de novo quando muda)
+        self.score_text = FontManager().cached_text(None, 36, (255, 255, 255))
+
         # Criar grupos de sprites
-        self.all_sprites_group = pg.sprite.Group()
+        self.all_sprites_group = BatchGroup()  # desenho em lote
+        # Fração entre os dois últimos passos no quadro sendo desenhado
+        # (definida pelo GameState antes de cada render)
+        self.interpolation = 1.0
         self.obstacles_group = pg.sprite.Group()
         self.enemies_group = pg.sprite.Group()
         self.player_group = pg.sprite.GroupSingle()
@@ -44,29 +60,37 @@ class WaterScene:
             self.all_sprites_group.add(self.player)
 
         # Instanciar o spawner de obstáculos
-        self.obstacle_spawner = WaterObstacleSpawner(self.config["obstacles_cfg"])
+        self.obstacle_spawner = WaterObstacleSpawner(self.config["obstacles_cfg"], self.rng, self.motion)
 
         # Instanciar o spawner de inimigos
-        self.enemy_spawner = WaterEnemySpawner(self.config["enemies_cfg"])
+        self.enemy_spawner = WaterEnemySpawner(self.config["enemies_cfg"], self.rng, self.motion)
+
+    def perform(self, action: str):
+        """
+        Aplica uma ação do jogador (ex: "start_thrust"). As entradas passam
+        por aqui para o GameState poder gravá-las (ou ignorá-las num replay).
+        """
+        if self.game_state.accept_action(action):
+            getattr(self.player, action)()
 
     def handle_event(self, event: pg.event.Event):
 
         if event.type == pg.KEYDOWN:
             # Se a SETA PARA CIMA for pressionada
             if event.key == pg.K_UP:
-                self.player.start_thrust()
+                self.perform("start_thrust")
 
             # Se a SETA PARA BAIXO for pressionada
             elif event.key == pg.K_DOWN:
-                self.player.start_dive()
+                self.perform("start_dive")
 
             # Se a SETA PARA ESQUERDA for pressionada
             elif event.key == pg.K_LEFT:
-                self.player.start_move_left()
+                self.perform("start_move_left")
 
             # Se a SETA PARA DIREITA for pressionada
             elif event.key == pg.K_RIGHT:
-                self.player.start_move_right()
+                self.perform("start_move_right")
 
             # Se a tecla ESCAPE for pressionada
             elif event.key == pg.K_ESCAPE:
@@ -75,39 +99,39 @@ class WaterScene:
         if event.type == pg.KEYUP:
             # Se a SETA PARA CIMA for solta
             if event.key == pg.K_UP:
-                self.player.stop_thrust()
+                self.perform("stop_thrust")
 
             # Se a SETA PARA BAIXO for solta
             elif event.key == pg.K_DOWN:
-                self.player.stop_dive()
+                self.perform("stop_dive")
 
             # Se a SETA PARA ESQUERDA for solta
             elif event.key == pg.K_LEFT:
-                self.player.stop_move_left()
+                self.perform("stop_move_left")
 
             # Se a SETA PARA DIREITA for solta
             elif event.key == pg.K_RIGHT:
-                self.player.stop_move_right()
+                self.perform("stop_move_right")
 
         if joystick != None and event.type == pg.JOYAXISMOTION:
             if event.axis == 1:
                 if int(event.value) == 0:
-                    self.player.stop_dive()
-                    self.player.stop_thrust()
+                    self.perform("stop_dive")
+                    self.perform("stop_thrust")
                 elif int(event.value) == -1:
-                    self.player.start_thrust()
+                    self.perform("start_thrust")
                 elif int(event.value) == 1:
-                    self.player.start_dive()
+                    self.perform("start_dive")
             if event.axis == 0:
                 if int(event.value) == 0:
-                    self.player.stop_move_left()
-                    self.player.stop_move_right()
+                    self.perform("stop_move_left")
+                    self.perform("stop_move_right")
                 elif int(event.value) == 1:
-                    self.player.start_move_right()
-                    self.player.stop_move_left()
+                    self.perform("start_move_right")
+                    self.perform("stop_move_left")
                 elif int(event.value) == -1:
-                    self.player.start_move_left()
-                    self.player.stop_move_right()
+                    self.perform("start_move_left")
+                    self.perform("stop_move_right")
         
         if joystick != None and event.type == pg.JOYBUTTONDOWN:
             if event.button == 8:
@@ -127,13 +151,18 @@ class WaterScene:
 
         # Atualizar entidades (jogador, obstáculos e inimigos)
         self.player.update(delta_time)
-        self.obstacles_group.update(delta_time)
+        if self.motion is None:
+            self.obstacles_group.update(delta_time)
         self.enemies_group.update(delta_time)
+        if self.motion is not None:
+            # Movimento e animação dos obstáculos (e movimento dos inimigos)
+            self.motion.step(delta_time)
 
         # Verificar colisões
         if not self.player.invincible:
             if self.collision_manager.check_collision(
-                self.player_group, self.obstacles_group  # Player com obstáculos
+                self.player_group, self.obstacles_group,  # Player com obstáculos
+                self.motion.near(self.player.rect) if self.motion else None,
             ) or self.collision_manager.check_collision(
                 self.player_group, self.enemies_group  # Player com inimigos
             ):
@@ -160,10 +189,8 @@ class WaterScene:
         self.all_sprites_group.draw(screen)
 
         # Renderizar pontuação
-        font = pg.font.SysFont(None, 36)
-        score_text = font.render(
-            f"Pontuação: {self.score_manager.get_score()}", True, (255, 255, 255)
-        )
+        self.score_text.set(f"Pontuação: {self.score_manager.get_score()}")
+        score_text = self.score_text.surface
         screen.blit(score_text, (10, 10))
 
     def __spawn_obstacles(self, delta_time):
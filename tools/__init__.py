@@ -0,0 +1,4 @@
+"""
+Ferramentas de linha de comando do projeto (build de assets, benchmarks etc.).
+Devem ser executadas a partir da raiz do projeto, ex: python -m tools.bake_assets
+"""
@@ -0,0 +1,64 @@
+"""
+Mostra quanta memória as imagens em cache ocupam, por cena e por arquétipo,
+e o formato em que cada imagem ficou (opaca, colorkey ou alpha por pixel).
+
+Carrega os assets de todas as cenas e menus (como o warm-up) e imprime os
+totais de AssetCache.memory_report(). Com --budget, aplica o orçamento
+(em MB) fixando a cena indicada em --pin, para ver o que seria descartado.
+
+Uso (a partir da raiz do projeto):
+    python -m tools.asset_memory [--budget 64] [--pin forest]
+"""
+
+import argparse
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+from core import AssetCache, AssetWarmup, surface_format_report
+
+
+def _mb(value: int) -> str:
+    return f"{value / (1024 * 1024):8.2f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uso de memória dos assets em cache.")
+    parser.add_argument("--budget", type=float, default=None, help="Orçamento em MB")
+    parser.add_argument("--pin", action="append", default=[], help="Cena fixada")
+    args = parser.parse_args()
+
+    pg.init()
+    pg.mixer.init()
+    pg.display.set_mode((1080, 700))
+
+    cache = AssetCache()
+    for scene_key in args.pin:
+        cache.pin(scene_key)
+    if args.budget is not None:
+        cache.set_budget(int(args.budget * 1024 * 1024))
+
+    AssetWarmup().run()
+    report = cache.memory_report()
+
+    print("\nPor cena:")
+    for scene_key, size in sorted(report["by_scene"].items(), key=lambda item: -item[1]):
+        print(f"  {str(scene_key):<32}{_mb(size)}")
+
+    print("\nPor arquétipo:")
+    for archetype, size in sorted(report["by_archetype"].items(), key=lambda item: -item[1]):
+        print(f"  {archetype:<32}{_mb(size)}")
+
+    print("\nFormato das superfícies (opaca / colorkey / alpha):")
+    for source, stats in sorted(surface_format_report().items()):
+        print(f"  {source:<64}{stats['opaque']:>4}{stats['colorkey']:>4}{stats['alpha']:>4}")
+
+    budget = _mb(report["budget"]) if report["budget"] is not None else "sem limite"
+    print(f"\nTotal: {_mb(report['total'])} em {report['entries']} entradas (orçamento: {budget})")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compara os modos de desenho das camadas de background ("tiles" e "strip")
+em cada bioma, desenhando numa superfície do tamanho da tela virtual.
+
+Uso (a partir da raiz do projeto):
+    python -m tools.background_benchmark [--frames 300] [--width 1080 --height 700]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+from core import load_json, BackgroundManager
+
+BIOMES = ("forest", "water", "sky")
+
+
+def _bench(manager: BackgroundManager, target: pg.Surface, frames: int) -> float:
+    """Retorna o tempo médio (ms) de update + render por quadro."""
+    start = time.perf_counter()
+    for frame in range(frames):
+        manager.update(frame * 7.3)
+        manager.render(target)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do desenho do background.")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--width", type=int, default=1080)
+    parser.add_argument("--height", type=int, default=700)
+    args = parser.parse_args()
+
+    pg.init()
+    pg.display.set_mode((args.width, args.height))
+    target = pg.Surface((args.width, args.height)).convert()
+
+    print(f"{'bioma':<10}{'tiles':>10}{'strip':>10}{'ganho':>8}")
+    for biome in BIOMES:
+        background_cfg = load_json(f"config/{biome}.json")["background_cfg"]
+        times = {}
+        for mode in ("tiles", "strip"):
+            manager = BackgroundManager({**background_cfg, "render_mode": mode})
+            _bench(manager, target, 10)  # aquecimento (monta as faixas)
+            times[mode] = _bench(manager, target, args.frames)
+        print(
+            f"{biome:<10}{times['tiles']:>8.2f}ms{times['strip']:>8.2f}ms"
+            f"{times['tiles'] / times['strip']:>7.2f}x"
+        )
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
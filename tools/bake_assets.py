@@ -0,0 +1,11 @@
+"""
+Gera os atlas binários pré-escalados de todas as spritesheets do jogo.
+
+Uso (a partir da raiz do projeto):
+    python -m tools.bake_assets [--config-dir config] [--out assets/baked]
+"""
+
+from core.asset_baker import main
+
+if __name__ == "__main__":
+    main()
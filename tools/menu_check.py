@@ -0,0 +1,88 @@
+"""
+Verificação sem janela dos menus: passa por cada estado de menu fazendo
+o mesmo que o laço principal (update, render e is_idle) e confere que
+cada menu chega ao estado ocioso. Na seleção de cenas, espera o
+pré-carregamento da cena destacada terminar.
+
+Sai com código 1 se algum menu falhar ou não ficar ocioso a tempo.
+
+Uso (a partir da raiz do projeto):
+    python -m tools.menu_check [--timeout 30]
+"""
+
+import argparse
+import os
+import sys
+import time
+import traceback
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from core import State, GameState
+
+MENU_STATES = (
+    State.MAIN_MENU,
+    State.SCENE_SELECT,
+    State.HIGH_SCORES,
+    State.PAUSE,
+    State.GAME_OVER,
+)
+
+
+def check_menu(game_state: GameState, screen: pg.Surface, state: State, timeout: float) -> float:
+    """
+    Mostra o menu e roda quadros até ele ficar ocioso.
+
+    Returns:
+        float: Tempo (s) até o menu ficar ocioso.
+
+    Raises:
+        TimeoutError: Se o menu não ficar ocioso em 'timeout' segundos.
+    """
+    if state in (State.PAUSE, State.GAME_OVER):
+        # Pausa e game over só existem com uma cena carregada
+        game_state.change_state(State.PLAYING, "forest")
+    game_state.change_state(state)
+
+    start = time.perf_counter()
+    while True:
+        game_state.update()
+        game_state.render(screen)
+        if game_state.is_idle():
+            return time.perf_counter() - start
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError(f"não ficou ocioso em {timeout:.0f}s")
+        time.sleep(0.001)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verifica os menus sem janela.")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    pg.init()
+    pg.mixer.init()
+    pg.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    screen = pg.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game_state = GameState(screen)
+
+    failures = 0
+    for state in MENU_STATES:
+        try:
+            elapsed = check_menu(game_state, screen, state, args.timeout)
+            print(f"{state.name:<14} ok ({elapsed * 1000:.0f} ms até ficar ocioso)")
+        except Exception as e:
+            failures += 1
+            print(f"{state.name:<14} FALHOU: {e!r}")
+            traceback.print_exc()
+
+    pg.quit()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
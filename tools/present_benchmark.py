@@ -0,0 +1,68 @@
+"""
+Mede o custo por quadro de levar a tela virtual para a tela real em cada
+modo e resolução interna do Presenter, comparado com o caminho antigo (smoothscale alocando uma
+superfície nova + fill + blit).
+
+Uso (a partir da raiz do projeto):
+    python -m tools.present_benchmark [--size 1920x1080] [--frames 60]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from core import Presenter, SCALE_MODES, INTERNAL_RESOLUTIONS
+
+VIRTUAL_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+
+def _bench(draw, frames: int) -> float:
+    """Tempo médio (ms) por quadro."""
+    draw()
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da apresentação.")
+    parser.add_argument("--size", default="1920x1080", help="Resolução da tela real")
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+    real_size = tuple(int(value) for value in args.size.lower().split("x"))
+
+    pg.init()
+    screen = pg.display.set_mode(real_size)
+
+    # Caminho antigo
+    game_surface = pg.Surface(VIRTUAL_SIZE)
+    ratio = min(real_size[0] / VIRTUAL_SIZE[0], real_size[1] / VIRTUAL_SIZE[1])
+    scaled_size = (int(VIRTUAL_SIZE[0] * ratio), int(VIRTUAL_SIZE[1] * ratio))
+    offset = ((real_size[0] - scaled_size[0]) // 2, (real_size[1] - scaled_size[1]) // 2)
+
+    def old_present():
+        scaled_surface = pg.transform.smoothscale(game_surface, scaled_size)
+        screen.fill((0, 0, 0))
+        screen.blit(scaled_surface, offset)
+
+    results = [("antigo", _bench(old_present, args.frames))]
+    for mode in SCALE_MODES:
+        presenter = Presenter(screen, VIRTUAL_SIZE, mode=mode)
+        results.append((mode, _bench(presenter.present, args.frames)))
+    for resolution in INTERNAL_RESOLUTIONS[1:]:
+        presenter = Presenter(screen, VIRTUAL_SIZE, internal_resolution=resolution)
+        results.append((f"smooth/{resolution}", _bench(presenter.present, args.frames)))
+
+    print(f"\n{'modo':<16}{'ms/quadro':>11}")
+    for mode, elapsed in results:
+        print(f"{mode:<16}{elapsed:>11.2f}")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
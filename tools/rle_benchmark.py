@@ -0,0 +1,80 @@
+"""
+Compara, para cada spritesheet de animação das configs, o tempo de blit
+dos frames sem e com RLE, junto com a transparência média dos frames e o
+que a flag "rle" do JSON escolhe hoje.
+
+Uso (a partir da raiz do projeto):
+    python -m tools.rle_benchmark [--blits 200]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+from core import AssetCache, transparency_ratio
+from core.asset_baker import find_config_spritesheets
+from core.asset_loader import EntityAnimationLoader
+from core.surface_format import is_rle
+
+
+def _load_frames(image_path: str, json_path: str, rle) -> list:
+    """Carrega os frames forçando a flag "rle" (sem tocar no manifesto)."""
+    loader = EntityAnimationLoader(image_path, json_path)
+    loader.data = {**loader.data, "rle": rle}
+    animations = loader.load()
+    return [frame for anim in animations.values() for frame in anim["frames"]]
+
+
+def _bench(frames: list, target: pg.Surface, blits: int) -> float:
+    """Tempo médio (µs) de um blit de frame."""
+    for frame in frames:
+        target.blit(frame, (0, 0))  # o SDL codifica o RLE no primeiro blit
+    start = time.perf_counter()
+    for i in range(blits):
+        target.blit(frames[i % len(frames)], (i % 700, i % 500))
+    return (time.perf_counter() - start) / blits * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de blit com RLE.")
+    parser.add_argument("--blits", type=int, default=200)
+    args = parser.parse_args()
+
+    pg.init()
+    pg.display.set_mode((1080, 700))
+    target = pg.Surface((1080, 700)).convert()
+    cache = AssetCache()
+
+    print(f"{'spritesheet':<44}{'transp.':>8}{'normal':>10}{'rle':>10}{'ganho':>8}  json")
+    for image_path, json_path in find_config_spritesheets():
+        try:
+            plain = _load_frames(image_path, json_path, False)
+            rle = _load_frames(image_path, json_path, True)
+        except Exception as e:
+            print(f"{os.path.basename(json_path):<44}ignorado ({e})")
+            continue
+        if not plain:
+            continue  # background (camadas), não animação
+
+        ratio = sum(transparency_ratio(frame) for frame in plain) / len(plain)
+        plain_time = _bench(plain, target, args.blits)
+        rle_time = _bench(rle, target, args.blits)
+
+        # O que a flag do JSON produz hoje
+        chosen = cache.get_animations(image_path, json_path)
+        chosen_frames = [frame for anim in chosen.values() for frame in anim["frames"]]
+        marked = sum(is_rle(frame) for frame in chosen_frames)
+
+        name = os.path.relpath(json_path, os.path.join("assets", "images"))
+        print(
+            f"{name:<44}{ratio:>7.0%}{plain_time:>8.1f}µs{rle_time:>8.1f}µs"
+            f"{plain_time / rle_time:>7.1f}x  {marked}/{len(chosen_frames)} RLE"
+        )
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""
+Roda uma cena sem janela e sem limite de quadros: passos fixos de
+simulação o mais rápido possível, com desenho opcional numa superfície
+fora da tela. As ações vêm de um replay (--replay) ou de uma política
+simples (--policy). No fim mostra passos por segundo, quantidade de
+entidades e pontuação de cada partida.
+
+Sem menus: um game over encerra a partida (nada é gravado nos recordes)
+e a cena recomeça com a semente seguinte até completar --seconds de jogo.
+
+--motion numpy move obstáculos e inimigos com o MotionEngine. --stress N
+mantém N obstáculos em cena (o game over é ignorado) para medir o custo
+por quadro com milhares de entidades.
+
+Uso (a partir da raiz do projeto):
+    python -m tools.simulate --scene sky [--seconds 3600] [--seed 42]
+        [--policy idle|random|hover] [--render] [--once] [--profile]
+        [--record partida.rec.gz] [--motion python|numpy]
+    python -m tools.simulate --replay partida.rec.gz [--render]
+    python -m tools.simulate --scene sky --stress 3000 --motion numpy --render --seconds 20
+"""
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import math
+import pygame as pg
+from config import FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+from core import State, GameState, InputRecorder, InputReplay, MOTION_ENGINES
+from core.input_record import numbered_path
+
+SCENES = ("forest", "water", "sky")
+POLICIES = ("idle", "random", "hover")
+
+# Tempo (s) que um obstáculo leva para cruzar a tela: ritmo de reposição no --stress
+STRESS_CROSSING_TIME = 8.0
+
+
+class HeadlessState:
+    """
+    Faz o papel do GameState para uma cena rodando sozinha: fornece a
+    semente e o motor de movimento, recebe as ações e registra o game
+    over (sem abrir menus).
+    """
+
+    def __init__(self, seed: int | None, tick_rate: float, motion_engine: str = "python"):
+        self.seed = seed
+        self.motion_engine = motion_engine
+        self.tick_time = 1.0 / tick_rate
+        self.scene_tick = 0
+        self.recorder = None
+        self.game_over = False
+
+    def change_state(self, new_state, scene_key=""):
+        if new_state == State.GAME_OVER:
+            self.game_over = True
+
+    def accept_action(self, action: str) -> bool:
+        if self.recorder is not None:
+            self.recorder.record(self.scene_tick, action)
+        return True
+
+    def load_scene(self, scene_key: str):
+        # Mesmo carregamento de cenas do GameState
+        return GameState.load_scene(self, scene_key)
+
+
+class IdlePolicy:
+    """Não faz nada: o jogador só cai (partidas curtas)."""
+
+    def actions(self, scene, tick: int) -> list:
+        return []
+
+
+class RandomPolicy:
+    """Aperta e solta os controles em momentos aleatórios (semente própria)."""
+
+    PRESS = ("start_thrust", "start_dive")
+
+    def __init__(self, seed, rate: float = 0.05):
+        self._rng = random.Random(f"{seed}:policy")
+        self._rate = rate
+        self._held = None
+
+    def actions(self, scene, tick: int) -> list:
+        if self._rng.random() >= self._rate:
+            return []
+        if self._held is not None:
+            action, self._held = self._held.replace("start_", "stop_"), None
+            return [action]
+        self._held = self._rng.choice(self.PRESS)
+        return [self._held]
+
+
+class HoverPolicy:
+    """
+    Mantém o jogador perto de uma altura alvo (liga o impulso abaixo dela
+    e desliga acima): partidas longas, bom para testes de resistência.
+    """
+
+    def __init__(self, target_y: float = SCREEN_HEIGHT * 0.45, band: float = 30):
+        self._target = target_y
+        self._band = band
+        self._thrusting = False
+
+    def actions(self, scene, tick: int) -> list:
+        y = scene.player.position.y
+        if not self._thrusting and y > self._target + self._band:
+            self._thrusting = True
+            return ["start_thrust"]
+        if self._thrusting and y < self._target - self._band:
+            self._thrusting = False
+            return ["stop_thrust"]
+        return []
+
+
+class ReplayPolicy:
+    """Ações de uma gravação, no passo em que aconteceram."""
+
+    def __init__(self, replay: InputReplay):
+        self.replay = replay
+
+    def actions(self, scene, tick: int) -> list:
+        return self.replay.actions_at(tick)
+
+
+def _make_policy(name: str, seed):
+    if name == "random":
+        return RandomPolicy(seed)
+    if name == "hover":
+        return HoverPolicy()
+    return IdlePolicy()
+
+
+def _sprite_groups(scene) -> dict:
+    """Grupos de sprites da cena (atributos terminados em '_group')."""
+    return {
+        name[:-6]: group
+        for name, group in vars(scene).items()
+        if name.endswith("_group") and isinstance(group, pg.sprite.AbstractGroup)
+    }
+
+
+def _stress_fill(scene, count: int, per_tick: int):
+    """Repõe obstáculos (até 'per_tick' por passo) até a cena ter 'count'."""
+    for _ in range(min(per_tick, count - len(scene.obstacles_group))):
+        obstacle = scene.obstacle_spawner.create()
+        scene.obstacles_group.add(obstacle)
+        scene.all_sprites_group.add(obstacle)
+
+
+def run_scene(
+    scene_key,
+    seed,
+    tick_rate,
+    max_ticks,
+    policy,
+    target=None,
+    recorder=None,
+    motion="python",
+    stress=0,
+) -> dict:
+    """
+    Roda uma partida até o game over ou até 'max_ticks' passos.
+    Com 'stress' > 0 mantém esse número de obstáculos e ignora o game over.
+
+    Returns:
+        dict: Passos, tempos (s), pontuação e pico/média de entidades por grupo.
+    """
+    state = HeadlessState(seed, tick_rate, motion)
+    state.recorder = recorder
+    scene = state.load_scene(scene_key)
+    groups = _sprite_groups(scene)
+    peak = dict.fromkeys(groups, 0)
+    total = dict.fromkeys(groups, 0)
+    update_time = render_time = 0.0
+    frame_times = []  # update + render de cada passo (s)
+    dt = state.tick_time
+    stress_rate = math.ceil(stress / (STRESS_CROSSING_TIME * tick_rate)) if stress else 0
+
+    while state.scene_tick < max_ticks and (stress or not state.game_over):
+        for action in policy.actions(scene, state.scene_tick):
+            scene.perform(action)
+        if stress:
+            _stress_fill(scene, stress, stress_rate)
+
+        state.scene_tick += 1
+        start = time.perf_counter()
+        scene.update(dt)
+        elapsed = time.perf_counter() - start
+        update_time += elapsed
+
+        if target is not None:
+            start = time.perf_counter()
+            scene.render(target)
+            render = time.perf_counter() - start
+            render_time += render
+            elapsed += render
+        frame_times.append(elapsed)
+
+        for name, group in groups.items():
+            count = len(group)
+            total[name] += count
+            if count > peak[name]:
+                peak[name] = count
+
+    ticks = state.scene_tick
+    return {
+        "seed": scene.rng.seed,
+        "ticks": ticks,
+        "update_s": update_time,
+        "render_s": render_time,
+        "score": scene.score_manager.get_score(),
+        "game_over": state.game_over,
+        "frame_times": frame_times,
+        "peak": peak,
+        "mean": {name: total[name] / max(ticks, 1) for name in groups},
+    }
+
+
+def _print_run(index: int, result: dict, tick_rate: float):
+    end = "game over" if result["game_over"] else "tempo esgotado"
+    print(
+        f"partida {index:>3}: semente {result['seed']:>10}  "
+        f"{result['ticks'] / tick_rate:>8.1f}s de jogo  "
+        f"pontuação {result['score']:>6}  ({end})"
+    )
+
+
+def _print_summary(results: list, tick_rate: float, wall: float, rendering: bool):
+    ticks = sum(result["ticks"] for result in results)
+    update_s = sum(result["update_s"] for result in results)
+    render_s = sum(result["render_s"] for result in results)
+
+    print()
+    print(f"partidas:        {len(results)}")
+    # Passos por segundo só com o tempo dos passos (sem carregar as cenas)
+    busy = max(update_s + render_s, 1e-9)
+    print(f"passos:          {ticks} ({ticks / tick_rate:.1f}s de jogo em {wall:.2f}s, com carregamento)")
+    print(f"passos/s:        {ticks / busy:.0f} ({ticks / tick_rate / busy:.1f}x o tempo real)")
+    print(f"update:          {update_s / max(ticks, 1) * 1_000_000:.0f}µs por passo")
+    if rendering:
+        print(f"render:          {render_s / max(ticks, 1) * 1_000_000:.0f}µs por passo")
+
+    # Custo de um quadro (um passo por quadro a 60 FPS), com o desenho se --render
+    frames = sorted(t for result in results for t in result["frame_times"])
+    if frames:
+        p50 = frames[len(frames) // 2] * 1000
+        p95 = frames[min(len(frames) - 1, int(len(frames) * 0.95))] * 1000
+        print(f"quadro:          p50 {p50:.2f}ms  p95 {p95:.2f}ms  máx {frames[-1] * 1000:.2f}ms")
+
+    print(f"{'grupo':<16}{'pico':>8}{'média':>10}")
+    for name in results[0]["peak"]:
+        peak = max(result["peak"][name] for result in results)
+        mean = sum(result["mean"][name] * result["ticks"] for result in results) / max(ticks, 1)
+        print(f"{name:<16}{peak:>8}{mean:>10.1f}")
+
+    scores = [result["score"] for result in results]
+    print(f"pontuação:       mín {min(scores)}  máx {max(scores)}  média {sum(scores) / len(scores):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulação de cena sem janela e sem limite de quadros.")
+    parser.add_argument("--scene", choices=SCENES, default="sky")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="Gravação feita com --record")
+    parser.add_argument("--policy", choices=POLICIES, default="hover")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--seconds", type=float, default=60.0, help="Tempo de jogo a simular")
+    parser.add_argument("--tick-rate", type=float, default=FPS)
+    parser.add_argument("--render", action="store_true", help="Desenha cada passo fora da tela")
+    parser.add_argument("--once", action="store_true", help="Não recomeça após o game over")
+    parser.add_argument("--record", metavar="ARQUIVO", help="Grava as ações de cada partida")
+    parser.add_argument("--profile", action="store_true", help="Mostra as funções mais caras (cProfile)")
+    parser.add_argument("--motion", choices=MOTION_ENGINES, default="python", help="Motor de movimento")
+    parser.add_argument("--stress", type=int, default=0, metavar="N", help="Mantém N obstáculos em cena")
+    args = parser.parse_args()
+    if args.stress and args.scene == "forest":
+        parser.error("--stress precisa de uma cena com obstáculos (sky ou water)")
+
+    pg.init()
+    pg.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    target = pg.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert() if args.render else None
+
+    if args.replay:
+        replay = InputReplay.load(args.replay)
+        scene_key, seed, tick_rate = replay.scene, replay.seed, replay.tick_rate
+        max_ticks = replay.ticks if replay.ticks is not None else int(args.seconds * tick_rate)
+    else:
+        replay = None
+        scene_key, tick_rate = args.scene, args.tick_rate
+        seed = args.seed if args.seed is not None else random.randrange(2**32)
+        max_ticks = int(args.seconds * tick_rate)
+
+    if args.profile:
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    results = []
+    remaining = max_ticks
+    start = time.perf_counter()
+    while remaining > 0:
+        index = len(results) + 1
+        policy = ReplayPolicy(replay) if replay else _make_policy(args.policy, seed + index - 1)
+        recorder = None
+        if args.record:
+            recorder = InputRecorder(scene_key, seed + index - 1, tick_rate)
+
+        result = run_scene(
+            scene_key,
+            seed + index - 1,
+            tick_rate,
+            remaining,
+            policy,
+            target,
+            recorder,
+            motion=args.motion,
+            stress=args.stress,
+        )
+        results.append(result)
+        _print_run(index, result, tick_rate)
+        if recorder is not None:
+            recorder.save(numbered_path(args.record, index), result["ticks"], result["score"])
+
+        remaining -= result["ticks"]
+        if replay or args.once or result["ticks"] == 0:
+            break
+    wall = time.perf_counter() - start
+
+    if args.profile:
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+    _print_summary(results, tick_rate, wall, target is not None)
+    if replay is not None and replay.score is not None:
+        match = "igual" if results[0]["score"] == replay.score else "DIFERENTE"
+        print(f"replay:          pontuação gravada {replay.score} ({match})")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
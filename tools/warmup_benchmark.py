@@ -0,0 +1,53 @@
+"""
+Compara o warm-up de assets em série e em paralelo.
+
+Uso (a partir da raiz do projeto):
+    python -m tools.warmup_benchmark [--workers N] [--repeat 3]
+"""
+
+import argparse
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+from core import AssetCache, AssetWarmup
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do warm-up de assets.")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pg.init()
+    pg.mixer.init()
+    pg.display.set_mode((1080, 700))
+
+    results = {"serial": [], "paralelo": []}
+    for _ in range(args.repeat):
+        for mode, parallel in (("serial", False), ("paralelo", True)):
+            AssetCache().clear()
+            warmup = AssetWarmup(workers=args.workers)
+            results[mode].append(warmup.run(parallel=parallel))
+
+    print()
+    print(f"{'modo':<10}{'itens':>7}{'threads':>9}{'coleta':>9}{'decod.':>9}{'final.':>9}{'total':>9}")
+    for mode, runs in results.items():
+        # Melhor execução de cada modo (ms)
+        best = min(runs, key=lambda timings: timings["total"])
+        print(
+            f"{mode:<10}{best['items']:>7}{best['workers']:>9}"
+            f"{best['collect']:>9.1f}{best['decode']:>9.1f}"
+            f"{best['finalize']:>9.1f}{best['total']:>9.1f}"
+        )
+
+    serial = min(timings["total"] for timings in results["serial"])
+    parallel = min(timings["total"] for timings in results["paralelo"])
+    print(f"\nGanho do paralelo: {serial / parallel:.2f}x")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()